@@ -0,0 +1,208 @@
+"""
+Lastmessung für den Serverstatus-Poll: viele simulierte Launcher pollen
+gleichzeitig einen lokalen Fake-FiveM-Server (fake_fivem_server.py) mit
+genau dem Code des Launchers (launcher.poll_servers).
+
+    python bench_pollers.py --pollers 50 --interval 1 --duration 20
+    python bench_pollers.py --mode full --players 200 --latency-ms 40 --error-rate 0.05
+    python bench_pollers.py --target 127.0.0.1:30120      # externer Fake-Server
+    python bench_pollers.py --pollers 0 --duration 0 --probe 20 --latency-ms 30 --error-rate 0.1
+
+Jeder simulierte Launcher pollt wie der echte über einen eigenen
+launcher.JobScheduler (Timer "poll_timer", Job "status_poll"); statt Tk
+treibt ein Thread mit after()-Warteschlange die Pumpe (HeadlessRoot).
+Gemessen werden Requests/s und Bytes (serverseitig), die Latenz aus Sicht
+der UI (submit bis on_done im Pumpen-Thread, inkl. Warteschlange und Pumpe),
+die reine Dauer von poll_servers (je p50/p95/p99) sowie Fehler.
+Alle simulierten Launcher laufen in diesem Prozess und teilen sich daher
+den HTTP-Pool (launcher.HTTP).
+
+Mit --probe N läuft danach zusätzlich der Netzwerk-Test des Launchers
+(launcher.LatencyProbe, N Messungen) gegen denselben Server.
+"""
+import argparse
+import heapq
+import itertools
+import random
+import sys
+import threading
+import time
+
+import launcher
+from fake_fivem_server import FakeFiveMServer
+
+
+class HeadlessRoot:
+    """Ersatz für das Tk-Fenster: after() reiht ein, ein Thread arbeitet fällige Aufrufe ab."""
+
+    def __init__(self):
+        self._timers = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def after(self, delay_ms: int, func, *args):
+        with self._cond:
+            heapq.heappush(self._timers, (time.monotonic() + delay_ms / 1000.0, next(self._seq), func, args))
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._stopped and (not self._timers or self._timers[0][0] > time.monotonic()):
+                    self._cond.wait(self._timers[0][0] - time.monotonic() if self._timers else None)
+                if self._stopped:
+                    return
+                _, _, func, args = heapq.heappop(self._timers)
+            func(*args)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+
+def start_poller(endpoint: str, args, results: list, lock: threading.Lock):
+    """Ein simulierter Launcher: Poll-Timer und Status-Job wie in LRToolbox.start_status_poll."""
+    root = HeadlessRoot()
+    jobs = launcher.JobScheduler(root, workers=args.workers)
+    servers = [{"name": "Fake", "endpoint": endpoint, "main": True, "want_players": args.want_players}]
+    skipped = [0]
+
+    def poll():
+        started = time.perf_counter()
+        result = launcher.poll_servers(servers, args.concurrency, args.timeout, args.mode)
+        return result, time.perf_counter() - started
+
+    def start_poll():
+        if jobs.is_active("status_poll"):
+            skipped[0] += 1
+            return
+        submitted = time.perf_counter()
+
+        def done(outcome, error):
+            latency = time.perf_counter() - submitted
+            if error:
+                record = (latency, None, False, str(error), 0)
+            else:
+                result, elapsed = outcome
+                status = result["servers"][0]
+                record = (latency, elapsed, status["online"], status["error"], result["bytes"])
+            with lock:
+                results.append(record)
+
+        jobs.submit("status_poll", poll, done, priority=launcher.PRIO_NORMAL)
+
+    # Versatz, damit nicht alle Launcher im selben Moment pollen
+    jobs.every("poll_timer", int(args.interval * 1000), start_poll, ui=True,
+               initial_delay_ms=int(random.uniform(0, args.interval) * 1000))
+    return root, jobs, skipped
+
+
+def summarize(results, server_stats, duration: float, args, skipped: int = 0) -> str:
+    latencies = sorted(r[0] for r in results)
+    durations = sorted(r[1] for r in results if r[1] is not None)
+    errors = {}
+    for _, _, online, error, _ in results:
+        if not online:
+            errors[error or "?"] = errors.get(error or "?", 0) + 1
+    body_bytes = sum(r[4] for r in results)
+    lines = [
+        f"Pollers: {args.pollers}, Intervall {args.interval} s, Dauer {duration:.1f} s, Modus {args.mode}",
+        f"Polls: {len(results)} ({len(results) / duration:.1f}/s), fehlgeschlagen: {sum(errors.values())}, "
+        f"ausgelassen (voriger Poll lief noch): {skipped}",
+    ]
+    if server_stats:
+        lines.append(
+            f"Server: {server_stats['total_requests']} Requests ({server_stats['total_requests'] / duration:.1f}/s), "
+            f"{launcher.format_bytes(server_stats['bytes_sent'])} gesendet "
+            f"({launcher.format_bytes(server_stats['bytes_sent'] / duration)}/s), "
+            f"je Pfad {server_stats['requests']}"
+        )
+    lines.append(f"Client: {launcher.format_bytes(body_bytes)} JSON empfangen (entpackt)")
+    for label, values in (("UI-Latenz (submit bis on_done)", latencies), ("Poll-Dauer (poll_servers)", durations)):
+        if values:
+            lines.append(
+                f"{label}: "
+                f"p50 {launcher.percentile(values, 50) * 1000:.1f} ms, "
+                f"p95 {launcher.percentile(values, 95) * 1000:.1f} ms, "
+                f"p99 {launcher.percentile(values, 99) * 1000:.1f} ms, "
+                f"max {values[-1] * 1000:.1f} ms"
+            )
+    for error, count in sorted(errors.items(), key=lambda kv: -kv[1]):
+        lines.append(f"  Fehler '{error}': {count}x")
+    lines.append("HTTP-Client: " + launcher.format_http_stats(launcher.HTTP.stats()))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lasttest für launcher.poll_servers")
+    parser.add_argument("--pollers", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=1.0, help="Sekunden zwischen zwei Polls je Launcher")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--mode", choices=["lean", "full"], default="lean")
+    parser.add_argument("--want-players", action="store_true", help="Spielerliste offen (players.json)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=3, help="Worker-Threads je JobScheduler (wie worker_threads)")
+    parser.add_argument("--target", help="host:port eines laufenden Fake-Servers statt eines eigenen")
+    parser.add_argument("--players", type=int, default=48)
+    parser.add_argument("--player-payload", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--probe", type=int, default=0, metavar="N",
+                        help="danach den Netzwerk-Test mit N Messungen ausführen")
+    parser.add_argument("--output", help="Ergebnis zusätzlich in diese Datei schreiben")
+    args = parser.parse_args()
+
+    server = None
+    if args.target:
+        endpoint = args.target
+    else:
+        server = FakeFiveMServer(
+            players=args.players, player_payload=args.player_payload, latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms, error_rate=args.error_rate, timeout_rate=args.timeout_rate,
+            timeout_s=args.timeout * 2,
+        )
+        endpoint = f"127.0.0.1:{server.start()}"
+
+    # Jeder simulierte Launcher soll seine Keep-Alive-Verbindung behalten können
+    launcher.HTTP.max_idle_per_host = max(launcher.HTTP.max_idle_per_host, args.pollers * 2)
+
+    results, lock = [], threading.Lock()
+    started = time.perf_counter()
+    pollers = [start_poller(endpoint, args, results, lock) for _ in range(args.pollers)]
+    time.sleep(args.duration)
+    for _, jobs, _ in pollers:
+        jobs.cancel_timer("poll_timer")
+    duration = time.perf_counter() - started
+    # Laufende Polls noch ausliefern lassen
+    deadline = time.monotonic() + args.timeout * 2 + 1
+    while time.monotonic() < deadline and any(jobs.is_active("status_poll") for _, jobs, _ in pollers):
+        time.sleep(0.05)
+    time.sleep(0.1)
+    for root, jobs, _ in pollers:
+        jobs.shutdown()
+        root.stop()
+
+    skipped = sum(s[0] for _, _, s in pollers)
+    report = summarize(results, server.stats() if server else None, duration, args, skipped)
+    if args.probe > 0:
+        host, port = launcher.split_endpoint(endpoint)
+        probe = launcher.LatencyProbe(host, port, samples=args.probe, interval=0.05, timeout=args.timeout)
+        report += "\n\n" + launcher.format_latency_report(probe.run())
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    if server is not None:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Lokaler Ersatz für einen FiveM-Server (nur die Status-Endpunkte), damit der
+Serverstatus-Poll ohne den Produktivserver getestet werden kann.
+
+Liefert /info.json, /players.json und /dynamic.json mit einstellbarer
+Spielerzahl, Nutzlast pro Spieler, Latenz, Fehlerquote und Timeouts.
+
+    python fake_fivem_server.py --port 30120 --players 64 --latency-ms 80
+    python fake_fivem_server.py --error-rate 0.1 --timeout-rate 0.05
+
+Im Launcher dann in user_settings.json z. B.
+"servers": [{"name": "Fake", "endpoint": "127.0.0.1:30120", "main": true}] eintragen.
+Nur Standardbibliothek, auch als Modul nutzbar (FakeFiveMServer, siehe
+bench_pollers.py).
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeFiveMServer:
+    """Konfiguration, Antworten und Zähler des Fake-Servers."""
+
+    def __init__(self, players: int = 48, max_players: int = 128, player_payload: int = 0,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 timeout_rate: float = 0.0, timeout_s: float = 30.0, no_dynamic: bool = False,
+                 compress: bool = True, seed=None):
+        self.players = players
+        self.max_players = max_players
+        self.player_payload = player_payload
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_s = timeout_s
+        self.no_dynamic = no_dynamic
+        self.compress = compress
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.bytes_sent = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.httpd = None
+
+    # --- Antworten ---
+    def player_list(self) -> list:
+        pad = "x" * self.player_payload
+        return [
+            {
+                "endpoint": "127.0.0.1",
+                "id": i + 1,
+                "identifiers": [f"license:{i:040x}", f"discord:{100000 + i}"] + ([f"pad:{pad}"] if pad else []),
+                "name": f"Spieler {i + 1}",
+                "ping": 20 + i % 80,
+            }
+            for i in range(self.players)
+        ]
+
+    def documents(self) -> dict:
+        return {
+            "/info.json": {
+                "enhancedHostSupport": True,
+                "resources": [f"resource_{i}" for i in range(120)],
+                "server": "FXServer-fake SERVER v1.0.0.0 win32",
+                "vars": {"sv_maxClients": str(self.max_players), "sv_projectName": "Fake LaRue"},
+                "version": 1,
+            },
+            "/players.json": self.player_list(),
+            "/dynamic.json": {
+                "clients": self.players,
+                "gametype": "Roleplay",
+                "hostname": "Fake LaRue",
+                "iv": "0",
+                "mapname": "Los Santos",
+                "sv_maxclients": str(self.max_players),
+            },
+        }
+
+    def count(self, path: str, sent: int):
+        with self.lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+            self.bytes_sent += sent
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "requests": dict(self.requests),
+                "total_requests": sum(self.requests.values()),
+                "bytes_sent": self.bytes_sent,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+            }
+
+    # --- Server ---
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Im Hintergrund-Thread starten; gibt den tatsächlichen Port zurück."""
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, name="fake-fivem", daemon=True).start()
+        return self.httpd.server_address[1]
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+
+def _make_handler(server: FakeFiveMServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # Keep-Alive wie beim echten FXServer
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            delay = server.latency_ms + server.random.uniform(0, server.jitter_ms)
+            if delay:
+                time.sleep(delay / 1000.0)
+
+            roll = server.random.random()
+            if roll < server.timeout_rate:
+                with server.lock:
+                    server.timeouts += 1
+                # Verbindung offen halten, ohne zu antworten
+                time.sleep(server.timeout_s)
+                self.close_connection = True
+                return
+            if roll < server.timeout_rate + server.error_rate:
+                with server.lock:
+                    server.errors += 1
+                self._send(500, b'{"error":"fake"}', path)
+                return
+
+            documents = server.documents()
+            if path not in documents or (path == "/dynamic.json" and server.no_dynamic):
+                self._send(404, b"Not Found", path)
+                return
+            self._send(200, json.dumps(documents[path]).encode("utf-8"), path)
+
+        def _send(self, status: int, body: bytes, path: str):
+            headers = [f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}",
+                       "Content-Type: application/json"]
+            if server.compress and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                body = gzip.compress(body, compresslevel=5)
+                headers.append("Content-Encoding: gzip")
+            headers.append(f"Content-Length: {len(body)}")
+            head = ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1")
+            # Header + Body in einem write, sonst bremst Nagle/Delayed-ACK jede Antwort
+            self.wfile.write(head + body)
+            server.count(path, len(head) + len(body))
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake-FiveM-Server für Status-Tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=30120)
+    parser.add_argument("--players", type=int, default=48)
+    parser.add_argument("--max-players", type=int, default=128)
+    parser.add_argument("--player-payload", type=int, default=0,
+                        help="zusätzliche Bytes pro Spieler in players.json")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Anteil HTTP 500 (0..1)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Anteil ohne Antwort (0..1)")
+    parser.add_argument("--no-dynamic", action="store_true", help="dynamic.json mit 404 beantworten")
+    parser.add_argument("--no-gzip", action="store_true")
+    args = parser.parse_args()
+
+    server = FakeFiveMServer(
+        players=args.players, max_players=args.max_players, player_payload=args.player_payload,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate, no_dynamic=args.no_dynamic, compress=not args.no_gzip,
+    )
+    port = server.start(args.host, args.port)
+    print(f"Fake-FiveM-Server läuft auf http://{args.host}:{port} (Strg+C beendet)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Gemeinsamer HTTP-Client für alle Netzwerkzugriffe der LR Toolbox.
+
+Bewusst nur Standardbibliothek (http.client):
+- Keep-Alive: pro Host (Schema, Host, Port) werden freie Verbindungen
+  zurückgelegt und wiederverwendet; abgelaufene Verbindungen werden erkannt
+  und einmalig mit einer frischen Verbindung wiederholt.
+- gzip: Accept-Encoding wird gesendet, die Antwort begrenzt entpackt.
+- DNS-Cache mit TTL: verbunden wird mit der gecachten IP, Host-Header und
+  TLS-SNI/Zertifikatsprüfung laufen weiter über den Hostnamen.
+- Pro Endpoint (z. B. 'status', 'update') eigenes Timeout, eigene Anzahl
+  Wiederholungen mit Backoff + Jitter und eigene Statistik.
+"""
+import http.client
+import random
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+import zlib
+
+RETRY_STATUS = {502, 503, 504}
+
+
+class ResponseTooLarge(ValueError):
+    pass
+
+
+class HTTPStatusError(OSError):
+    """Antwort mit Status >= 400."""
+
+    def __init__(self, url: str, status: int, reason: str = ""):
+        super().__init__(f"HTTP {status} {reason} ({url})".replace("  ", " "))
+        self.url = url
+        self.status = status
+
+
+class DnsCache:
+    """host -> IP-Adressen mit Ablaufzeit; fehlgeschlagene Adressen werden verworfen."""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> list:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry and entry[0] > now:
+                return entry[1]
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: str, port: int):
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+class _CachedDnsMixin:
+    """Verbindet mit der Adresse aus dem DNS-Cache statt erneut aufzulösen."""
+
+    dns = None
+
+    def _open_socket(self):
+        last_error = None
+        for address in self.dns.resolve(self.host, self.port):
+            try:
+                return socket.create_connection((address, self.port), self.timeout)
+            except OSError as e:
+                last_error = e
+        self.dns.invalidate(self.host, self.port)
+        raise last_error or OSError(f"Keine Adresse für {self.host}")
+
+
+class _HTTPConnection(_CachedDnsMixin, http.client.HTTPConnection):
+    def connect(self):
+        self.sock = self._open_socket()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class _HTTPSConnection(_CachedDnsMixin, http.client.HTTPSConnection):
+    def connect(self):
+        sock = self._open_socket()
+        # SNI und Zertifikat gegen den Hostnamen, nicht gegen die IP
+        self.sock = self._context.wrap_socket(sock, server_hostname=self.host)
+
+
+class EndpointStats:
+    __slots__ = ("requests", "errors", "retries", "bytes_wire", "bytes_body",
+                 "connects", "reused", "total_time")
+
+    def __init__(self):
+        self.requests = self.errors = self.retries = 0
+        self.bytes_wire = self.bytes_body = 0
+        self.connects = self.reused = 0
+        self.total_time = 0.0
+
+    def as_dict(self) -> dict:
+        result = {name: getattr(self, name) for name in self.__slots__}
+        result["avg_ms"] = self.total_time / self.requests * 1000 if self.requests else 0.0
+        return result
+
+
+class HttpClient:
+    """Thread-sicherer GET-Client mit Verbindungspool (siehe Moduldoku)."""
+
+    DEFAULT_POLICY = {"timeout": 5.0, "retries": 1, "backoff": 0.3}
+
+    def __init__(self, dns_ttl: float = 300.0, max_idle_per_host: int = 4,
+                 idle_timeout: float = 60.0, user_agent: str = "LR-Toolbox"):
+        self.dns = DnsCache(dns_ttl)
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self.user_agent = user_agent
+        self.policies = {}
+        self._stats = {}
+        self._idle = {}     # (scheme, host, port) -> [(Verbindung, zuletzt benutzt)]
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    # --- Konfiguration & Statistik ---
+    def configure(self, endpoint: str, **policy):
+        self.policies[endpoint] = {**self.DEFAULT_POLICY, **self.policies.get(endpoint, {}), **policy}
+
+    def policy(self, endpoint: str) -> dict:
+        return self.policies.get(endpoint, self.DEFAULT_POLICY)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {name: s.as_dict() for name, s in self._stats.items()}
+
+    def _stat(self, endpoint: str) -> EndpointStats:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            stats = self._stats[endpoint] = EndpointStats()
+        return stats
+
+    # --- Pool ---
+    def _checkout(self, key, timeout: float):
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used < self.idle_timeout:
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        scheme, host, port = key
+        if scheme == "https":
+            conn = _HTTPSConnection(host, port, timeout=timeout, context=self._ssl_context)
+        else:
+            conn = _HTTPConnection(host, port, timeout=timeout)
+        conn.dns = self.dns
+        return conn, False
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn, _ in idle:
+                conn.close()
+
+    # --- Requests ---
+    def get(self, url: str, endpoint: str = "default", timeout=None, max_bytes=None) -> bytes:
+        """
+        GET und Body zurückgeben (entpackt). max_bytes begrenzt den entpackten
+        Body; größere Antworten werfen ResponseTooLarge. Status >= 400 wirft
+        HTTPStatusError (502/503/504 werden wie Verbindungsfehler wiederholt).
+        """
+        policy = self.policy(endpoint)
+        timeout = policy["timeout"] if timeout is None else timeout
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        started = time.perf_counter()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    body = self._request_once(key, target, url, endpoint, timeout, max_bytes)
+                    return body
+                except (OSError, http.client.HTTPException) as e:
+                    status = getattr(e, "status", None)
+                    if isinstance(e, HTTPStatusError) and status not in RETRY_STATUS:
+                        raise
+                    if attempt >= policy["retries"]:
+                        raise
+                    attempt += 1
+                    with self._lock:
+                        self._stat(endpoint).retries += 1
+                    # Exponentieller Backoff mit vollem Jitter
+                    time.sleep(random.uniform(0, policy["backoff"] * (2 ** (attempt - 1))))
+        except Exception:
+            with self._lock:
+                self._stat(endpoint).errors += 1
+            raise
+        finally:
+            with self._lock:
+                stats = self._stat(endpoint)
+                stats.requests += 1
+                stats.total_time += time.perf_counter() - started
+
+    def _request_once(self, key, target, url, endpoint, timeout, max_bytes) -> bytes:
+        headers = {
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+            "User-Agent": self.user_agent,
+        }
+        for fresh in (False, True):
+            conn, reused = self._checkout_fresh(key, timeout) if fresh else self._checkout(key, timeout)
+            try:
+                conn.request("GET", target, headers=headers)
+                resp = conn.getresponse()
+            except (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine):
+                conn.close()
+                if reused:
+                    # Server hat die Keep-Alive-Verbindung inzwischen geschlossen
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            with self._lock:
+                stats = self._stat(endpoint)
+                if reused:
+                    stats.reused += 1
+                else:
+                    stats.connects += 1
+            return self._read_response(key, conn, resp, url, endpoint, max_bytes)
+        raise http.client.RemoteDisconnected("Verbindung geschlossen")
+
+    def _checkout_fresh(self, key, timeout):
+        with self._lock:
+            # Alle anderen Leerlauf-Verbindungen dieses Hosts sind vermutlich ebenfalls tot
+            for conn, _ in self._idle.pop(key, []):
+                conn.close()
+        return self._checkout(key, timeout)
+
+    def _read_response(self, key, conn, resp, url, endpoint, max_bytes) -> bytes:
+        try:
+            gzipped = (resp.getheader("Content-Encoding") or "").lower() == "gzip"
+            if resp.status >= 400:
+                resp.read()
+                self._release(key, conn, resp)
+                raise HTTPStatusError(url, resp.status, resp.reason)
+            limit = None if max_bytes is None else max_bytes + 1
+            if gzipped:
+                # Schon die komprimierten Bytes begrenzen, nicht erst das Entpackte
+                raw = resp.read() if limit is None else resp.read(limit)
+                if max_bytes is not None and len(raw) > max_bytes:
+                    conn.close()
+                    raise ResponseTooLarge(f"Antwort von {url} größer als {max_bytes} Bytes (komprimiert)")
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                body = inflater.decompress(raw, limit or 0)
+                wire = len(raw)
+            else:
+                body = resp.read() if limit is None else resp.read(limit)
+                wire = len(body)
+            with self._lock:
+                stats = self._stat(endpoint)
+                stats.bytes_wire += wire
+                stats.bytes_body += len(body)
+            if max_bytes is not None and len(body) > max_bytes:
+                conn.close()
+                raise ResponseTooLarge(f"Antwort von {url} größer als {max_bytes} Bytes")
+        except HTTPStatusError:
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        self._release(key, conn, resp)
+        return body
+
+    def _release(self, key, conn, resp):
+        if resp.will_close or not resp.isclosed():
+            # Nicht vollständig gelesen oder Server schließt → nicht zurücklegen
+            conn.close()
+        else:
+            self._checkin(key, conn)
@@ -0,0 +1,159 @@
+"""
+Single-Instance-Sperre für die LR Toolbox.
+
+Bewusst nur Standardbibliothek: ein zweiter Start muss seinen Befehl an die
+laufende Instanz weiterreichen und sich beenden, bevor Tk, pygame oder PIL
+geladen werden.
+
+- data/launcher.lock wird exklusiv gesperrt (msvcrt/fcntl); das Betriebssystem
+  gibt die Sperre auch nach einem Absturz frei.
+- data/launcher.instance.json enthält Port und Token des lokalen Sockets
+  (127.0.0.1), über den Befehle wie 'focus', 'quick_clean' oder 'connect'
+  an die laufende Instanz gehen.
+"""
+import json
+import os
+import queue
+import secrets
+import socket
+import threading
+import time
+from pathlib import Path
+
+LOCK_FILE_NAME = "launcher.lock"
+INFO_FILE_NAME = "launcher.instance.json"
+
+# Kommandozeile -> Befehl an die (laufende) Instanz
+ARG_COMMANDS = {
+    "--clean": "quick_clean",
+    "--full-clean": "full_clean",
+    "--connect": "connect",
+}
+COMMANDS = {"focus", "quick_clean", "full_clean", "connect"}
+
+
+def command_from_args(argv) -> str:
+    for arg in argv:
+        if arg in ARG_COMMANDS:
+            return ARG_COMMANDS[arg]
+    return "focus"
+
+
+def _try_lock(fh) -> bool:
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+class InstanceLock:
+    """Hält die Sperre der laufenden Instanz und nimmt weitergereichte Befehle an."""
+
+    def __init__(self, data_dir: Path, lock_handle):
+        self.data_dir = data_dir
+        self.info_file = data_dir / INFO_FILE_NAME
+        self._lock_handle = lock_handle
+        self.token = secrets.token_hex(16)
+        self.commands = queue.Queue()
+        self._server = None
+
+    def start_server(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(4)
+        self._server = server
+        info = {"pid": os.getpid(), "port": server.getsockname()[1], "token": self.token}
+        tmp = self.info_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(info), encoding="utf-8")
+        os.replace(tmp, self.info_file)
+        threading.Thread(target=self._serve, name="lr-instance", daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            with conn:
+                try:
+                    conn.settimeout(1.0)
+                    raw = conn.recv(4096).decode("utf-8", errors="ignore")
+                    msg = json.loads(raw.strip() or "{}")
+                    if msg.get("token") != self.token or msg.get("command") not in COMMANDS:
+                        conn.sendall(b"denied\n")
+                        continue
+                    self.commands.put(msg["command"])
+                    conn.sendall(b"ok\n")
+                except (OSError, ValueError):
+                    pass
+
+    def poll_commands(self):
+        """Alle seit dem letzten Aufruf eingegangenen Befehle."""
+        result = []
+        while True:
+            try:
+                result.append(self.commands.get_nowait())
+            except queue.Empty:
+                return result
+
+    def release(self):
+        if self._server is not None:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+        try:
+            self.info_file.unlink(missing_ok=True)
+        except OSError:
+            pass
+        try:
+            self._lock_handle.close()
+        except OSError:
+            pass
+
+
+def forward_command(data_dir: Path, command: str, timeout: float = 0.5) -> bool:
+    """Befehl an die laufende Instanz schicken; True, wenn sie ihn bestätigt hat."""
+    try:
+        info = json.loads((data_dir / INFO_FILE_NAME).read_text(encoding="utf-8"))
+        with socket.create_connection(("127.0.0.1", int(info["port"])), timeout=timeout) as sock:
+            sock.settimeout(timeout)
+            sock.sendall((json.dumps({"token": info["token"], "command": command}) + "\n").encode("utf-8"))
+            return sock.recv(16).startswith(b"ok")
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def acquire_or_forward(data_dir: Path, argv, wait: float = 2.0):
+    """
+    Erste Instanz: gibt ein InstanceLock mit laufendem Befehls-Socket zurück.
+    Weitere Instanz: reicht den Befehl aus argv weiter und gibt None zurück.
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    handle = open(data_dir / LOCK_FILE_NAME, "a+b")
+    if _try_lock(handle):
+        lock = InstanceLock(data_dir, handle)
+        try:
+            lock.start_server()
+        except OSError as e:
+            # Ohne Socket läuft der Launcher trotzdem, nur ohne Weiterleitung
+            print("[WARN] Single-Instance-Socket nicht verfügbar:", e)
+        return lock
+    handle.close()
+
+    # Die laufende Instanz startet evtl. gerade erst ihren Socket → kurz erneut versuchen
+    command = command_from_args(argv)
+    deadline = time.monotonic() + wait
+    while True:
+        if forward_command(data_dir, command):
+            return None
+        if time.monotonic() >= deadline:
+            print("[WARN] LR Toolbox läuft bereits, reagiert aber nicht auf Befehle.")
+            return None
+        time.sleep(0.1)
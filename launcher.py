@@ -1,15 +1,54 @@
+import sys
+from pathlib import Path
+
+import instance_lock
+import http_client
+
+# Läuft die Toolbox schon, wird der Befehl (Fokus, Clean, Connect) an sie
+# weitergereicht und sofort beendet – noch bevor Tk, pygame und PIL laden.
+INSTANCE_LOCK = None
+if __name__ == "__main__" and "--write-asset-manifest" not in sys.argv:
+    INSTANCE_LOCK = instance_lock.acquire_or_forward(Path(__file__).parent / "data", sys.argv[1:])
+    if INSTANCE_LOCK is None:
+        sys.exit(0)
+
+import asyncio
+import bisect
+import collections
+import cProfile
+import ctypes
+import functools
+import gc
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import mmap
 import os
+import pstats
+import queue
+import re
 import shutil
+import socket
+import statistics
+import struct
 import subprocess
-from pathlib import Path
+import threading
+import time
+import traceback
+import tracemalloc
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 
 import pygame  # Musik
-from PIL import Image, ImageTk  # Wallpaper-Thumbnails
-import urllib.request
-import urllib.error
+from PIL import Image, ImageOps, ImageTk  # Wallpaper-Thumbnails
+import pool_jobs  # Arbeitsfunktionen für den Prozess-Pool (ohne Tk/pygame)
+from pool_jobs import file_digest, file_sha256, render_wallpaper_variant
 import webbrowser
 import zipfile
 from datetime import datetime
@@ -26,12 +65,35 @@ ASSETS_DIR = BASE_DIR / "assets"
 MUSIC_DIR = ASSETS_DIR / "music"
 WALLPAPER_DIR = ASSETS_DIR / "wallpapers"
 LOGS_DIR = BASE_DIR / "logs"
+DATA_DIR = BASE_DIR / "data"  # Laufzeitdaten des Launchers (Verlauf, Caches, Indizes)
 
 USER_SETTINGS_FILE = CONFIG_DIR / "user_settings.json"
 ANNOUNCEMENTS_FILE = CONFIG_DIR / "announcements.json"
+STATUS_HISTORY_FILE = DATA_DIR / "status_history.bin"
+ASSET_MANIFEST_FILE = ASSETS_DIR / "manifest.json"
+ASSET_STATE_FILE = DATA_DIR / "asset_state.json"
+WALLPAPER_CACHE_DIR = DATA_DIR / "wallpaper_cache"
+THUMB_CACHE_DIR = DATA_DIR / "thumb_cache"
+UI_SNAPSHOT_FILE = DATA_DIR / "ui_snapshot.json"
+CRASH_INDEX_FILE = DATA_DIR / "crash_index.json"
+CRASH_SAMPLES_DIR = DATA_DIR / "crash_samples"
+FIVEM_LOG_STATE_FILE = DATA_DIR / "fivem_log_state.json"
+FIVEM_LOG_INTERVAL_MS = 5000
+LAUNCH_HISTORY_FILE = DATA_DIR / "launch_history.json"
+CLEAN_STATE_FILE = DATA_DIR / "clean_state.json"
+CLEAN_JOB_KEYS = ("clean_quick", "clean_full", "clean_servers", "cache_verify")
+CACHE_MANIFEST_FILE = DATA_DIR / "cache_manifest.json"
+WALLPAPER_HASH_FILE = DATA_DIR / "wallpaper_hashes.json"
+WALLPAPER_THUMB_SIZE = (180, 120)
+WALLPAPER_WATCH_INTERVAL_MS = 3000
+UI_PROFILES_DIR = ASSETS_DIR / "ui_profiles"  # eigene Profile: ui_profiles/<name>/frontend.xml
+UI_STORE_DIR = DATA_DIR / "ui_store"
 FRONTEND_ASSET = ASSETS_DIR / "frontend.xml"
 SERVICES_CHECK_BAT = ASSETS_DIR / "windows_service_check.bat"
 
+# LaRue-Server (Connect, Serverstatus, Zuordnung im Server-Cache)
+LARUE_ENDPOINT = "45.152.160.250:30120"
+
 # Fonts – überall Times New Roman Italic
 FONT_TITLE = ("Times New Roman", 20, "italic")
 FONT_H1 = ("Times New Roman", 14, "italic")
@@ -41,18 +103,45 @@ FONT_BUTTON = ("Times New Roman", 12, "italic")
 
 DEFAULT_SETTINGS = {
     "auto_clean_on_start": False,
+    # Auto-Clean beim Start nur, wenn mindestens eine Schwelle überschritten ist
+    "auto_clean_thresholds": {
+        "cache_mb": 4096,
+        "crash_dumps": 20,
+        "days_since_clean": 14,
+        "min_free_disk_pct": 10.0,
+    },
+    # Gedrosselter Clean (Auto-Clean immer, manuell per Option): Budget pro Sekunde
+    "clean_throttled": False,
+    "clean_budget": {"ops_per_sec": 200, "mb_per_sec": 20},
     "auto_start_after_clean": False,
     "music": {"enabled": True, "volume": 0.2},  # 20 %
     "wqhd_minimap_enabled": False,
     "theme": "bw_neon",
     "fivem_path": None,
-    "last_update_notified": ""
+    "last_update_notified": "",
+    "server_cache_max_age_days": 14,
+    # Der Eintrag mit "main": true ist der Hauptserver (Header, Connect, Netzwerk-Test, Server-Cache)
+    "servers": [
+        {"name": "LaRue", "endpoint": LARUE_ENDPOINT, "main": True},
+    ],
+    "status_concurrency": 4,
+    "status_timeout": 3.0,
+    "status_history_capacity": 2880,  # 24 h bei 30 s Poll-Intervall
+    "status_mode": "lean",  # "lean" = dynamic.json, "full" = info.json + players.json
+    "ui_profile": "original",
+    "wallpaper_resolutions": [],  # zusätzlich zur Bildschirmauflösung, z. B. ["2560x1440"]
+    # Import: größer wird herunterskaliert; Bilder mit dHash-Abstand <= max_hash_distance gelten als doppelt
+    "wallpaper_import": {"max_resolution": "3840x2160", "quality": 88, "max_hash_distance": 6},
+    "worker_threads": 3,
+    "thumbnail_cache_mb": 24,  # Budget für Wallpaper-Vorschaubilder im RAM
+    "memory_tracing": False,   # tracemalloc schon beim Start aktivieren
+    "low_resource_while_gaming": True,  # Musik/Rotation/Polls pausieren, solange FiveM läuft
 }
 
 
 def ensure_dirs():
     """legt alle Standard-Ordner an"""
-    for d in [CONFIG_DIR, ASSETS_DIR, MUSIC_DIR, WALLPAPER_DIR, LOGS_DIR]:
+    for d in [CONFIG_DIR, ASSETS_DIR, MUSIC_DIR, WALLPAPER_DIR, LOGS_DIR, DATA_DIR]:
         d.mkdir(parents=True, exist_ok=True)
 
 
@@ -79,6 +168,16 @@ def log_action(msg: str):
         pass
 
 
+def format_bytes(num) -> str:
+    """Bytes lesbar formatieren (KB/MB/GB)."""
+    num = float(num or 0)
+    for unit in ("B", "KB", "MB", "GB"):
+        if num < 1024 or unit == "GB":
+            return f"{num:.0f} {unit}" if unit == "B" else f"{num:.1f} {unit}"
+        num /= 1024
+    return f"{num:.1f} GB"
+
+
 def get_disk_usage(path: Path):
     try:
         total, used, free = shutil.disk_usage(str(path))
@@ -88,8 +187,2631 @@ def get_disk_usage(path: Path):
         return None, None, None, None
 
 
+# ---------- Auto-Clean-Regeln ----------
+def measure_clean_candidates(candidates) -> dict:
+    """
+    Größe, Dateianzahl und älteste mtime der Clean-Kandidaten (nur stat,
+    nichts wird gelöscht).
+    """
+    result = {"bytes": 0, "files": 0, "crash_dumps": 0, "oldest": None, "dirs": {}}
+    for path in candidates:
+        size = 0
+        if path.exists():
+            for root, _dirs, files in os.walk(path):
+                raise_if_cancelled()
+                for name in files:
+                    try:
+                        st = os.stat(os.path.join(root, name), follow_symlinks=False)
+                    except OSError:
+                        continue
+                    size += st.st_size
+                    if result["oldest"] is None or st.st_mtime < result["oldest"]:
+                        result["oldest"] = st.st_mtime
+                    result["files"] += 1
+                    if path.name == "crashes" and name.lower().endswith(".dmp"):
+                        result["crash_dumps"] += 1
+        result["dirs"][path.name if path.parent.name != "cache" else f"cache/{path.name}"] = size
+        result["bytes"] += size
+    return result
+
+
+def decide_auto_clean(measure: dict, thresholds: dict, last_clean_at, free_pct, now=None):
+    """
+    Entscheidet anhand der Schwellen, ob sich ein Clean lohnt.
+    Gibt (clean?, Gründe) zurück; eine Schwelle von 0/None ist deaktiviert.
+    Ohne bekannten letzten Clean (Neuinstallation) zählt für days_since_clean
+    die älteste Datei der Kandidaten.
+    """
+    now = now or time.time()
+    reasons = []
+    cache_mb = thresholds.get("cache_mb")
+    if cache_mb and measure["bytes"] >= cache_mb * 1024 * 1024:
+        reasons.append(f"Cache {format_bytes(measure['bytes'])} ≥ {cache_mb} MB")
+    dumps = thresholds.get("crash_dumps")
+    if dumps and measure["crash_dumps"] >= dumps:
+        reasons.append(f"{measure['crash_dumps']} Crashdumps ≥ {dumps}")
+    days = thresholds.get("days_since_clean")
+    if days and last_clean_at and (now - last_clean_at) / 86400 >= days:
+        reasons.append(f"letzter Clean vor {(now - last_clean_at) / 86400:.0f} Tagen ≥ {days}")
+    elif days and not last_clean_at and measure.get("oldest") and (now - measure["oldest"]) / 86400 >= days:
+        reasons.append(f"noch nie bereinigt, ältester Eintrag {(now - measure['oldest']) / 86400:.0f} Tage alt ≥ {days}")
+    min_free = thresholds.get("min_free_disk_pct")
+    if min_free and free_pct is not None and free_pct < min_free:
+        reasons.append(f"freier Speicher {free_pct:.1f} % < {min_free} %")
+    return bool(reasons), reasons
+
+
+# ---------- Gedrosseltes Löschen ----------
+THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+THREAD_MODE_BACKGROUND_END = 0x00020000
+
+
+@contextmanager
+def background_io_priority():
+    """
+    Senkt CPU- und I/O-Priorität des aktuellen Threads (Windows, Background-Mode).
+    Die Worker-Threads werden wiederverwendet, daher wird immer zurückgesetzt.
+    Auf anderen Systemen ohne Wirkung.
+    """
+    lowered = False
+    if os.name == "nt":
+        try:
+            kernel32 = ctypes.windll.kernel32
+            lowered = bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN))
+        except (OSError, AttributeError):
+            lowered = False
+    try:
+        yield lowered
+    finally:
+        if lowered:
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_END)
+
+
+class DeleteThrottle:
+    """
+    Budget für Löschvorgänge (Operationen und Bytes pro Sekunde, Token-Bucket)
+    plus automatische Zurückhaltung bei ausgelasteter Platte: steigt der
+    gleitende Mittelwert (EWMA) der unlink-Latenz deutlich über den Grundwert,
+    wird zusätzlich pausiert.
+    """
+
+    ALPHA = 0.2
+    BUSY_FACTOR = 3.0
+    MAX_BACKOFF = 0.5
+    MAX_SLICE = 0.25    # lange Pausen (große Datei) in Scheiben, dazwischen Abbruch prüfen
+
+    def __init__(self, ops_per_sec: float = 200, bytes_per_sec: float = 20 * 1024 * 1024,
+                 sleep=time.sleep, clock=time.monotonic):
+        self.ops_per_sec = ops_per_sec
+        self.bytes_per_sec = bytes_per_sec
+        self._sleep = sleep
+        self._clock = clock
+        self._ops = self._bytes = 0.0
+        self._last = clock()
+        self.ewma = None
+        self.baseline = None
+        self.backoff = 0.0
+        self.slept = 0.0
+
+    def wait(self, size: int):
+        """Vor dem Löschen einer Datei mit size Bytes aufrufen."""
+        now = self._clock()
+        elapsed, self._last = now - self._last, now
+        # Guthaben auffüllen (max. 1 s Vorrat)
+        if self.ops_per_sec:
+            self._ops = min(self.ops_per_sec, self._ops + elapsed * self.ops_per_sec) - 1
+        if self.bytes_per_sec:
+            self._bytes = min(self.bytes_per_sec, self._bytes + elapsed * self.bytes_per_sec) - size
+        delay = self.backoff
+        if self.ops_per_sec and self._ops < 0:
+            delay = max(delay, -self._ops / self.ops_per_sec)
+        if self.bytes_per_sec and self._bytes < 0:
+            delay = max(delay, -self._bytes / self.bytes_per_sec)
+        while delay > 0:
+            raise_if_cancelled()
+            step = min(delay, self.MAX_SLICE)
+            self.slept += step
+            self._sleep(step)
+            delay -= step
+
+    def record(self, latency: float):
+        """Gemessene unlink-Dauer einfließen lassen."""
+        self.ewma = latency if self.ewma is None else self.ALPHA * latency + (1 - self.ALPHA) * self.ewma
+        # Grundwert = langsam nachgeführtes Minimum der "ruhigen" Platte
+        if self.baseline is None or self.ewma < self.baseline:
+            self.baseline = self.ewma
+        else:
+            self.baseline += (self.ewma - self.baseline) * 0.01
+        if self.ewma > self.baseline * self.BUSY_FACTOR and self.ewma > 0.002:
+            self.backoff = min(self.MAX_BACKOFF, max(0.01, self.backoff * 2))
+        else:
+            self.backoff = self.backoff / 2 if self.backoff > 0.001 else 0.0
+
+
+# ---------- Server-Cache (gezielte Bereinigung) ----------
+def endpoint_tokens(endpoint: str):
+    """
+    Schreibweisen eines Endpoints (ip:port), wie sie in Cache-Namen auftauchen,
+    z. B. 45.152.160.250:30120, 45.152.160.250_30120, 45_152_160_250_30120.
+    """
+    endpoint = (endpoint or "").strip().lower()
+    if endpoint.startswith("connect "):
+        endpoint = endpoint[len("connect "):].strip()
+    if not endpoint:
+        return []
+    host, _, port = endpoint.partition(":")
+    tokens = {endpoint}
+    if port:
+        for sep in ("_", "-", "."):
+            tokens.add(f"{host}{sep}{port}")
+            tokens.add(f"{host.replace('.', sep)}{sep}{port}")
+    return sorted(tokens, key=len, reverse=True)
+
+
+def endpoint_pattern(tokens):
+    """
+    Regex, die nur ganze Tokens trifft: direkt davor keine Ziffer und kein
+    Punkt, direkt danach keine Ziffer (sonst passt 45.x auch auf 145.x).
+    """
+    if not tokens:
+        return None
+    alternatives = "|".join(re.escape(t) for t in tokens)
+    return re.compile(rf"(?<![0-9.])(?:{alternatives})(?![0-9])")
+
+
+def _entry_stats(entry: Path):
+    """(Bytes, neueste mtime) einer Datei oder eines Ordners."""
+    try:
+        if entry.is_file() or entry.is_symlink():
+            st = entry.lstat()
+            return st.st_size, st.st_mtime
+        size, newest = 0, entry.stat().st_mtime
+        for f in entry.rglob("*"):
+            try:
+                if f.is_file():
+                    st = f.stat()
+                    size += st.st_size
+                    newest = max(newest, st.st_mtime)
+            except OSError:
+                pass
+        return size, newest
+    except OSError:
+        return 0, 0.0
+
+
+def _cache_entry_matches(entry: Path, pattern, peek_bytes: int = 64 * 1024) -> bool:
+    """
+    Gehört ein Eintrag in data/cache/servers zum Server?
+    Erst über den Namen, bei kleinen Dateien zusätzlich über den Dateianfang
+    (FiveM legt dort u. a. JSON-Metadaten mit dem Endpoint ab).
+    """
+    if pattern.search(entry.name.lower()):
+        return True
+    files = [entry] if entry.is_file() else [p for p in entry.glob("*.json") if p.is_file()][:8]
+    for f in files:
+        try:
+            if f.stat().st_size > peek_bytes:
+                continue
+            with f.open("rb") as fh:
+                head = fh.read(peek_bytes).decode("utf-8", errors="ignore").lower()
+            if pattern.search(head):
+                return True
+        except OSError:
+            pass
+    return False
+
+
+def _remove_entry(entry: Path) -> bool:
+    """Datei/Ordner löschen (so weit möglich); True, wenn der Eintrag danach weg ist."""
+    try:
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return not os.path.lexists(entry)
+
+
+def evict_server_cache(servers_dir: Path, keep_endpoint: str, max_age_days=None, now=None) -> dict:
+    """
+    Räumt data/cache/servers gezielt auf:
+    - Einträge des eigenen Servers (keep_endpoint) bleiben erhalten,
+    - Einträge fremder Server werden gelöscht,
+    - alles, was älter als max_age_days ist, wird ebenfalls gelöscht.
+    Liefert eine Bilanz mit freigegebenen und behaltenen Bytes; removed und
+    kept zählen beide Einträge direkt in servers_dir.
+    """
+    result = {
+        "removed": 0,
+        "bytes_reclaimed": 0,
+        "kept": 0,
+        "bytes_kept": 0,
+        "kept_entries": [],
+    }
+    if not servers_dir.exists():
+        return result
+
+    pattern = endpoint_pattern(endpoint_tokens(keep_endpoint))
+    now = now if now is not None else datetime.now().timestamp()
+    max_age = float(max_age_days) * 86400 if max_age_days else None
+
+    for entry in sorted(servers_dir.iterdir()):
+        raise_if_cancelled()
+        size, newest = _entry_stats(entry)
+        too_old = max_age is not None and newest and now - newest > max_age
+        if pattern and _cache_entry_matches(entry, pattern) and not too_old:
+            result["kept"] += 1
+            result["bytes_kept"] += size
+            result["kept_entries"].append(entry.name)
+            continue
+        if _remove_entry(entry):
+            result["removed"] += 1
+            result["bytes_reclaimed"] += size
+    return result
+
+
+def atomic_copy(src: Path, dst: Path):
+    """Kopie über eine Temp-Datei + os.replace, damit nie eine halbe Datei liegen bleibt."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.name + ".lrtmp")
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+# ---------- FiveM-Cache prüfen ----------
+def verify_cache_dirs(cache_dirs, manifest: dict, max_workers=None) -> dict:
+    """
+    Alle Dateien der Cache-Ordner parallel (Prozess-Pool) prüfen: leere und
+    abgeschnittene Dateien, Hash aus dem Dateinamen, sonst gespeichertes
+    Manifest (data/cache_manifest.json). Ergebnis:
+    {'checked': n, 'bytes': n, 'broken': [(rel, Grund)], 'manifest': {...}}
+    """
+    jobs = []
+    for base in cache_dirs:
+        if not base.exists():
+            continue
+        for path in base.rglob("*"):
+            if path.is_file() and not path.is_symlink():
+                rel = f"{base.name}/{path.relative_to(base).as_posix()}"
+                jobs.append((str(path), rel, manifest.get(rel)))
+
+    result = {"checked": 0, "bytes": 0, "broken": [], "manifest": {}}
+    if not jobs:
+        return result
+    workers = max_workers or max(1, min(len(jobs), (os.cpu_count() or 2) - 1))
+    pool = pool_jobs.process_pool(workers)
+    try:
+        for rel, size, mtime, digest, error in pool.map(pool_jobs.verify_cache_file_job, jobs, chunksize=16):
+            raise_if_cancelled()
+            result["checked"] += 1
+            result["bytes"] += size or 0
+            if error:
+                result["broken"].append((rel, error))
+            elif digest is not None:
+                result["manifest"][rel] = {"size": size, "mtime": mtime, "sha256": digest}
+    finally:
+        # Bei Abbruch nicht auf die restlichen (schon eingereihten) Dateien warten
+        pool.shutdown(wait=True, cancel_futures=True)
+    return result
+
+
+# ---------- Asset-Manifest & Integritätsprüfung ----------
+# Ordner, deren Inhalt der Nutzer selbst pflegt (siehe README) – nicht im Manifest
+USER_ASSET_DIRS = ("wallpapers/", "music/")
+
+
+def is_user_asset(rel: str) -> bool:
+    return rel.startswith(USER_ASSET_DIRS)
+
+
+def iter_asset_files(assets_dir: Path):
+    """Alle ausgelieferten Asset-Dateien relativ zu assets/ (ohne Manifest und Nutzer-Ordner)."""
+    for path in sorted(assets_dir.rglob("*")):
+        if path.is_file() and path != assets_dir / ASSET_MANIFEST_FILE.name:
+            rel = path.relative_to(assets_dir).as_posix()
+            if not is_user_asset(rel):
+                yield rel, path
+
+
+def build_asset_manifest(assets_dir: Path) -> dict:
+    files = {}
+    for rel, path in iter_asset_files(assets_dir):
+        files[rel] = {"size": path.stat().st_size, "sha256": file_sha256(path)}
+    return {"version": 1, "files": files}
+
+
+def verify_assets(assets_dir: Path, manifest: dict, state: dict) -> dict:
+    """
+    Prüft die Assets gegen das Manifest.
+    Schneller Weg: stimmen Größe und mtime mit dem letzten geprüften Stand
+    (state) überein, wird nicht neu gehasht. Falsche Größe ist ohne Hash
+    ein Fehler; nur geänderte Dateien werden per mmap neu gehasht.
+    state wird dabei aktualisiert.
+    """
+    report = {"ok": [], "missing": [], "corrupt": [], "unlisted": [], "rehashed": 0}
+    # Ältere Manifeste listen noch Wallpaper/Musik – die darf der Nutzer ändern
+    expected = {rel: meta for rel, meta in manifest.get("files", {}).items() if not is_user_asset(rel)}
+
+    for rel, meta in sorted(expected.items()):
+        path = assets_dir / rel
+        try:
+            st = path.stat()
+        except OSError:
+            report["missing"].append(rel)
+            state.pop(rel, None)
+            continue
+
+        if st.st_size != meta.get("size"):
+            report["corrupt"].append((rel, f"Größe {st.st_size} statt {meta.get('size')} Bytes"))
+            state.pop(rel, None)
+            continue
+
+        cached = state.get(rel)
+        if cached and cached.get("size") == st.st_size and cached.get("mtime_ns") == st.st_mtime_ns:
+            digest = cached.get("sha256")
+        else:
+            try:
+                digest = file_sha256(path)
+            except OSError as e:
+                report["corrupt"].append((rel, f"nicht lesbar: {e}"))
+                continue
+            report["rehashed"] += 1
+            state[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+        if digest == meta.get("sha256"):
+            report["ok"].append(rel)
+        else:
+            report["corrupt"].append((rel, "Prüfsumme stimmt nicht"))
+
+    for rel, _ in iter_asset_files(assets_dir):
+        if rel not in expected:
+            report["unlisted"].append(rel)
+    return report
+
+
+# ---------- Wallpaper-Varianten ----------
+def parse_resolution(value):
+    """'2560x1440' oder (2560, 1440) -> (2560, 1440), sonst None."""
+    try:
+        if isinstance(value, str):
+            w, h = value.lower().split("x")
+        else:
+            w, h = value
+        w, h = int(w), int(h)
+        return (w, h) if w > 0 and h > 0 else None
+    except (TypeError, ValueError):
+        return None
+
+
+def physical_screen_size(tk_root):
+    """
+    Bildschirmauflösung in echten Pixeln. Unter Windows liefert Tk ohne
+    DPI-Awareness skalierte Werte (4K bei 150 % -> 2560x1440); deshalb wird
+    GetSystemMetrics nur für diesen Aufruf im DPI-bewussten Thread-Kontext
+    gefragt, die Skalierung des Fensters bleibt unverändert.
+    """
+    if os.name == "nt":
+        try:
+            user32 = ctypes.windll.user32
+            set_context = user32.SetThreadDpiAwarenessContext
+            set_context.restype = ctypes.c_void_p
+            set_context.argtypes = [ctypes.c_void_p]
+            previous = set_context(-4)  # DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2
+            try:
+                width, height = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+            finally:
+                if previous:
+                    set_context(previous)
+            if width > 0 and height > 0:
+                return width, height
+        except (AttributeError, OSError):
+            pass  # vor Windows 10 1607: Tk-Werte
+    return tk_root.winfo_screenwidth(), tk_root.winfo_screenheight()
+
+
+def wallpaper_variant_path(src: Path, size, cache_dir: Path) -> Path:
+    """
+    Cache-Pfad einer skalierten Variante. Der Schlüssel enthält Größe und
+    mtime der Quelle, geänderte Bilder bekommen so automatisch neue Varianten.
+    """
+    st = src.stat()
+    key = hashlib.sha1(f"{src.name}|{st.st_size}|{st.st_mtime_ns}".encode("utf-8")).hexdigest()[:12]
+    return cache_dir / f"{src.stem}_{size[0]}x{size[1]}_{key}.jpg"
+
+
+def prepare_wallpaper_variants(files, sizes, cache_dir: Path, max_workers=None) -> dict:
+    """
+    Fehlende Varianten aller Wallpaper für alle Zielauflösungen in einem
+    Prozess-Pool erzeugen. Ergebnis: {'created': n, 'cached': n, 'errors': [...]}.
+    """
+    jobs, cached = [], 0
+    for src in files:
+        for size in sizes:
+            try:
+                dst = wallpaper_variant_path(src, size, cache_dir)
+            except OSError:
+                continue
+            if dst.exists():
+                cached += 1
+            else:
+                jobs.append((str(src), str(dst), tuple(size)))
+
+    result = {"created": 0, "cached": cached, "errors": []}
+    if not jobs:
+        return result
+    workers = max_workers or max(1, min(len(jobs), (os.cpu_count() or 2) - 1))
+    with pool_jobs.process_pool(workers) as pool:
+        for src, _dst, error in pool.map(pool_jobs.render_variant_job, jobs):
+            if error:
+                result["errors"].append((src, error))
+            else:
+                result["created"] += 1
+    return result
+
+
+def prune_wallpaper_cache(cache_dir: Path, keep) -> int:
+    """Varianten löschen, die zu keinem aktuellen Wallpaper/keiner Auflösung mehr gehören."""
+    keep = {Path(p).name for p in keep}
+    removed = 0
+    if cache_dir.exists():
+        for f in cache_dir.glob("*.jpg"):
+            if f.name not in keep:
+                try:
+                    f.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+    return removed
+
+
+def thumbnail_cache_path(path: Path, stat, size) -> Path:
+    """PNG im Thumbnail-Cache; stat = (mtime_ns, Größe) der Quelle."""
+    key = hashlib.sha1(
+        f"{path.name}|{stat[0]}|{stat[1]}|{size[0]}x{size[1]}".encode("utf-8")
+    ).hexdigest()[:16]
+    return THUMB_CACHE_DIR / f"{key}.png"
+
+
+def load_thumbnail(path: Path, size, cache_file=None, stat=None):
+    """
+    Vorschaubild als fertig dekodiertes PIL-Image (läuft im Worker-Thread).
+    Mit cache_file wird das Ergebnis zusätzlich als kleines PNG abgelegt, das
+    beim nächsten Start ohne PIL direkt von Tk geladen werden kann – aber nur,
+    solange die Datei noch zu stat (mtime_ns, Größe) passt und der Job nicht
+    abgebrochen wurde.
+    """
+    with Image.open(path) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", size)
+        img.thumbnail(size)
+        img.load()
+        thumb = img.copy() if img.mode in ("RGB", "RGBA") else img.convert("RGB")
+    raise_if_cancelled()
+    if cache_file is not None and stat is not None:
+        try:
+            st = path.stat()
+            if (st.st_mtime_ns, st.st_size) != tuple(stat):
+                cache_file = None   # inzwischen ersetzt → nicht unter altem Schlüssel ablegen
+        except OSError:
+            cache_file = None
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(cache_file.name + ".lrtmp")
+            thumb.save(tmp, "PNG")
+            os.replace(tmp, cache_file)
+        except OSError as e:
+            print(f"[WARN] Thumbnail-Cache {cache_file} nicht schreibbar: {e}")
+    return thumb
+
+
+def scan_wallpaper_dir(folder: Path) -> dict:
+    """Pfad -> (mtime_ns, Größe) aller Bilder im Wallpaper-Ordner."""
+    result = {}
+    for ext in ("*.jpg", "*.jpeg", "*.png", "*.bmp"):
+        for path in folder.glob(ext):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            result[path] = (st.st_mtime_ns, st.st_size)
+    return result
+
+
+def diff_wallpaper_files(old: dict, new: dict):
+    """(hinzugefügt, entfernt, geändert) zwischen zwei Scans, jeweils sortiert."""
+    added = sorted(p for p in new if p not in old)
+    removed = sorted(p for p in old if p not in new)
+    changed = sorted(p for p in new if p in old and old[p] != new[p])
+    return added, removed, changed
+
+
+def apply_os_wallpaper(path: Path):
+    """Setzt das Windows-Hintergrundbild (einziger plattformabhängiger Teil)."""
+    import ctypes
+    SPI_SETDESKWALLPAPER = 20
+    r = ctypes.windll.user32.SystemParametersInfoW(
+        SPI_SETDESKWALLPAPER, 0, str(path), 3
+    )
+    if not r:
+        raise RuntimeError("SystemParametersInfoW returned 0")
+
+
+# ---------- Wallpaper-Import ----------
+WALLPAPER_IMPORT_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp", ".tif", ".tiff"}
+# Vorhandene Wallpaper werden nur ersetzt, wenn das mindestens so viel spart
+WALLPAPER_IMPORT_MIN_SAVING = 0.10
+
+
+def wallpaper_import_sources(paths) -> list:
+    """Ausgewählte Dateien bzw. Ordner (nicht rekursiv) -> importierbare Bilddateien."""
+    result = []
+    for path in map(Path, paths):
+        candidates = sorted(path.iterdir()) if path.is_dir() else [path]
+        for p in candidates:
+            if p.is_file() and p.suffix.lower() in WALLPAPER_IMPORT_EXTENSIONS and p not in result:
+                result.append(p)
+    return result
+
+
+def unique_wallpaper_path(folder: Path, stem: str, taken) -> Path:
+    stem = re.sub(r"[^\w\-. ]+", "_", stem).strip(" .") or "wallpaper"
+    candidate, n = folder / f"{stem}.jpg", 2
+    while candidate.exists() or candidate.name in taken:
+        candidate, n = folder / f"{stem}_{n}.jpg", n + 1
+    return candidate
+
+
+def import_wallpapers(sources, dest_dir: Path, hash_cache: dict, max_size, quality: int,
+                      max_distance: int, max_workers=None) -> dict:
+    """
+    Bilder parallel (Prozess-Pool) aufbereiten und nach dest_dir übernehmen.
+    Duplikate (dHash-Abstand <= max_distance zu vorhandenen oder schon
+    importierten Bildern) werden übersprungen. Liegt eine Quelle bereits in
+    dest_dir, wird sie nur ersetzt, wenn das Ergebnis mindestens
+    WALLPAPER_IMPORT_MIN_SAVING kleiner ist (auch nach dem Verkleinern);
+    progressive JPEGs innerhalb von max_size werden gar nicht neu kodiert.
+    hash_cache (Dateiname -> [Größe, mtime_ns, Hash]) wird aktualisiert.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    dest_key = dest_dir.resolve()
+    result = {"imported": [], "replaced": [], "unchanged": [], "duplicates": [], "errors": [],
+              "bytes_in": 0, "bytes_out": 0}
+    existing = scan_wallpaper_dir(dest_dir)
+    for name in [n for n in hash_cache if dest_dir / n not in existing]:
+        del hash_cache[name]
+    stale = [p for p, (mtime, size) in existing.items()
+             if hash_cache.get(p.name, [None, None])[:2] != [size, mtime]]
+    jobs = [(str(src), str(dest_dir / f".lrimport_{i}.lrtmp"), tuple(max_size), quality,
+             src.parent.resolve() == dest_key)
+            for i, src in enumerate(sources)]
+    workers = max_workers or max(1, min(len(jobs) or 1, (os.cpu_count() or 2) - 1))
+
+    with pool_jobs.process_pool(workers) as pool:
+        for path, digest in zip(stale, pool.map(pool_jobs.hash_wallpaper_job, map(str, stale))):
+            if digest is not None:
+                mtime, size = existing[path]
+                hash_cache[path.name] = [size, mtime, f"{digest:016x}"]
+        seen = {name: int(entry[2], 16) for name, entry in hash_cache.items()}
+        # Quellen im Zielordner zählen erst mit, wenn sie selbst an der Reihe waren
+        pending = {src.name for src in sources if src.parent.resolve() == dest_key}
+
+        for (src, staged, _, _, in_place), (info, error) in zip(jobs, pool.map(pool_jobs.import_wallpaper_job, jobs)):
+            src, staged = Path(src), Path(staged)
+            pending.discard(src.name)
+            if error:
+                result["errors"].append((src, error))
+                continue
+            duplicate = next(
+                (name for name, digest in seen.items()
+                 if name not in pending and name != src.name
+                 and (digest ^ info["hash"]).bit_count() <= max_distance),
+                None,
+            )
+            try:
+                src_bytes = src.stat().st_size
+                if duplicate:
+                    staged.unlink(missing_ok=True)
+                    result["duplicates"].append((src, duplicate))
+                    continue
+                if info.get("skipped"):
+                    result["unchanged"].append(src)
+                    continue
+                # Jede Neukodierung kostet Qualität – nur für eine echte Ersparnis
+                if in_place and info["bytes"] > src_bytes * (1 - WALLPAPER_IMPORT_MIN_SAVING):
+                    staged.unlink()
+                    result["unchanged"].append(src)
+                    continue
+                if in_place:
+                    target = src if src.suffix.lower() == ".jpg" else src.with_suffix(".jpg")
+                    if target != src and target.exists():
+                        target = unique_wallpaper_path(dest_dir, src.stem, seen)
+                    os.replace(staged, target)
+                    if target != src:
+                        src.unlink()
+                        seen.pop(src.name, None)
+                        hash_cache.pop(src.name, None)
+                    result["replaced"].append(target)
+                else:
+                    target = unique_wallpaper_path(dest_dir, src.stem, seen)
+                    os.replace(staged, target)
+                    result["imported"].append(target)
+            except OSError as e:
+                staged.unlink(missing_ok=True)
+                result["errors"].append((src, str(e)))
+                continue
+            st = target.stat()
+            seen[target.name] = info["hash"]
+            hash_cache[target.name] = [st.st_size, st.st_mtime_ns, f"{info['hash']:016x}"]
+            result["bytes_in"] += src_bytes
+            result["bytes_out"] += info["bytes"]
+    return result
+
+
+def format_wallpaper_import(result: dict) -> str:
+    parts = []
+    if result["imported"]:
+        parts.append(f"{len(result['imported'])} importiert")
+    if result["replaced"]:
+        parts.append(f"{len(result['replaced'])} verkleinert")
+    if result["unchanged"]:
+        parts.append(f"{len(result['unchanged'])} schon optimal")
+    if result["duplicates"]:
+        parts.append(f"{len(result['duplicates'])} Duplikate übersprungen")
+    if result["errors"]:
+        parts.append(f"{len(result['errors'])} Fehler")
+    text = ", ".join(parts) or "Keine Bilder gefunden"
+    if result["bytes_in"]:
+        text += f" ({format_bytes(result['bytes_in'])} → {format_bytes(result['bytes_out'])})"
+    return text
+
+
+# ---------- Bild-Cache & Speicher ----------
+class ImageBudgetCache:
+    """
+    LRU für Tk-Bilder mit Byte-Budget (Breite × Höhe × 4). evict() verdrängt
+    die am längsten nicht sichtbaren Bilder, bis das Budget wieder passt;
+    gerade sichtbare Schlüssel (keep) bleiben immer erhalten.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget = budget_bytes
+        self.entries = collections.OrderedDict()    # Schlüssel -> (Bild, Bytes)
+        self.bytes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def image_bytes(img) -> int:
+        return img.width() * img.height() * 4
+
+    def put(self, key, img):
+        self.discard(key)
+        size = self.image_bytes(img)
+        self.entries[key] = (img, size)
+        self.bytes += size
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def touch(self, keys):
+        for key in keys:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def evict(self, keep=()) -> list:
+        """Älteste Einträge außerhalb von keep entfernen; gibt deren Schlüssel zurück."""
+        evicted = []
+        for key in list(self.entries):
+            if self.bytes <= self.budget:
+                break
+            if key in keep:
+                continue
+            self.discard(key)
+            evicted.append(key)
+        self.evictions += len(evicted)
+        return evicted
+
+    def clear(self) -> list:
+        keys = list(self.entries)
+        self.entries.clear()
+        self.bytes = 0
+        return keys
+
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    """psapi-Struktur für GetProcessMemoryInfo (DWORD-Felder, danach SIZE_T)."""
+    _fields_ = [("cb", ctypes.c_ulong), ("PageFaultCount", ctypes.c_ulong)] + [
+        (name, ctypes.c_size_t)
+        for name in (
+            "PeakWorkingSetSize", "WorkingSetSize",
+            "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+            "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+            "PagefileUsage", "PeakPagefileUsage",
+        )
+    ]
+
+
+def process_rss_bytes():
+    """Resident Set Size des Launchers (Windows: Working Set), None wenn unbekannt."""
+    try:
+        if os.name == "nt":
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+            return None
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+# ---------- Prozess-Erkennung (FiveM läuft?) ----------
+# FiveM.exe bzw. FiveM_b2802_GTAProcess.exe (Build-Nummer variiert)
+FIVEM_PROCESS = re.compile(r"^fivem(?:_b\d+)?(?:_gtaprocess)?\.exe$", re.I)
+GAME_WATCH_INTERVAL_MS = 5000
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", ctypes.c_ulong),
+        ("cntUsage", ctypes.c_ulong),
+        ("th32ProcessID", ctypes.c_ulong),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", ctypes.c_ulong),
+        ("cntThreads", ctypes.c_ulong),
+        ("th32ParentProcessID", ctypes.c_ulong),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", ctypes.c_ulong),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+
+def _windows_process_names() -> list:
+    """Prozessliste per Toolhelp-Snapshot (kein Subprozess, ~1 ms)."""
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    kernel32.Process32FirstW.argtypes = [ctypes.c_void_p, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [ctypes.c_void_p, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    TH32CS_SNAPPROCESS = 0x2
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot in (None, ctypes.c_void_p(-1).value):
+        raise OSError("CreateToolhelp32Snapshot fehlgeschlagen")
+    names = []
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            names.append(entry.szExeFile)
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return names
+
+
+def list_process_names() -> list:
+    """Namen aller laufenden Prozesse (Windows: Toolhelp, Fallback tasklist; sonst /proc)."""
+    if os.name == "nt":
+        try:
+            return _windows_process_names()
+        except (OSError, AttributeError):
+            out = subprocess.run(
+                ["tasklist", "/FO", "CSV", "/NH"], capture_output=True, text=True,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0), timeout=10,
+            ).stdout
+            return [line.split('","', 1)[0].strip('"') for line in out.splitlines() if line]
+    names = []
+    for comm in Path("/proc").glob("[0-9]*/comm"):
+        try:
+            names.append(comm.read_text().strip())
+        except OSError:
+            continue
+    return names
+
+
+def fivem_running(names=None) -> bool:
+    return any(FIVEM_PROCESS.match(name) for name in (names if names is not None else list_process_names()))
+
+
+def tracemalloc_by_file(limit: int = 8) -> list:
+    """(Datei, Bytes) der größten Python-Allokationen laut tracemalloc."""
+    if not tracemalloc.is_tracing():
+        return []
+    stats = tracemalloc.take_snapshot().statistics("filename")
+    return [(Path(s.traceback[0].filename).name, s.size) for s in stats[:limit]]
+
+
+# ---------- UI-Mod-Profile (frontend.xml & Co.) ----------
+def list_ui_profiles(profiles_dir: Path, wqhd_asset: Path) -> dict:
+    """Profilname -> {Dateiname: Quelldatei}. 'original' ist immer vorhanden."""
+    result = {UiProfileManager.ORIGINAL: {}}
+    if wqhd_asset.exists():
+        result["wqhd"] = {"frontend.xml": wqhd_asset}
+    if profiles_dir.exists():
+        for d in sorted(profiles_dir.iterdir()):
+            if d.is_dir():
+                files = {f.name: f for f in sorted(d.iterdir()) if f.is_file()}
+                if files:
+                    result[d.name] = files
+    return result
+
+
+class UiProfileManager:
+    """
+    Verwaltet UI-Mod-Profile für FiveM inhaltsadressiert:
+    - jede Datei liegt einmal unter data/ui_store/objects/<sha256>,
+    - ein Profil ist nur eine Zuordnung Dateiname -> Digest,
+    - geschrieben wird nur, wenn der Digest im FiveM-Ordner abweicht,
+    - überschreibt ein FiveM-Update die Datei, wird das als neues Original
+      übernommen und das aktive Profil erneut angewendet.
+    """
+
+    ORIGINAL = "original"
+
+    def __init__(self, store_dir: Path, ui_dir: Path, profiles_dir: Path, wqhd_asset: Path):
+        self.store_dir = store_dir
+        self.objects_dir = store_dir / "objects"
+        self.state_file = store_dir / "state.json"
+        self.ui_dir = ui_dir
+        self.profiles_dir = profiles_dir
+        self.wqhd_asset = wqhd_asset
+        self.state = load_json(self.state_file, {})
+        self.state.setdefault("active", self.ORIGINAL)
+        self.state.setdefault("original", {})   # Dateiname -> Digest (None = gab es nicht)
+        self.state.setdefault("applied", {})    # Dateiname -> Digest, den wir geschrieben haben
+
+    # --- Profile ---
+    def profiles(self) -> dict:
+        return list_ui_profiles(self.profiles_dir, self.wqhd_asset)
+
+    def managed_files(self, profiles=None):
+        profiles = profiles or self.profiles()
+        names = set(self.state["original"])
+        for files in profiles.values():
+            names.update(files)
+        return sorted(names)
+
+    # --- Store ---
+    def put(self, path: Path) -> str:
+        digest = file_sha256(path)
+        obj = self.objects_dir / digest
+        if not obj.exists():
+            atomic_copy(path, obj)
+        return digest
+
+    def _digest_of(self, name: str):
+        target = self.ui_dir / name
+        return file_sha256(target) if target.exists() else None
+
+    def _save(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        save_json(self.state_file, self.state)
+
+    # --- Abgleich ---
+    def capture_originals(self, profiles=None) -> list:
+        """
+        Merkt sich die aktuellen FiveM-Dateien als Original, wenn sie weder von
+        uns geschrieben wurden noch einem Profil entsprechen (= FiveM-Update
+        oder erster Lauf). Gibt die betroffenen Dateinamen zurück.
+        """
+        profiles = profiles or self.profiles()
+        profile_digests = {}
+        for name, files in profiles.items():
+            for fname, src in files.items():
+                profile_digests.setdefault(fname, set()).add(self.put(src))
+
+        changed = []
+        for fname in self.managed_files(profiles):
+            current = self._digest_of(fname)
+            known = fname in self.state["original"]
+            if current is None:
+                if not known:
+                    self.state["original"][fname] = None
+                continue
+            if current == self.state["applied"].get(fname) or current == self.state["original"].get(fname):
+                continue
+            if current in profile_digests.get(fname, ()) and known:
+                continue
+            if current in profile_digests.get(fname, ()) and not known:
+                # Alter WQHD-Toggle: die Datei ist schon ersetzt, Original liegt im Backup
+                backup = self.ui_dir / fname.replace(".xml", ".larue_backup.xml")
+                self.state["original"][fname] = self.put(backup) if backup.exists() else None
+                self.state["applied"][fname] = current
+                continue
+            self.state["original"][fname] = self.put(self.ui_dir / fname)
+            self.state["applied"].pop(fname, None)
+            if known:
+                changed.append(fname)
+        self._save()
+        return changed
+
+    def wanted(self, profile: str, profiles=None) -> dict:
+        """Dateiname -> gewünschter Digest (None = Datei soll nicht existieren)."""
+        profiles = profiles or self.profiles()
+        wanted = dict(self.state["original"])
+        for fname, src in profiles.get(profile, {}).items():
+            wanted[fname] = self.put(src)
+        return wanted
+
+    def apply(self, profile: str) -> dict:
+        """
+        Profil anwenden. Schreibt nur Dateien, deren Digest abweicht.
+        Liefert {'profile': ..., 'written': [...], 'unchanged': [...], 'external': [...]}.
+        """
+        profiles = self.profiles()
+        if profile not in profiles:
+            raise KeyError(f"Unbekanntes UI-Profil: {profile}")
+        external = self.capture_originals(profiles)
+        written, unchanged = [], []
+        for fname, digest in self.wanted(profile, profiles).items():
+            target = self.ui_dir / fname
+            if self._digest_of(fname) == digest:
+                unchanged.append(fname)
+            elif digest is None:
+                target.unlink(missing_ok=True)
+                written.append(fname)
+            else:
+                atomic_copy(self.objects_dir / digest, target)
+                written.append(fname)
+            if digest is not None:
+                self.state["applied"][fname] = digest
+            else:
+                self.state["applied"].pop(fname, None)
+        self.state["active"] = profile
+        self._save()
+        return {"profile": profile, "written": written, "unchanged": unchanged, "external": external}
+
+    def ensure_active(self) -> dict:
+        """Beim Start: aktives Profil prüfen und ggf. nach FiveM-Update erneut anwenden."""
+        active = self.state.get("active", self.ORIGINAL)
+        if active not in self.profiles():
+            active = self.ORIGINAL
+        return self.apply(active)
+
+
+def read_announcements():
+    """Ankündigungen aus config/announcements.json, legt Default an wenn nötig."""
+    if not ANNOUNCEMENTS_FILE.exists():
+        default_data = {
+            "announcements": [
+                {
+                    "title": "Willkommen auf LaRueRP",
+                    "body": "Verbinde dich direkt über den Launcher mit dem Server und tritt unserem Discord bei!"
+                },
+                {
+                    "title": "Beispiel-Ankündigung",
+                    "body": "Diese Nachrichten kommen aus config/announcements.json und können dort beliebig angepasst werden."
+                },
+            ]
+        }
+        save_json(ANNOUNCEMENTS_FILE, default_data)
+        data = default_data
+    else:
+        raw = load_json(ANNOUNCEMENTS_FILE, {"announcements": []})
+        if isinstance(raw, list):
+            data = {"announcements": raw}
+        elif isinstance(raw, dict):
+            data = raw
+        else:
+            data = {"announcements": []}
+    return data.get("announcements", []) or []
+
+
+# ---------- Crash-Dumps ----------
+MDMP_SIGNATURE = b"MDMP"
+MDMP_HEADER = struct.Struct("<4sIIIIIQ")        # Signatur, Version, Streams, Dir-RVA, Checksum, Zeit, Flags
+MDMP_DIRECTORY = struct.Struct("<III")          # StreamType, DataSize, Rva
+MDMP_EXCEPTION = struct.Struct("<IIIIQQ")       # ThreadId, align, Code, Flags, Record, Address
+MDMP_MODULE = struct.Struct("<QIIII")           # Base, Size, CheckSum, TimeDateStamp, NameRva (108 Byte/Eintrag)
+MDMP_MODULE_SIZE = 108
+MDMP_STREAM_MODULES = 4
+MDMP_STREAM_EXCEPTION = 6
+CRASH_SAMPLE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _minidump_string(mm, rva: int) -> str:
+    (length,) = struct.unpack_from("<I", mm, rva)
+    return bytes(mm[rva + 4:rva + 4 + min(length, 1024)]).decode("utf-16-le", errors="replace")
+
+
+def read_minidump_signature(path: Path) -> dict:
+    """
+    Liest aus einem Minidump nur Header, Stream-Verzeichnis, Exception- und
+    Modulliste (per mmap, es werden nur diese Seiten berührt) und liefert
+    Modul, Exception-Code und Offset der Absturzadresse im Modul.
+    """
+    with path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            sig, _ver, streams, dir_rva, _chk, stamp, _flags = MDMP_HEADER.unpack_from(mm, 0)
+            if sig != MDMP_SIGNATURE:
+                raise ValueError("kein Minidump")
+            exc_rva = mod_rva = None
+            for i in range(min(streams, 256)):
+                stype, _size, rva = MDMP_DIRECTORY.unpack_from(mm, dir_rva + i * MDMP_DIRECTORY.size)
+                if stype == MDMP_STREAM_EXCEPTION:
+                    exc_rva = rva
+                elif stype == MDMP_STREAM_MODULES:
+                    mod_rva = rva
+
+            code = address = None
+            if exc_rva is not None:
+                _tid, _align, code, _flags, _rec, address = MDMP_EXCEPTION.unpack_from(mm, exc_rva)
+
+            module, offset = "unbekannt", None
+            if mod_rva is not None and address is not None:
+                (count,) = struct.unpack_from("<I", mm, mod_rva)
+                for i in range(min(count, 4096)):
+                    base, size, _c, _t, name_rva = MDMP_MODULE.unpack_from(
+                        mm, mod_rva + 4 + i * MDMP_MODULE_SIZE
+                    )
+                    if base <= address < base + size:
+                        module = _minidump_string(mm, name_rva).replace("\\", "/").rsplit("/", 1)[-1]
+                        offset = address - base
+                        break
+    return {
+        "module": module,
+        "code": f"0x{code:08X}" if code is not None else "unbekannt",
+        "offset": f"0x{offset:X}" if offset is not None else None,
+        "timestamp": stamp,
+    }
+
+
+class CrashIndex:
+    """
+    Kompakter Index aller gesehenen FiveM-Crashdumps, gruppiert nach
+    Signatur (Modul + Exception-Code). Neue Dumps werden inkrementell
+    (Name/Größe/mtime) erfasst; der Index liegt in data/ und überlebt damit
+    jeden Clean. Pro Signatur wird der neueste Dump als Beispiel aufbewahrt.
+    """
+
+    def __init__(self, index_file: Path, samples_dir: Path):
+        self.index_file = index_file
+        self.samples_dir = samples_dir
+        data = load_json(index_file, {})
+        if data.get("version") != 1:
+            data = {"version": 1, "files": {}, "signatures": {}}
+        self.data = data
+        # Start-Scan und Clean laufen evtl. parallel in Worker-Threads
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def signature_key(info: dict) -> str:
+        return f"{info['module']}!{info['code']}"
+
+    def scan(self, crash_dir: Path) -> list:
+        """Neue Dumps einlesen; gibt die Signaturen der neuen Dumps zurück."""
+        with self.lock:
+            new = self._scan(crash_dir)
+            self.save()
+        return new
+
+    def _scan(self, crash_dir: Path) -> list:
+        new = []
+        seen = set()
+        files = self.data["files"]
+        if not crash_dir.exists():
+            return new
+        for path in sorted(crash_dir.rglob("*.dmp")):
+            raise_if_cancelled()
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            rel = path.relative_to(crash_dir).as_posix()
+            seen.add(rel)
+            known = files.get(rel)
+            if known and known["size"] == st.st_size and known["mtime"] == int(st.st_mtime):
+                continue
+            try:
+                info = read_minidump_signature(path)
+            except (OSError, ValueError, struct.error) as e:
+                info = {"module": "unlesbar", "code": type(e).__name__, "offset": None, "timestamp": 0}
+            key = self.signature_key(info)
+            files[rel] = {"size": st.st_size, "mtime": int(st.st_mtime), "sig": key}
+            self._count(key, info, path, st)
+            new.append(key)
+        # Einträge für gelöschte Dumps entfernen, die Zählung bleibt in 'signatures'
+        for rel in [r for r in files if r not in seen]:
+            del files[rel]
+        return new
+
+    def _count(self, key: str, info: dict, path: Path, st):
+        day = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d")
+        sig = self.data["signatures"].setdefault(key, {
+            "module": info["module"], "code": info["code"], "count": 0,
+            "first": day, "last": day, "days": {}, "sample": None, "offset": info.get("offset"),
+        })
+        sig["count"] += 1
+        sig["first"] = min(sig["first"], day)
+        sig["last"] = max(sig["last"], day)
+        sig["days"][day] = sig["days"].get(day, 0) + 1
+        # Tageshistorie begrenzen (90 Tage)
+        for old in sorted(sig["days"])[:-90]:
+            del sig["days"][old]
+        if info["module"] != "unlesbar" and st.st_size <= CRASH_SAMPLE_MAX_BYTES:
+            sample = self.samples_dir / (re.sub(r"[^A-Za-z0-9._-]", "_", key) + ".dmp")
+            try:
+                atomic_copy(path, sample)
+                sig["sample"] = sample.name
+            except OSError:
+                pass
+
+    def save(self):
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        save_json(self.index_file, self.data)
+
+    def trend(self, key: str, days: int = 7, now=None):
+        """(Anzahl letzte N Tage, Anzahl davor N Tage)."""
+        now = now or datetime.now()
+        sig = self.data["signatures"][key]
+        recent = previous = 0
+        for day, n in sig["days"].items():
+            age = (now - datetime.strptime(day, "%Y-%m-%d")).days
+            if age < days:
+                recent += n
+            elif age < 2 * days:
+                previous += n
+        return recent, previous
+
+    def summary(self, now=None) -> str:
+        with self.lock:
+            return self._summary(now)
+
+    def _summary(self, now=None) -> str:
+        sigs = self.data["signatures"]
+        if not sigs:
+            return "Keine Crashdumps erfasst."
+        lines = [f"Crash-Signaturen ({sum(s['count'] for s in sigs.values())} Dumps gesamt):", ""]
+        for key, sig in sorted(sigs.items(), key=lambda kv: (-kv[1]["count"], kv[0])):
+            recent, previous = self.trend(key, now=now)
+            arrow = "↑" if recent > previous else ("↓" if recent < previous else "→")
+            lines.append(
+                f"{sig['module']} {sig['code']}: {sig['count']}x "
+                f"(7 Tage: {recent} {arrow} vorher {previous}, zuletzt {sig['last']})"
+            )
+        return "\n".join(lines)
+
+    def representative_samples(self, max_count: int = 5, days: int = 14, now=None):
+        """Beispiel-Dumps der zuletzt aktiven Signaturen (neueste zuerst)."""
+        now = now or datetime.now()
+        result = []
+        with self.lock:
+            sigs = list(self.data["signatures"].items())
+        for key, sig in sorted(sigs, key=lambda kv: kv[1]["last"], reverse=True):
+            if not sig.get("sample"):
+                continue
+            if (now - datetime.strptime(sig["last"], "%Y-%m-%d")).days > days:
+                continue
+            path = self.samples_dir / sig["sample"]
+            if path.exists():
+                result.append(path)
+            if len(result) >= max_count:
+                break
+        return result
+
+
+# ---------- FiveM-Logs ----------
+# "[   12345] [b2802_GTAProce]   MainThrd/ Text" – Millisekunden seit Prozessstart
+FIVEM_LOG_LINE = re.compile(r"^\[\s*(\d+)\]\s*(?:\[[^\]]*\]\s*)?(?:[\w .-]+/\s?)?(.*)$")
+FIVEM_LOG_NAME_TIME = re.compile(r"(\d{4}-\d{2}-\d{2}T\d{6})")
+
+# Meilensteine einer Sitzung (Heuristik über die Logtexte, erster Treffer zählt)
+FIVEM_LOG_MILESTONES = [
+    ("connecting", re.compile(r"connecting to\b|\bconnect(?:ing)? to server", re.I)),
+    ("connected", re.compile(r"connectok|required resources|connection (?:established|accepted)", re.I)),
+    ("resources_done", re.compile(
+        r"all resources (?:loaded|downloaded)|finished downloading|resource(?:s)? download (?:complete|finished)", re.I
+    )),
+    ("spawned", re.compile(r"playerspawned|\bspawned\b|shutdownloadingscreen|loading ?screen.*shut ?down", re.I)),
+]
+FIVEM_LOG_ERROR = re.compile(r"script error|\berror\b|\bfailed\b|exception|\^1", re.I)
+FIVEM_LOG_DOWNLOAD = re.compile(r"download\w*\b.*?(\d+(?:[.,]\d+)?)\s*(B|KB|KiB|MB|MiB|GB|GiB)\b", re.I)
+SIZE_UNITS = {"b": 1, "kb": 1000, "kib": 1024, "mb": 1000 ** 2, "mib": 1024 ** 2, "gb": 1000 ** 3, "gib": 1024 ** 3}
+
+# Phasen = Abstand zweier Meilensteine
+FIVEM_LOG_PHASES = [
+    ("Spiel-Init", "started", "connecting"),
+    ("Server-Verbindung", "connecting", "connected"),
+    ("Ressourcen laden", "connected", "spawned"),
+]
+
+
+def log_file_start_time(path: Path, st) -> float:
+    """Startzeit einer FiveM-Sitzung: aus dem Dateinamen, sonst ctime."""
+    match = FIVEM_LOG_NAME_TIME.search(path.name)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y-%m-%dT%H%M%S").timestamp()
+        except ValueError:
+            pass
+    return st.st_ctime
+
+
+def session_phases(session: dict) -> dict:
+    """Phasendauern in Sekunden (nur wenn beide Meilensteine bekannt sind)."""
+    marks = session["milestones"]
+    result = {}
+    for label, start, end in FIVEM_LOG_PHASES:
+        if start in marks and end in marks:
+            result[label] = max(0, marks[end] - marks[start]) / 1000.0
+    return result
+
+
+class FiveMLogAnalyzer:
+    """
+    Liest FiveM.app/logs inkrementell mit: pro Datei wird der Offset gemerkt,
+    bereits gelesene Bytes werden nie erneut verarbeitet (auch nicht über
+    Neustarts des Launchers). Pro Datei (= Spielsitzung) werden Meilensteine,
+    Fehler und Download-Volumen gesammelt. Aus MAX_SESSIONS herausgefallene
+    Sitzungen behalten nur ihren Offset ('trimmed'), solange die Datei existiert.
+    """
+
+    MAX_SESSIONS = 20
+    MAX_ERRORS = 50
+    READ_LIMIT = 4 * 1024 * 1024      # pro Datei und Durchlauf
+
+    def __init__(self, state_file: Path):
+        self.state_file = state_file
+        data = load_json(state_file, {})
+        if data.get("version") != 1:
+            data = {"version": 1, "sessions": {}}
+        self.data = data
+        self.lock = threading.Lock()
+
+    def poll(self, logs_dir: Path) -> list:
+        """Neue Logzeilen verarbeiten; gibt Ereignisse (Datei, Art, Wert) zurück."""
+        with self.lock:
+            events = []
+            present = set()
+            if logs_dir.exists():
+                for path in sorted(logs_dir.glob("*.log")):
+                    raise_if_cancelled()
+                    present.add(path.name)
+                    try:
+                        events.extend(self._read_new(path))
+                    except OSError:
+                        continue
+            trimmed = self.data.setdefault("trimmed", {})
+            gone = [name for name in trimmed if name not in present]
+            for name in gone:
+                del trimmed[name]
+            if events or gone:
+                self._trim()
+                save_json(self.state_file, self.data)
+            return events
+
+    def _read_new(self, path: Path) -> list:
+        st = path.stat()
+        sessions = self.data["sessions"]
+        trimmed = self.data.setdefault("trimmed", {})
+        session = sessions.get(path.name)
+        if session is None and path.name in trimmed:
+            if st.st_size >= trimmed[path.name]:
+                # Alte Sitzung, schon ausgewertet und aussortiert → nur weiterzählen
+                trimmed[path.name] = st.st_size
+                return []
+            del trimmed[path.name]
+        if session is None or st.st_size < session["offset"]:
+            # Neue oder abgeschnittene Datei → von vorn
+            session = sessions[path.name] = {
+                "offset": 0, "started_at": log_file_start_time(path, st), "milestones": {},
+                "errors": 0, "download_bytes": 0, "downloads": 0, "last_errors": [],
+            }
+        if st.st_size == session["offset"]:
+            return []
+        with path.open("rb") as f:
+            f.seek(session["offset"])
+            chunk = f.read(self.READ_LIMIT)
+        # Nur vollständige Zeilen verarbeiten, den Rest beim nächsten Mal
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return []
+        session["offset"] += end + 1
+        events = []
+        for raw in chunk[:end].splitlines():
+            events.extend(self._parse_line(path.name, session, raw.decode("utf-8", errors="replace")))
+        return events
+
+    def _parse_line(self, name: str, session: dict, line: str) -> list:
+        match = FIVEM_LOG_LINE.match(line)
+        if not match:
+            return []
+        ms, text = int(match.group(1)), match.group(2).strip()
+        marks = session["milestones"]
+        events = []
+        if "started" not in marks:
+            marks["started"] = ms
+            events.append((name, "started", ms))
+        for milestone, pattern in FIVEM_LOG_MILESTONES:
+            if milestone not in marks and pattern.search(text):
+                marks[milestone] = ms
+                events.append((name, milestone, ms))
+        dl = FIVEM_LOG_DOWNLOAD.search(text)
+        if dl:
+            size = float(dl.group(1).replace(",", ".")) * SIZE_UNITS[dl.group(2).lower()]
+            session["download_bytes"] += int(size)
+            session["downloads"] += 1
+        elif FIVEM_LOG_ERROR.search(text):
+            session["errors"] += 1
+            session["last_errors"] = (session["last_errors"] + [f"[{ms}] {text[:300]}"])[-10:]
+            events.append((name, "error", text[:300]))
+        return events
+
+    def _trim(self):
+        sessions = self.data["sessions"]
+        trimmed = self.data.setdefault("trimmed", {})
+        for name in sorted(sessions, key=lambda n: sessions[n]["started_at"])[:-self.MAX_SESSIONS]:
+            trimmed[name] = sessions.pop(name)["offset"]
+
+    def session_start(self, name: str):
+        with self.lock:
+            session = self.data["sessions"].get(name)
+            return session["started_at"] if session else None
+
+    def latest_session(self):
+        with self.lock:
+            sessions = self.data["sessions"]
+            if not sessions:
+                return None
+            name = max(sessions, key=lambda n: sessions[n]["started_at"])
+            return dict(sessions[name], name=name)
+
+    def recent_errors(self, limit: int = MAX_ERRORS) -> list:
+        with self.lock:
+            sessions = sorted(self.data["sessions"].items(), key=lambda kv: kv[1]["started_at"])
+            lines = [f"{name}: {err}" for name, s in sessions for err in s["last_errors"]]
+        return lines[-limit:]
+
+
+def format_log_session(session) -> str:
+    if not session:
+        return "Noch keine FiveM-Sitzung ausgewertet."
+    started = datetime.fromtimestamp(session["started_at"]).strftime("%d.%m. %H:%M")
+    phases = session_phases(session)
+    parts = [f"{label} {secs:.0f} s" for label, secs in phases.items()]
+    lines = [f"Letzte FiveM-Sitzung ({started}):", " · ".join(parts) or "Noch keine Phasen erkannt."]
+    lines.append(
+        f"Downloads: {format_bytes(session['download_bytes'])} ({session['downloads']}x) · "
+        f"Fehler: {session['errors']}"
+    )
+    return "\n".join(lines)
+
+
+# ---------- Log-Index & Log-Viewer ----------
+LAUNCHER_LOG_TIME = re.compile(r"^\[(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})\]")
+LOG_SINCE_CHOICES = {"Gesamt": None, "1 Stunde": 3600, "24 Stunden": 86400, "7 Tage": 7 * 86400}
+# Stichwörter beginnen mit einem Buchstaben (reine Zahlen/Zeitstempel blähen nur den Index auf)
+LOG_TOKEN = re.compile(r"[a-z_][a-z0-9_.\-]{1,30}[a-z0-9_]")
+# Level direkt aus den Stichwörtern der Zeile (^1/^3 = FiveM-Farbcodes)
+LOG_ERROR_WORDS = frozenset({"error", "errors", "failed", "exception", "fehler", "fehlgeschlagen"})
+LOG_WARN_WORDS = frozenset({"warn", "warning", "warnung"})
+
+
+class LogIndex:
+    """
+    Inkrementeller Index über eine Logdatei: Zeilen-Offsets (array 'Q'),
+    Zeitstempel und Level je Zeile sowie ein invertierter Index
+    Stichwort -> Zeilennummern. Neue Bytes werden bei update() nachgetragen,
+    Suchen laufen nur über die Arrays, die Zeilen selbst werden erst zum
+    Anzeigen aus der Datei gelesen.
+    Die Arrays wachsen nur am Ende: update() indexiert ohne Sperre und hängt
+    das Ergebnis unter self.lock in einem Rutsch an. Leser (Suche, Anzeige)
+    arbeiten auf self.snapshot und warten nie auf einen laufenden update().
+    """
+
+    READ_CHUNK = 8 * 1024 * 1024
+
+    def __init__(self, path: Path, fivem: bool = False):
+        self.path = path
+        self.fivem = fivem
+        self.lock = threading.Lock()            # nur für das Anhängen/Ersetzen
+        self._update_lock = threading.Lock()    # ein update() zur Zeit
+        self._reset()
+
+    def _reset(self):
+        self.offsets = array("Q")
+        self.times = array("d")
+        self.levels = array("B")
+        self.postings = {}
+        # Zeilen mit Level >= 2 bzw. == 3, damit auch der Level-Filter eine Posting-Liste ist
+        self.level_postings = {2: array("I"), 3: array("I")}
+        self.size = 0
+        self._last_time = 0.0
+        self._last_stamp = None
+        self._last_level = 1
+        self._started_at = None
+        self._publish()
+
+    def _publish(self):
+        # Ein Tupel, atomar ersetzt: Zeilen < count sind vollständig indexiert
+        self.snapshot = (self.offsets, self.times, self.levels, self.postings,
+                         self.level_postings, len(self.offsets), self.size)
+
+    def __len__(self):
+        return self.snapshot[5]
+
+    def update(self) -> int:
+        """Neu hinzugekommene vollständige Zeilen indexieren; gibt deren Anzahl zurück."""
+        with self._update_lock:
+            try:
+                st = self.path.stat()
+            except OSError:
+                with self.lock:
+                    self._reset()
+                return 0
+            if st.st_size < self.size:
+                with self.lock:
+                    self._reset()   # Datei neu angelegt (z. B. nach einem Clean)
+            if self._started_at is None and self.fivem:
+                self._started_at = log_file_start_time(self.path, st)
+            added = 0
+            with self.path.open("rb") as f:
+                while self.size < st.st_size:
+                    raise_if_cancelled()
+                    f.seek(self.size)
+                    chunk = f.read(self.READ_CHUNK)
+                    end = chunk.rfind(b"\n")
+                    if end < 0:
+                        break
+                    batch = self._index_chunk(chunk[:end + 1])
+                    with self.lock:
+                        self._append(batch)
+                    added += len(batch[0])
+            return added
+
+    def _index_chunk(self, chunk: bytes):
+        """Chunk in eigene Arrays indexieren (ohne Sperre, Leser sehen davon noch nichts)."""
+        offsets, times, levels = array("Q"), array("d"), array("B")
+        postings = {}
+        level_postings = {2: array("I"), 3: array("I")}
+        first = len(self.offsets)
+        pos = 0
+        for raw in chunk.splitlines(keepends=True):
+            line_no = first + len(offsets)
+            offsets.append(self.size + pos)
+            pos += len(raw)
+            text = raw.decode("utf-8", errors="replace")
+            tokens = set(LOG_TOKEN.findall(text.lower()))
+            ts, level = self._classify(text, tokens)
+            times.append(ts)
+            levels.append(level)
+            if level >= 2:
+                level_postings[2].append(line_no)
+                if level == 3:
+                    level_postings[3].append(line_no)
+            for token in tokens:
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = array("I")
+                posting.append(line_no)
+        return offsets, times, levels, postings, level_postings, pos
+
+    def _append(self, batch):
+        offsets, times, levels, postings, level_postings, size = batch
+        self.offsets.extend(offsets)
+        self.times.extend(times)
+        self.levels.extend(levels)
+        for level, lines in level_postings.items():
+            self.level_postings[level].extend(lines)
+        for token, lines in postings.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                self.postings[token] = lines
+            else:
+                posting.extend(lines)
+        self.size += size
+        self._publish()
+
+    def _classify(self, text: str, tokens: set):
+        """(Zeitstempel, Level); Folgezeilen ohne Zeitstempel erben die der Vorzeile."""
+        if self.fivem:
+            match = FIVEM_LOG_LINE.match(text)
+            if not match:
+                return self._last_time, self._last_level
+            self._last_time = (self._started_at or 0.0) + int(match.group(1)) / 1000.0
+        else:
+            match = LAUNCHER_LOG_TIME.match(text)
+            if not match:
+                return self._last_time, self._last_level
+            stamp = match.group(1)
+            # Viele Zeilen pro Sekunde → Umrechnung nur bei neuem Zeitstempel
+            if stamp != self._last_stamp:
+                try:
+                    self._last_time = datetime.fromisoformat(stamp).timestamp()
+                    self._last_stamp = stamp
+                except ValueError:
+                    pass
+        if not tokens.isdisjoint(LOG_ERROR_WORDS) or "^1" in text:
+            self._last_level = 3
+        elif not tokens.isdisjoint(LOG_WARN_WORDS) or "^3" in text:
+            self._last_level = 2
+        else:
+            self._last_level = 1
+        return self._last_time, self._last_level
+
+    def search(self, query: str = "", min_level: int = 0, since=None):
+        """
+        Zeilennummern, die alle Stichwörter aus query enthalten, mindestens
+        min_level haben und nicht älter als since sind. Ohne Filter wird ein
+        range zurückgegeben (nichts wird kopiert).
+        """
+        _offsets, times, _levels, all_postings, level_postings, count, _size = self.snapshot
+        lo, hi = 0, count
+        if since:
+            # Logs sind zeitlich aufsteigend → Startzeile per Binärsuche
+            lo = bisect.bisect_left(times, since, 0, count)
+        terms = LOG_TOKEN.findall(query.lower())
+        if not terms and not min_level:
+            return range(lo, hi)
+        postings = [level_postings[min(min_level, 3)]] if min_level >= 2 else []
+        for term in terms:
+            posting = all_postings.get(term)
+            if posting is None:
+                return array("I")
+            postings.append(posting)
+        if not postings:        # min_level 1 = alle Zeilen mit Level
+            return range(lo, hi)
+        postings.sort(key=len)
+        # Nur Zeilen < count: was update() danach anhängt, gehört nicht zu diesem Stand
+        base = postings[0][bisect.bisect_left(postings[0], lo):bisect.bisect_left(postings[0], hi)]
+        if len(postings) == 1:
+            return base
+        # Schnittmenge über Sets: linear in der Summe der Listenlängen
+        hits = set(base)
+        for posting in postings[1:]:
+            hits.intersection_update(posting)
+        return array("I", sorted(hits))
+
+    def memory_bytes(self) -> int:
+        with self.lock:
+            arrays = [self.offsets, self.times, self.levels, *self.level_postings.values()]
+            total = sum(a.itemsize * len(a) for a in arrays)
+            total += sum(sys.getsizeof(k) + p.itemsize * len(p) for k, p in self.postings.items())
+            return total + sys.getsizeof(self.postings)
+
+    def read_lines(self, line_numbers) -> list:
+        """(Text, Level) der angegebenen Zeilen – nur diese werden gelesen."""
+        offsets, _times, levels, _postings, _level_postings, count, size = self.snapshot
+        spans = []
+        for i in line_numbers:
+            if i >= count:
+                continue
+            end = offsets[i + 1] if i + 1 < count else size
+            spans.append((offsets[i], end, levels[i]))
+        result = []
+        try:
+            with self.path.open("rb") as f:
+                for start, end, level in spans:
+                    f.seek(start)
+                    text = f.read(min(end - start, 4096)).decode("utf-8", errors="replace")
+                    result.append((text.rstrip("\r\n"), level))
+        except OSError:
+            pass
+        return result
+
+
+class VirtualLogView:
+    """
+    Text-Widget, das nur die gerade sichtbaren Zeilen enthält. Die Scrollbar
+    wird selbst geführt; beim Scrollen werden die passenden Zeilen über
+    fetch(zeilennummern) nachgeladen.
+    """
+
+    def __init__(self, parent, fetch, font=FONT_TEXT):
+        self.frame = tk.Frame(parent, bg="#111111")
+        self.text = tk.Text(
+            self.frame, bg="#000000", fg="#DDDDDD", font=font, wrap="none",
+            state="disabled", highlightthickness=0,
+        )
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.tag_configure("level2", foreground="#FFCC55")
+        self.text.tag_configure("level3", foreground="#FF5555")
+        self.line_height = max(1, tkfont.Font(font=font).metrics("linespace"))
+        self.fetch = fetch
+        self.rows = range(0)
+        self.first = 0
+        self.text.bind("<Configure>", lambda _e: self.render())
+        self.text.bind("<MouseWheel>", lambda e: self.scroll_lines(-3 if e.delta > 0 else 3))
+        self.text.bind("<Button-4>", lambda _e: self.scroll_lines(-3))
+        self.text.bind("<Button-5>", lambda _e: self.scroll_lines(3))
+
+    def visible_count(self) -> int:
+        return max(1, self.text.winfo_height() // self.line_height)
+
+    def set_rows(self, rows, follow_end: bool = True):
+        self.rows = rows
+        self.first = max(0, len(rows) - self.visible_count()) if follow_end else 0
+        self.render()
+
+    def scroll_lines(self, delta: int):
+        self.first = min(max(0, self.first + delta), max(0, len(self.rows) - self.visible_count()))
+        self.render()
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.first = int(float(amount) * len(self.rows))
+            self.scroll_lines(0)
+        elif action == "scroll":
+            step = self.visible_count() if unit == "pages" else 1
+            self.scroll_lines(int(amount) * step)
+
+    def render(self):
+        total = len(self.rows)
+        count = self.visible_count()
+        window = [self.rows[i] for i in range(self.first, min(self.first + count, total))]
+        lines = self.fetch(window) if window else []
+        self.text.configure(state="normal")
+        self.text.delete("1.0", tk.END)
+        for n, (line, level) in enumerate(lines):
+            self.text.insert(tk.END, line + ("\n" if n < len(lines) - 1 else ""), f"level{level}")
+        self.text.configure(state="disabled")
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + count) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+# ---------- Start-Zeitmessung ----------
+# Analyzer-Meilenstein -> Meilenstein einer Startmessung
+LAUNCH_MILESTONES = {
+    "started": "client_started",
+    "connecting": "connecting",
+    "resources_done": "resources_downloaded",
+    "spawned": "spawned",
+}
+LAUNCH_LABELS = {
+    "client_started": "Client",
+    "connecting": "Verbinden",
+    "resources_downloaded": "Ressourcen",
+    "spawned": "Spawn",
+}
+CLEAN_TYPES = {"quick": "Schnell-Clean", "full": "Voll-Clean", "none": "ohne Clean"}
+
+
+class LaunchTracker:
+    """
+    Misst die Zeit vom Klick auf 'Starten' bis ins Spiel. Die Meilenstein-Zeiten
+    kommen aus den FiveM-Logs (Sitzungsstart + ms-Offset der Logzeile), jede
+    Messung wird mit dem vorangegangenen Clean (quick/full/none) markiert.
+    """
+
+    MAX_LAUNCHES = 100
+    TIMEOUT = 30 * 60
+
+    def __init__(self, history_file: Path):
+        self.history_file = history_file
+        data = load_json(history_file, {})
+        if data.get("version") != 1:
+            data = {"version": 1, "launches": [], "pending": None, "last_clean": "none"}
+        self.data = data
+
+    def note_clean(self, kind: str):
+        self.data["last_clean"] = kind
+        save_json(self.history_file, self.data)
+
+    def start(self, now=None):
+        self.data["pending"] = {
+            "launched_at": now or time.time(),
+            "clean": self.data.get("last_clean", "none"),
+            "milestones": {},
+        }
+        self.data["last_clean"] = "none"
+        save_json(self.history_file, self.data)
+
+    def observe(self, events, session_start) -> dict:
+        """
+        Analyzer-Ereignisse (Datei, Art, ms) übernehmen; session_start(name)
+        liefert die Startzeit der Logdatei. Gibt die abgeschlossene Messung
+        zurück, sobald 'spawned' erreicht ist.
+        """
+        pending = self.data["pending"]
+        if not pending:
+            return None
+        changed = False
+        for name, kind, ms in events:
+            milestone = LAUNCH_MILESTONES.get(kind)
+            started = session_start(name)
+            if milestone is None or started is None or milestone in pending["milestones"]:
+                continue
+            at = started + ms / 1000.0
+            # Ereignisse aus Sitzungen vor dem Klick ignorieren (1 s Toleranz für den Dateinamen)
+            if at < pending["launched_at"] - 1:
+                continue
+            pending["milestones"][milestone] = round(max(0.0, at - pending["launched_at"]), 1)
+            changed = True
+        if "spawned" in pending["milestones"]:
+            return self._finish(complete=True)
+        if changed:
+            save_json(self.history_file, self.data)
+        return None
+
+    def expire(self, now=None):
+        """Messung ohne Spawn nach TIMEOUT als unvollständig ablegen."""
+        pending = self.data["pending"]
+        if pending and (now or time.time()) - pending["launched_at"] > self.TIMEOUT:
+            return self._finish(complete=False)
+        return None
+
+    def _finish(self, complete: bool) -> dict:
+        launch = dict(self.data["pending"], complete=complete)
+        self.data["pending"] = None
+        self.data["launches"] = (self.data["launches"] + [launch])[-self.MAX_LAUNCHES:]
+        save_json(self.history_file, self.data)
+        return launch
+
+    def summary(self) -> str:
+        """Durchschnittliche Zeit bis zum Spawn je Clean-Art."""
+        per_type = {}
+        for launch in self.data["launches"]:
+            if launch.get("complete"):
+                per_type.setdefault(launch["clean"], []).append(launch["milestones"]["spawned"])
+        if not per_type:
+            return "Noch keine vollständige Startmessung."
+        parts = [
+            f"{CLEAN_TYPES.get(kind, kind)} {statistics.median(values):.0f} s ({len(values)}x)"
+            for kind, values in sorted(per_type.items())
+        ]
+        return "Bis ins Spiel (Median): " + " · ".join(parts)
+
+
+def format_launch(launch: dict) -> str:
+    marks = launch["milestones"]
+    parts = [f"{label} +{marks[name]:.0f} s" for name, label in LAUNCH_LABELS.items() if name in marks]
+    state = "" if launch.get("complete") else " (unvollständig)"
+    return f"Start nach {CLEAN_TYPES.get(launch['clean'], launch['clean'])}{state}: " + ", ".join(parts)
+
+
+# ---------- Profiling ----------
+PROFILE_KEEP = 20       # so viele Messungen bleiben in logs/ liegen
+PROFILE_TOP = 40        # Zeilen je Sortierung in der .txt-Zusammenfassung
+PROFILE_JOB_WAIT = 5.0  # Sekunden, die ein Job auf eine laufende Messung wartet
+# Jobs, deren Arbeit im Worker-Thread mitgemessen wird (cProfile misst nur den eigenen Thread)
+PROFILED_JOBS = {
+    "clean_quick", "clean_full", "support_bundle",
+    "update_check", "auto_update_check", "wallpaper_variants",
+}
+
+
+class ActionProfiler:
+    """
+    cProfile für Start und Aktionen (--profile oder versteckter Schalter im
+    Info-Tab). Jede Messung schreibt logs/profile_<name>_<zeit>.prof (roh,
+    z. B. für snakeviz) und eine sortierte .txt-Zusammenfassung daneben.
+    Es misst immer nur eine Aktion gleichzeitig: ab Python 3.12 erlaubt der
+    Interpreter nur einen aktiven cProfile-Profiler pro Prozess.
+    """
+
+    # Prozessweit (nicht je Thread/Instanz): belegt, solange eine Messung läuft
+    _busy = threading.Lock()
+    _owner = None       # Thread der laufenden Messung (verschachtelte Aufrufe laufen ungemessen)
+
+    def __init__(self, out_dir: Path, enabled: bool = False, keep: int = PROFILE_KEEP):
+        self.out_dir = out_dir
+        self.enabled = enabled
+        self.keep = keep
+        self._lock = threading.Lock()
+
+    def wants_job(self, key) -> bool:
+        return self.enabled and key in PROFILED_JOBS
+
+    def run(self, name: str, func, *args, **kwargs):
+        """
+        func messen (Tk-Thread, wartet nie). Läuft schon eine Messung
+        (verschachtelt oder in einem anderen Thread), wird func ungemessen
+        direkt ausgeführt.
+        """
+        return self._measure(name, 0, func, args, kwargs)
+
+    def run_job(self, name: str, func):
+        """Wie run, aber für Worker: wartet kurz, bis eine andere Messung fertig ist."""
+        return self._measure(name, PROFILE_JOB_WAIT, func, (), {})
+
+    def _measure(self, name: str, wait: float, func, args, kwargs):
+        if self._owner == threading.get_ident():
+            return func(*args, **kwargs)
+        acquired = self._busy.acquire(timeout=wait) if wait > 0 else self._busy.acquire(blocking=False)
+        if not acquired:
+            return func(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Anderes Profiling-Werkzeug aktiv (z. B. Debugger/externer Profiler)
+            self._busy.release()
+            return func(*args, **kwargs)
+        ActionProfiler._owner = threading.get_ident()
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - started
+            ActionProfiler._owner = None
+            # Auswerten und Schreiben erst nach der Freigabe: blockiert keine andere Messung
+            self._busy.release()
+            self.write(name, profile, elapsed)
+
+    def write(self, name: str, profile, elapsed: float):
+        base = self.out_dir / f"profile_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        stream = io.StringIO()
+        stream.write(f"{name}: {elapsed * 1000:.1f} ms (Thread {threading.current_thread().name})\n")
+        stats = pstats.Stats(profile, stream=stream).strip_dirs()
+        for sort in ("cumulative", "tottime"):
+            stream.write(f"\n===== sortiert nach {sort} =====\n")
+            stats.sort_stats(sort).print_stats(PROFILE_TOP)
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(base) + ".prof")
+            Path(str(base) + ".txt").write_text(stream.getvalue(), encoding="utf-8")
+        except OSError as e:
+            print("[WARN] Profil konnte nicht gespeichert werden:", e)
+            return
+        log_action(f"Profil gespeichert: {base.name} ({elapsed * 1000:.0f} ms)")
+        self.prune()
+
+    def files(self) -> list:
+        """Alle vorhandenen Messungen (.prof und .txt), älteste zuerst."""
+        try:
+            return sorted(self.out_dir.glob("profile_*.*"), key=lambda p: p.name)
+        except OSError:
+            return []
+
+    def prune(self):
+        with self._lock:
+            try:
+                runs = sorted(self.out_dir.glob("profile_*.prof"), key=lambda p: p.stat().st_mtime)
+            except OSError:
+                return
+            for old in runs[:max(0, len(runs) - self.keep)]:
+                for path in (old, old.with_suffix(".txt")):
+                    try:
+                        path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+
+
+def profiled(method):
+    """
+    LRToolbox-Aktion bei aktivem Profiling über self.profiler messen. Nur für
+    Methoden mit eigener Arbeit im Tk-Thread – Aktionen, die nur einen Job
+    einreihen, werden über PROFILED_JOBS im Worker gemessen.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = self.profiler
+        if not profiler.enabled:
+            return method(self, *args, **kwargs)
+        return profiler.run(method.__name__, method, self, *args, **kwargs)
+    return wrapper
+
+
+# ---------- Job-Scheduler ----------
+PRIO_HIGH = 0      # vom Nutzer ausgelöst (Clean, Support-Paket, manueller Update-Check)
+PRIO_NORMAL = 5    # Status-Poll, Hintergrund-Checks
+PRIO_LOW = 10      # Thumbnails, Wallpaper-Varianten
+
+_job_context = threading.local()
+
+
+class JobCancelled(Exception):
+    pass
+
+
+def raise_if_cancelled():
+    """Lange Jobs rufen das zwischendurch auf, um Abbrüche zu bemerken."""
+    job = getattr(_job_context, "job", None)
+    if job is not None and job.cancelled:
+        raise JobCancelled(job.key)
+
+
+class Job:
+    def __init__(self, key, func, priority, seq):
+        self.key = key
+        self.func = func
+        self.priority = priority
+        self.seq = seq
+        self.callbacks = []
+        self.cancelled = False
+        self.started = False
+        self.rerun = None       # Job mit neuen Daten, der nach diesem laufen soll
+
+    def cancel(self):
+        self.cancelled = True
+        if self.rerun is not None:
+            self.rerun.cancel()
+
+
+class JobScheduler:
+    """
+    Zentrale Hintergrundarbeit des Launchers:
+    - fester Pool von Worker-Threads, Jobs nach Priorität (kleiner = früher),
+    - Jobs mit gleichem Schlüssel werden zusammengelegt: ein wartender oder
+      laufender Job bekommt nur den zusätzlichen Callback,
+    - Abbruch wartender Jobs, laufende Jobs prüfen raise_if_cancelled(),
+    - Ergebnisse und Timer laufen über eine einzige Tk-Pumpe (after), so dass
+      Callbacks immer im Tk-Thread laufen und nie auf Arbeit warten.
+    """
+
+    def __init__(self, tk_root, workers: int = 3, pump_interval_ms: int = 50):
+        self.root = tk_root
+        self.pump_interval_ms = pump_interval_ms
+        self._heap = []
+        self._jobs = {}                 # Schlüssel -> wartender/laufender Job
+        self._results = queue.Queue()
+        self._timers = {}               # Schlüssel -> [fällig, Intervall|None, Funktion, ui, Callback, Priorität]
+        self._lock = threading.Condition()
+        self._seq = itertools.count()
+        self._stopped = False
+        self.profiler = None            # ActionProfiler: ausgewählte Jobs mitmessen
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"lr-job-{i}", daemon=True)
+            for i in range(max(1, int(workers)))
+        ]
+        for t in self._threads:
+            t.start()
+        self.root.after(self.pump_interval_ms, self._pump)
+
+    # --- Jobs ---
+    def submit(self, key, func, on_done=None, priority: int = PRIO_NORMAL, replace: bool = False) -> Job:
+        """
+        Job einreihen. on_done(result, error) läuft im Tk-Thread.
+        Gibt es den Schlüssel schon (wartend oder laufend), wird nur der
+        Callback angehängt und ggf. die Priorität angehoben – func wird dann
+        verworfen. Der Schlüssel muss also alle Daten des Jobs abdecken.
+        replace=True für Jobs, deren Daten sich ändern (neueste gewinnt):
+        ein wartender Job bekommt func, ein laufender wird danach mit func
+        erneut gestartet.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.cancelled and replace:
+                if job.started:
+                    if job.rerun is None:
+                        job.rerun = Job(key, func, priority, None)
+                    job = job.rerun
+                job.func = func
+            if job is not None and not job.cancelled:
+                if on_done:
+                    job.callbacks.append(on_done)
+                if not job.started and priority < job.priority:
+                    job.priority = priority
+                    if job.seq is not None:     # Rerun-Jobs kommen erst später in den Heap
+                        job.seq = next(self._seq)
+                        heapq.heappush(self._heap, (job.priority, job.seq, job))
+                        self._lock.notify()
+                return job
+            job = Job(key, func, priority, next(self._seq))
+            if on_done:
+                job.callbacks.append(on_done)
+            self._jobs[key] = job
+            heapq.heappush(self._heap, (job.priority, job.seq, job))
+            self._lock.notify()
+            return job
+
+    def cancel(self, key) -> bool:
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return False
+            job.cancel()
+            if not job.started:
+                self._jobs.pop(key, None)
+            return True
+
+    def is_active(self, key) -> bool:
+        with self._lock:
+            return key in self._jobs
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                while not self._stopped:
+                    if self._heap:
+                        _, seq, job = heapq.heappop(self._heap)
+                        # Veraltete Heap-Einträge (Priorität angehoben/abgebrochen) überspringen
+                        if seq == job.seq and not job.cancelled and not job.started:
+                            job.started = True
+                            break
+                    else:
+                        self._lock.wait()
+                else:
+                    return
+            _job_context.job = job
+            profiler = self.profiler
+            try:
+                if profiler is not None and profiler.wants_job(job.key):
+                    result, error = profiler.run_job(f"job_{job.key}", job.func), None
+                else:
+                    result, error = job.func(), None
+            except Exception as e:
+                result, error = None, e
+            finally:
+                _job_context.job = None
+            with self._lock:
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                    rerun = job.rerun
+                    if rerun is not None and not rerun.cancelled:
+                        rerun.seq = next(self._seq)
+                        self._jobs[job.key] = rerun
+                        heapq.heappush(self._heap, (rerun.priority, rerun.seq, rerun))
+                        self._lock.notify()
+                callbacks = list(job.callbacks)
+            if not job.cancelled:
+                self._results.put((callbacks, result, error))
+
+    # --- Timer ---
+    def every(self, key, interval_ms: int, func, ui: bool = False, on_done=None,
+              priority: int = PRIO_NORMAL, initial_delay_ms=None):
+        """
+        Wiederkehrende Aufgabe. ui=True: func läuft direkt im Tk-Thread (nur für
+        kurze UI-Arbeit), sonst wird sie als Job mit Schlüssel key eingereiht.
+        """
+        delay = interval_ms if initial_delay_ms is None else initial_delay_ms
+        self._timers[key] = [time.monotonic() + delay / 1000.0, interval_ms, func, ui, on_done, priority]
+
+    def later(self, delay_ms: int, key, func, ui: bool = False, on_done=None,
+              priority: int = PRIO_NORMAL):
+        """Einmalige Aufgabe nach delay_ms."""
+        self._timers[key] = [time.monotonic() + delay_ms / 1000.0, None, func, ui, on_done, priority]
+
+    def cancel_timer(self, key):
+        self._timers.pop(key, None)
+
+    # --- Tk-Pumpe ---
+    def _run_callback(self, func, *args):
+        try:
+            func(*args)
+        except Exception:
+            print("[WARN] Fehler in Callback:")
+            traceback.print_exc()
+
+    def _pump(self):
+        if self._stopped:
+            return
+        # Ergebnisse fertiger Jobs ausliefern
+        while True:
+            try:
+                callbacks, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            for cb in callbacks:
+                self._run_callback(cb, result, error)
+
+        # Fällige Timer
+        now = time.monotonic()
+        for key, timer in list(self._timers.items()):
+            due, interval, func, ui, on_done, priority = timer
+            if due > now:
+                continue
+            if interval is None:
+                self._timers.pop(key, None)
+            else:
+                timer[0] = now + interval / 1000.0
+            if ui:
+                self._run_callback(func)
+            else:
+                self.submit(key, func, on_done, priority)
+
+        self.root.after(self.pump_interval_ms, self._pump)
+
+    def shutdown(self):
+        """Wartende Jobs verwerfen, laufende zum Abbruch auffordern."""
+        with self._lock:
+            self._stopped = True
+            for job in self._jobs.values():
+                job.cancel()
+            self._jobs.clear()
+            self._heap.clear()
+            self._lock.notify_all()
+        self._timers.clear()
+
+
+# ---------- Serverstatus (mehrere Server, asyncio) ----------
+# Obergrenzen für gelesene Antwortgrößen (Bytes)
+STATUS_DYNAMIC_MAX_BYTES = 16 * 1024
+STATUS_INFO_MAX_BYTES = 512 * 1024
+STATUS_PLAYERS_MAX_BYTES = 2 * 1024 * 1024
+
+
+# Ein Client für den ganzen Launcher: Keep-Alive-Pool, gzip, DNS-Cache, Statistik.
+# Der Latenz-Test (LatencyProbe) misst bewusst frische Verbindungen und bleibt außen vor.
+HTTP = http_client.HttpClient(user_agent=f"{APP_NAME}/{APP_VERSION}")
+# Status: kein Retry, der nächste Poll kommt ohnehin (und wait_for begrenzt jeden Request)
+HTTP.configure("status", timeout=3.0, retries=0)
+HTTP.configure("update", timeout=5.0, retries=2, backoff=0.5)
+ResponseTooLarge = http_client.ResponseTooLarge
+
+
+def http_get(url: str, timeout: float, max_bytes=None, endpoint: str = "status") -> bytes:
+    """
+    Blockierender GET über den gemeinsamen Client, liefert den Body. Mit
+    max_bytes wird nie mehr als max_bytes + 1 gelesen; größere Antworten
+    werfen ResponseTooLarge.
+    """
+    return HTTP.get(url, endpoint=endpoint, timeout=timeout, max_bytes=max_bytes)
+
+
+def format_http_stats(stats: dict) -> str:
+    lines = []
+    for name, s in sorted(stats.items()):
+        lines.append(
+            f"{name}: {s['requests']} Requests, {s['errors']} Fehler, {s['retries']} Wiederholungen, "
+            f"{s['connects']} neue / {s['reused']} wiederverwendete Verbindungen, "
+            f"{format_bytes(s['bytes_wire'])} übertragen ({format_bytes(s['bytes_body'])} entpackt), "
+            f"Ø {s['avg_ms']:.0f} ms"
+        )
+    return "\n".join(lines) or "Noch keine HTTP-Requests."
+
+
+def parse_dynamic_status(dynamic: dict) -> dict:
+    """Spielerzahl + Maximalzahl aus dem kleinen dynamic.json."""
+    players = int(dynamic["clients"])
+    max_players = dynamic.get("sv_maxclients", dynamic.get("sv_maxClients"))
+    try:
+        max_players = int(max_players)
+    except (TypeError, ValueError):
+        max_players = players
+    return {"players": players, "max_players": max_players}
+
+
+def parse_server_status(info: dict, players) -> dict:
+    """Spielerzahl + Maximalzahl aus info.json / players.json."""
+    player_count = len(players) if isinstance(players, list) else 0
+    max_players = None
+
+    vars_section = info.get("vars", {}) if isinstance(info, dict) else {}
+
+    if "sv_maxClients" in vars_section:
+        try:
+            max_players = int(vars_section["sv_maxClients"])
+        except Exception:
+            max_players = None
+
+    if max_players is None and isinstance(info, dict) and "maxPlayers" in info:
+        try:
+            max_players = int(info["maxPlayers"])
+        except Exception:
+            max_players = None
+
+    if max_players is None:
+        max_players = player_count
+
+    return {"players": player_count, "max_players": max_players}
+
+
+async def fetch_server_status_async(server: dict, executor, semaphore, timeout: float,
+                                    mode: str = "lean") -> dict:
+    """
+    Status eines Servers. Jeder einzelne Request läuft unter dem globalen
+    Semaphore und hat sein eigenes Timeout.
+
+    mode "lean": nur dynamic.json (wenige hundert Bytes); players.json wird nur
+    geladen, wenn server['want_players'] gesetzt ist (Spielerliste offen).
+    mode "full" bzw. Fallback: info.json + players.json wie früher.
+    Gemessen werden übertragene Bytes und Parse-Zeit.
+    """
+    loop = asyncio.get_running_loop()
+    base = f"http://{server['endpoint']}"
+    status = dict(server, online=False, players=0, max_players=None, latency=None,
+                  error=None, bytes=0, parse_time=0.0, source=None)
+
+    async def get_json(path, max_bytes):
+        async with semaphore:
+            t0 = time.perf_counter()
+            body = await asyncio.wait_for(
+                loop.run_in_executor(executor, http_get, base + path, timeout, max_bytes), timeout
+            )
+            elapsed = time.perf_counter() - t0
+        status["bytes"] += len(body)
+        t0 = time.perf_counter()
+        data = json.loads(body.decode("utf-8", errors="ignore"))
+        status["parse_time"] += time.perf_counter() - t0
+        return data, elapsed
+
+    want_players = bool(server.get("want_players"))
+    try:
+        parsed = None
+        players = None
+        if mode == "lean":
+            try:
+                dynamic, latency = await get_json("/dynamic.json", STATUS_DYNAMIC_MAX_BYTES)
+                t0 = time.perf_counter()
+                parsed = parse_dynamic_status(dynamic)
+                status["parse_time"] += time.perf_counter() - t0
+                status["source"] = "dynamic.json"
+            except (http_client.HTTPStatusError, ValueError, KeyError, TypeError, AttributeError):
+                # Server ohne (brauchbares) dynamic.json → klassischer Weg
+                parsed = None
+
+        if parsed is None:
+            (info, latency), (players, _) = await asyncio.gather(
+                get_json("/info.json", STATUS_INFO_MAX_BYTES),
+                get_json("/players.json", STATUS_PLAYERS_MAX_BYTES),
+            )
+            t0 = time.perf_counter()
+            parsed = parse_server_status(info, players)
+            status["parse_time"] += time.perf_counter() - t0
+            status["source"] = "info.json+players.json"
+        elif want_players:
+            try:
+                players, _ = await get_json("/players.json", STATUS_PLAYERS_MAX_BYTES)
+            except (asyncio.TimeoutError, OSError, ValueError):
+                # Zahlen aus dynamic.json reichen für den Status, nur die Liste fehlt
+                players = None
+
+        status.update(parsed)
+        if want_players and isinstance(players, list):
+            status["player_list"] = sorted(
+                (str(p.get("name", "?")) for p in players if isinstance(p, dict)),
+                key=str.lower,
+            )
+        status["online"] = True
+        status["latency"] = latency
+    except asyncio.TimeoutError:
+        status["error"] = "Timeout"
+    except Exception as e:
+        status["error"] = str(e) or e.__class__.__name__
+    return status
+
+
+async def poll_servers_async(servers, concurrency: int = 4, timeout: float = 3.0,
+                             mode: str = "lean"):
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="status")
+    try:
+        return await asyncio.gather(*(
+            fetch_server_status_async(srv, executor, semaphore, timeout, mode) for srv in servers
+        ))
+    finally:
+        executor.shutdown(wait=False)
+
+
+def poll_servers(servers, concurrency: int = 4, timeout: float = 3.0, mode: str = "lean") -> dict:
+    """
+    Alle Server gleichzeitig abfragen. Die Gesamtdauer liegt nahe am
+    langsamsten Server statt an der Summe aller Server.
+    """
+    t0 = time.perf_counter()
+    statuses = list(asyncio.run(poll_servers_async(servers, concurrency, timeout, mode)))
+    return {
+        "servers": statuses,
+        "wall_time": time.perf_counter() - t0,
+        "bytes": sum(st["bytes"] for st in statuses),
+        "parse_time": sum(st["parse_time"] for st in statuses),
+    }
+
+
+# ---------- Statusverlauf ----------
+class StatusHistory:
+    """
+    Ringpuffer fester Größe für (Zeitstempel, online, Spieler, Latenz).
+    Die Werte liegen in vier array-Spalten statt in Python-Objekten; Speicher
+    und Dateigröße sind damit durch die Kapazität begrenzt (~15 Byte/Sample).
+    """
+
+    MAGIC = b"LRSH"
+    VERSION = 1
+    # magic, version, capacity, count, head
+    HEADER = struct.Struct("<4sHIII")
+    SAMPLE_BYTES = 8 + 1 + 2 + 4    # ts, online, players, latency
+    NO_LATENCY = -1.0
+
+    def __init__(self, capacity: int = 2880):
+        self.capacity = max(1, int(capacity))
+        self.ts = array("d", bytes(8 * self.capacity))
+        self.online = array("B", bytes(self.capacity))
+        self.players = array("H", bytes(2 * self.capacity))
+        self.latency = array("f", bytes(4 * self.capacity))  # ms, -1 = unbekannt
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, ts: float, online: bool, players: int, latency_ms=None):
+        i = self.head
+        self.ts[i] = float(ts)
+        self.online[i] = 1 if online else 0
+        self.players[i] = max(0, min(int(players or 0), 0xFFFF))
+        self.latency[i] = self.NO_LATENCY if latency_ms is None else float(latency_ms)
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def samples(self, since=None):
+        """Samples in zeitlicher Reihenfolge, optional erst ab Zeitstempel since."""
+        start = (self.head - self.count) % self.capacity
+        for n in range(self.count):
+            i = (start + n) % self.capacity
+            if since is not None and self.ts[i] < since:
+                continue
+            lat = self.latency[i]
+            yield self.ts[i], bool(self.online[i]), self.players[i], (None if lat < 0 else lat)
+
+    def memory_bytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.ts, self.online, self.players, self.latency))
+
+    def save(self, path: Path):
+        """Kompakt und atomar (tmp + replace) als Binärdatei schreiben."""
+        columns = [array(a.typecode, a) for a in (self.ts, self.online, self.players, self.latency)]
+        if sys.byteorder != "little":
+            for col in columns:
+                col.byteswap()
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp.open("wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.capacity, self.count, self.head))
+                for col in columns:
+                    f.write(col.tobytes())
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[WARN] Konnte Statusverlauf {path} nicht speichern:", e)
+
+    @classmethod
+    def load(cls, path: Path, capacity: int = 2880):
+        """Lädt den Verlauf; bei anderer Kapazität werden die neuesten Samples übernommen."""
+        history = cls(capacity)
+        try:
+            raw = path.read_bytes()
+            magic, version, cap, count, head = cls.HEADER.unpack_from(raw)
+            if magic != cls.MAGIC or version != cls.VERSION or cap < 1:
+                return history
+            # Abgeschnittene oder verlängerte Datei → leerer Verlauf statt halber Spalten
+            if len(raw) != cls.HEADER.size + cap * cls.SAMPLE_BYTES:
+                return history
+            stored = cls(cap)
+            offset = cls.HEADER.size
+            for col in (stored.ts, stored.online, stored.players, stored.latency):
+                size = col.itemsize * cap
+                col[:] = array(col.typecode, raw[offset:offset + size])
+                if len(col) != cap:
+                    return history
+                if sys.byteorder != "little":
+                    col.byteswap()
+                offset += size
+            stored.count, stored.head = min(count, cap), head % cap
+        except (OSError, struct.error, ValueError):
+            return history
+        if stored.capacity == history.capacity:
+            return stored
+        for ts, online, players, lat in stored.samples():
+            history.append(ts, online, players, lat)
+        return history
+
+
+class Sparkline:
+    """
+    Mini-Balkendiagramm der Spielerzahl (24 h in 15-Minuten-Buckets) im Header.
+    Neue Samples ändern nur den aktuellen Balken; beim Bucket-Wechsel werden
+    alle Balken mit einem einzigen move verschoben, statt neu zu zeichnen.
+    """
+
+    def __init__(self, parent, width=144, height=22, span=24 * 3600, buckets=96,
+                 fg="#00FFAA", bg="#000000"):
+        self.canvas = tk.Canvas(parent, width=width, height=height, bg=bg, highlightthickness=0)
+        self.width = width
+        self.height = height
+        self.buckets = buckets
+        self.bucket_seconds = span / buckets
+        self.bar_w = width / buckets
+        self.fg = fg
+        self.scale_max = 1
+        self.current = None     # absolute Bucket-Nummer des rechten Balkens
+        self.bars = {}          # Bucket-Nummer -> (Canvas-Item, Wert)
+
+    def _y(self, value):
+        return self.height - 1 - (self.height - 2) * min(value, self.scale_max) / self.scale_max
+
+    def set_scale(self, max_value):
+        # Nie unter den höchsten gezeichneten Wert, sonst würden Balken abgeschnitten
+        peak = max((v for _, v in self.bars.values()), default=0)
+        max_value = max(1, int(max_value or 1), peak)
+        if max_value == self.scale_max:
+            return
+        # Alle Balken in einem Aufruf um die Grundlinie skalieren
+        self.canvas.scale("bar", 0, self.height - 1, 1, self.scale_max / max_value)
+        self.scale_max = max_value
+
+    def add(self, ts: float, value: int):
+        bucket = int(ts // self.bucket_seconds)
+        if self.current is None:
+            self.current = bucket
+        elif bucket > self.current:
+            shift = bucket - self.current
+            self.canvas.move("bar", -shift * self.bar_w, 0)
+            self.current = bucket
+            for old in [b for b in self.bars if b <= bucket - self.buckets]:
+                self.canvas.delete(self.bars.pop(old)[0])
+        elif bucket <= self.current - self.buckets:
+            return
+        if value > self.scale_max:
+            self.set_scale(value)
+
+        x1 = self.width - (self.current - bucket) * self.bar_w
+        x0 = x1 - max(1.0, self.bar_w - 0.5)
+        item = self.bars.get(bucket)
+        if item is None:
+            rect = self.canvas.create_rectangle(
+                x0, self._y(value), x1, self.height - 1, fill=self.fg, width=0, tags="bar"
+            )
+            self.bars[bucket] = (rect, value)
+        elif value > item[1]:
+            self.canvas.coords(item[0], x0, self._y(value), x1, self.height - 1)
+            self.bars[bucket] = (item[0], value)
+
+
+# ---------- Netzwerk-Test (Latenz) ----------
+HTTP_STATUS_LINE = re.compile(rb"^HTTP/\d(?:\.\d)?\s+(\d{3})")
+
+
+def split_endpoint(endpoint: str, default_port: int = 30120):
+    """'host:port' -> (host, port); ValueError bei leerem Host oder ungültigem Port."""
+    host, _, port = (endpoint or "").strip().partition(":")
+    if not host:
+        raise ValueError(f"Kein Host in '{endpoint}'")
+    try:
+        port = int(port) if port else default_port
+    except ValueError:
+        raise ValueError(f"Ungültiger Port in '{endpoint}'") from None
+    if not 0 < port < 65536:
+        raise ValueError(f"Ungültiger Port in '{endpoint}'")
+    return host, port
+
+
+def percentile(values, pct: float):
+    """Perzentil mit linearer Interpolation (pct in 0..100)."""
+    if not values:
+        return None
+    data = sorted(values)
+    k = (len(data) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(data) - 1)
+    return data[lo] + (data[hi] - data[lo]) * (k - lo)
+
+
+def summarize_latency(values) -> dict:
+    """min / median / p95 / jitter (mittlere Abweichung aufeinanderfolgender Werte) in Sekunden."""
+    if not values:
+        return {"min": None, "median": None, "p95": None, "jitter": None}
+    diffs = [abs(b - a) for a, b in zip(values, values[1:])]
+    return {
+        "min": min(values),
+        "median": statistics.median(values),
+        "p95": percentile(values, 95),
+        "jitter": statistics.mean(diffs) if diffs else 0.0,
+    }
+
+
+class LatencyProbe:
+    """
+    Misst DNS-Zeit, TCP-Connect-RTT und HTTP-Time-to-first-byte gegen den
+    Gameserver. Kennt kein Tk und lässt sich gegen jeden lokalen HTTP-Server testen.
+    """
+
+    def __init__(self, host: str, port: int, path: str = "/info.json",
+                 samples: int = 10, interval: float = 0.2, timeout: float = 3.0):
+        self.host = host
+        self.port = int(port)
+        self.path = path
+        self.samples = max(1, int(samples))
+        self.interval = interval
+        self.timeout = timeout
+
+    def sample(self) -> dict:
+        """Eine Messung; bei Fehlern enthält das Ergebnis 'error'."""
+        result = {}
+        t0 = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            return {"error": f"DNS: {e}"}
+        result["dns"] = time.perf_counter() - t0
+        family, socktype, proto, _, addr = infos[0]
+
+        sock = socket.socket(family, socktype, proto)
+        sock.settimeout(self.timeout)
+        try:
+            t0 = time.perf_counter()
+            sock.connect(addr)
+            result["connect"] = time.perf_counter() - t0
+
+            request = (
+                f"GET {self.path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                "Connection: close\r\nUser-Agent: LRToolbox\r\n\r\n"
+            ).encode("ascii")
+            t0 = time.perf_counter()
+            sock.sendall(request)
+            head = sock.recv(1)
+            if not head:
+                raise ConnectionError("Verbindung ohne Antwort geschlossen")
+            result["ttfb"] = time.perf_counter() - t0
+            # Rest der Antwort abholen, damit der Server sauber schließen kann
+            drained = 0
+            while drained < 64 * 1024:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                if len(head) < 64:
+                    head += chunk[:64]
+                drained += len(chunk)
+            match = HTTP_STATUS_LINE.match(head)
+            if not match:
+                raise ConnectionError("Keine gültige HTTP-Antwort")
+            status = int(match.group(1))
+            if status >= 400:
+                result["error"] = f"HTTP {status}"
+        except (OSError, ConnectionError) as e:
+            result["error"] = str(e) or e.__class__.__name__
+        finally:
+            sock.close()
+        return result
+
+    def run(self) -> dict:
+        """Mehrere Messungen + Auswertung (min, median, p95, jitter, Verlust)."""
+        values = {"dns": [], "connect": [], "ttfb": []}
+        errors = []
+        for i in range(self.samples):
+            res = self.sample()
+            if "error" in res:
+                errors.append(res["error"])
+            else:
+                for key in values:
+                    values[key].append(res[key])
+            if i + 1 < self.samples and self.interval:
+                time.sleep(self.interval)
+        return {
+            "endpoint": f"{self.host}:{self.port}",
+            "samples": self.samples,
+            "lost": len(errors),
+            "loss_pct": len(errors) / self.samples * 100.0,
+            "errors": errors,
+            "dns": summarize_latency(values["dns"]),
+            "connect": summarize_latency(values["connect"]),
+            "ttfb": summarize_latency(values["ttfb"]),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        }
+
+
+def format_latency_report(report: dict) -> str:
+    def ms(v):
+        return f"{'-':>7}" if v is None else f"{v * 1000:7.1f}"
+
+    lines = [
+        f"Netzwerk-Test {report['endpoint']} ({report['timestamp']})",
+        f"Messungen: {report['samples']}, Verlust: {report['lost']} ({report['loss_pct']:.0f} %)",
+        "",
+        f"{'(ms)':<12}{'min':>7}  {'median':>7}  {'p95':>7}  {'jitter':>7}",
+    ]
+    for key, label in (("dns", "DNS"), ("connect", "TCP-Connect"), ("ttfb", "HTTP TTFB")):
+        st = report[key]
+        lines.append(
+            f"{label:<12}{ms(st['min'])}  {ms(st['median'])}  {ms(st['p95'])}  {ms(st['jitter'])}"
+        )
+    if report["errors"]:
+        lines.append("")
+        lines.append("Fehler: " + "; ".join(sorted(set(report["errors"]))[:3]))
+    return "\n".join(lines)
+
+
 class LRToolbox(tk.Tk):
-    def __init__(self):
+    def __init__(self, instance=None, profiler=None):
+        self.profiler = profiler or ActionProfiler(LOGS_DIR)
         super().__init__()
         self.title(f"{APP_NAME} – {APP_VERSION}")
         self.geometry("1200x750")
@@ -104,6 +2826,10 @@ class LRToolbox(tk.Tk):
 
         self.user_settings = load_json(USER_SETTINGS_FILE, DEFAULT_SETTINGS)
 
+        # Zentrale Hintergrundarbeit (Worker-Pool + Tk-Pumpe)
+        self.jobs = JobScheduler(self, workers=int(self.user_settings.get("worker_threads", 3)))
+        self.jobs.profiler = self.profiler
+
         # Musik-Einstellungen
         music_cfg = self.user_settings.get("music", {})
         self.music_enabled = bool(music_cfg.get("enabled", True))
@@ -116,6 +2842,19 @@ class LRToolbox(tk.Tk):
         # Status-Variablen (für Header)
         self.server_status_var = tk.StringVar(value="Status: unbekannt")
         self.players_var = tk.StringVar(value="Spieler: ?/?")
+        self.other_servers_var = tk.StringVar(value="")
+        self.last_server_status = None
+        # Roher Status + Zeitpunkt für den Snapshot; "(Stand …)" gibt es nur in der Anzeige
+        self.server_status_text = None
+        self.server_status_at = None
+        self.player_list_window = None
+        self.poll_stats_var = tk.StringVar(value="Noch keine Statusabfrage.")
+
+        # Statusverlauf (Ringpuffer, überlebt Neustarts)
+        self.status_history = StatusHistory.load(
+            STATUS_HISTORY_FILE, int(self.user_settings.get("status_history_capacity", 2880))
+        )
+        self._history_unsaved = 0
 
         # Announcements
         self.announcements = []
@@ -125,8 +2864,50 @@ class LRToolbox(tk.Tk):
             value="Lege Einträge in config/announcements.json an."
         )
 
-        # Wallpaper-Thumbnails müssen referenziert bleiben
-        self.wallpaper_images = []
+        # Wallpaper-Kacheln (Pfad -> Widgets + Thumbnail, das referenziert bleiben muss)
+        self.wallpaper_tiles = {}
+        self.wallpaper_empty_label = None
+        self._wallpaper_dir_mtime = None
+        self._wallpaper_import_queue = []     # Auswahl, die während eines Imports kam
+        self._thumb_placeholder = None
+        # Vorschaubilder im RAM: LRU mit Byte-Budget, unsichtbare werden verdrängt
+        self.thumb_images = ImageBudgetCache(
+            int(self.user_settings.get("thumbnail_cache_mb", 24)) * 1024 * 1024
+        )
+        self._thumb_refresh_pending = False
+
+        # Laufende Clean-Aktion
+        self.clean_status_var = tk.StringVar(value="")
+
+        # Asset-Prüfung
+        self.asset_status_var = tk.StringVar(value="Asset-Prüfung läuft...")
+
+        # Netzwerk-Test
+        self.network_test_var = tk.StringVar(value="Noch kein Netzwerk-Test durchgeführt.")
+
+        # Crashdump-Index (überlebt Cleans, liegt in data/)
+        self.crash_index = CrashIndex(CRASH_INDEX_FILE, CRASH_SAMPLES_DIR)
+        self.crash_status_var = tk.StringVar(value="")
+
+        # FiveM-Log-Auswertung (Offsets bleiben über Neustarts erhalten)
+        self.fivem_logs = FiveMLogAnalyzer(FIVEM_LOG_STATE_FILE)
+        self.fivem_log_var = tk.StringVar(value=format_log_session(self.fivem_logs.latest_session()))
+
+        # Zeitmessung Start -> im Spiel
+        self.launch_tracker = LaunchTracker(LAUNCH_HISTORY_FILE)
+        self.launch_stats_var = tk.StringVar(value=self.launch_tracker.summary())
+
+        # Log-Viewer: Anzeigename -> LogIndex
+        self.log_indexes = {}
+
+        # Speicher-Diagnose: RSS-Verlauf (letzte Stunde bei 60-s-Takt)
+        if self.user_settings.get("memory_tracing", False) and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.rss_samples = collections.deque(maxlen=60)
+
+        # Spielmodus: solange FiveM läuft, ruht der Launcher
+        self.game_running = False
+        self._music_paused_for_game = False
 
         # Update-Status
         self.update_status_var = tk.StringVar(
@@ -138,16 +2919,39 @@ class LRToolbox(tk.Tk):
 
         # UI bauen
         self._build_ui()
-        self.update_system_info()
-        self.load_wallpapers()
-        self.load_announcements()
 
-        # Polls starten
-        self.poll_server_status()
+        # Letzten Stand sofort zeigen, frische Daten kommen nach dem ersten Zeichnen
+        self.apply_ui_snapshot(load_json(UI_SNAPSHOT_FILE, None))
+        self.jobs.later(0, "startup_refresh", self.startup_refresh, ui=True)
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Befehle weiterer Launcher-Starts (Single-Instance)
+        self.instance = instance
+        if instance is not None:
+            self.jobs.every("instance_commands", 200, self.handle_instance_commands, ui=True)
+
+        # Polls starten (alle Timer laufen über den Scheduler)
+        self.start_status_polling()
         self.start_announcement_rotation()
+        if self.user_settings.get("low_resource_while_gaming", True):
+            self.jobs.every(
+                "game_watch", GAME_WATCH_INTERVAL_MS, fivem_running,
+                on_done=self._game_watch_result, priority=PRIO_LOW, initial_delay_ms=2000,
+            )
 
         # Auto-Update-Check einmal beim Start
-        self.after(2000, self.auto_check_for_updates)
+        self.jobs.later(2000, "auto_update_timer", self.auto_check_for_updates, ui=True)
+
+        # Asset-Prüfung erst nach dem ersten Zeichnen
+        self.jobs.later(1000, "verify_assets_timer", self.verify_assets_in_background, ui=True)
+        self.jobs.every("memory_sample", 60000, self.sample_memory, ui=True, initial_delay_ms=5000)
+
+        # FiveM-Logs mitlesen
+        self.jobs.every(
+            "fivem_logs", FIVEM_LOG_INTERVAL_MS, self.poll_fivem_logs,
+            on_done=self._fivem_logs_polled, priority=PRIO_LOW, initial_delay_ms=3000,
+        )
 
     # ---------- FiveM & System ----------
     def detect_fivem_root(self):
@@ -199,6 +3003,15 @@ class LRToolbox(tk.Tk):
         return bool(self.fivem_root and self.fivem_root.exists())
 
     def update_system_info(self):
+        """Systeminfo im Hintergrund sammeln (Laufwerksabfrage kann hängen) und anzeigen."""
+        self.jobs.submit(
+            "system_info",
+            self.collect_system_info,
+            lambda text, error: self.show_system_info(text if not error else f"Systeminfo nicht lesbar: {error}"),
+            priority=PRIO_NORMAL,
+        )
+
+    def collect_system_info(self) -> str:
         text_lines = []
         if self.fivem_root and self.fivem_root.exists():
             text_lines.append(f"FiveM gefunden unter:\n{self.fivem_root}")
@@ -222,65 +3035,111 @@ class LRToolbox(tk.Tk):
         else:
             text_lines.append("FiveM-Installation wurde nicht automatisch gefunden.")
             text_lines.append("Du kannst den Pfad in den Einstellungen manuell auswählen.")
+        return "\n".join(text_lines)
 
+    def show_system_info(self, text: str):
         self.system_text.configure(state="normal")
         self.system_text.delete("1.0", tk.END)
-        self.system_text.insert("1.0", "\n".join(text_lines))
-        self.system_text.configure(state="disabled")
-
-    # ---------- Serverstatus ----------
-    def poll_server_status(self):
-        """
-        Fragt direkt den FiveM-Server ab (info.json + players.json)
-        und aktualisiert Status + Spielerzahl.
-        """
-        ip = "45.152.160.250"
-        port = 30120
-
-        status_text = "Status: OFFLINE"
-        players_text = "Spieler: 0/?"
-
-        try:
-            with urllib.request.urlopen(
-                f"http://{ip}:{port}/info.json", timeout=3
-            ) as resp:
-                info = json.loads(resp.read().decode("utf-8", errors="ignore"))
-
-            with urllib.request.urlopen(
-                f"http://{ip}:{port}/players.json", timeout=3
-            ) as resp:
-                players = json.loads(resp.read().decode("utf-8", errors="ignore"))
-
-            player_count = len(players)
-            max_players = None
-
-            vars_section = info.get("vars", {})
+        self.system_text.insert("1.0", text)
+        self.system_text.configure(state="disabled")
 
-            if "sv_maxClients" in vars_section:
-                try:
-                    max_players = int(vars_section["sv_maxClients"])
-                except Exception:
-                    max_players = None
+    # ---------- Serverstatus ----------
+    def server_list(self):
+        """
+        Konfigurierte Server (user_settings 'servers'), der erste bzw. der mit
+        'main': true ist der LaRue-Hauptserver für den Header.
+        """
+        servers = []
+        for entry in self.user_settings.get("servers") or []:
+            if isinstance(entry, dict) and entry.get("endpoint"):
+                servers.append({
+                    "name": str(entry.get("name") or entry["endpoint"]),
+                    "endpoint": str(entry["endpoint"]),
+                    "main": bool(entry.get("main", False)),
+                })
+        if not servers:
+            # Ältere Einstellungen kennen nur 'server_endpoint'
+            endpoint = str(self.user_settings.get("server_endpoint") or LARUE_ENDPOINT)
+            servers = [{"name": "LaRue", "endpoint": endpoint, "main": True}]
+        if not any(srv["main"] for srv in servers):
+            servers[0]["main"] = True
+        return servers
+
+    def start_status_poll(self):
+        """
+        Fragt alle konfigurierten FiveM-Server parallel ab (asyncio im
+        Hintergrund) und aktualisiert Header + Nebenserver in einem Rutsch.
+        Läuft alle 30 s über den Scheduler; ein laufender Poll wird nicht
+        doppelt gestartet.
+        """
+        if self.jobs.is_active("status_poll"):
+            return
 
-            if max_players is None and "maxPlayers" in info:
-                try:
-                    max_players = int(info["maxPlayers"])
-                except Exception:
-                    max_players = None
+        servers = self.server_list()
+        concurrency = int(self.user_settings.get("status_concurrency", 4))
+        timeout = float(self.user_settings.get("status_timeout", 3.0))
+        mode = str(self.user_settings.get("status_mode", "lean"))
+        for srv in servers:
+            # players.json nur, wenn die Spielerliste gerade angezeigt wird
+            srv["want_players"] = srv["main"] and self.player_list_window is not None
+
+        def done(result, error):
+            if self.game_running:
+                # Poll lief beim Spielstart schon – Ergebnis nicht mehr anzeigen
+                return
+            if error:
+                result = {"servers": [
+                    dict(srv, online=False, players=0, max_players=None, error=str(error))
+                    for srv in servers
+                ], "wall_time": 0.0, "bytes": 0, "parse_time": 0.0}
+            self.apply_server_status(result)
+
+        self.jobs.submit(
+            "status_poll",
+            lambda: poll_servers(servers, concurrency=concurrency, timeout=timeout, mode=mode),
+            done,
+            priority=PRIO_NORMAL,
+        )
 
-            if max_players is None:
-                max_players = player_count
+    def apply_server_status(self, result: dict):
+        """Ein kombiniertes Status-Update für alle Server in die UI übernehmen."""
+        statuses = result.get("servers") or []
+        self.last_server_status = result
+        main = next((st for st in statuses if st.get("main")), None)
 
+        status_text = "Status: OFFLINE"
+        players_text = "Spieler: 0/?"
+        if main and main.get("online"):
             status_text = "Status: ONLINE"
-            players_text = f"Spieler: {player_count}/{max_players}"
-
-        except Exception:
-            status_text = "Status: OFFLINE"
-            players_text = "Spieler: 0/?"
+            players_text = f"Spieler: {main['players']}/{main['max_players']}"
 
+        self.server_status_text = status_text
+        self.server_status_at = datetime.now().isoformat(timespec="seconds")
         self.server_status_var.set(status_text)
         self.players_var.set(players_text)
 
+        others = []
+        for st in statuses:
+            if st.get("main"):
+                continue
+            if st.get("online"):
+                others.append(f"{st['name']}: {st['players']}/{st['max_players']}")
+            else:
+                others.append(f"{st['name']}: OFFLINE")
+        self.other_servers_var.set(" · ".join(others))
+
+        if main:
+            self.record_status_sample(main)
+            if self.player_list_window is not None:
+                self.update_player_list(main)
+
+        self.poll_stats_var.set(
+            f"Letzte Statusabfrage: {len(statuses)} Server, {format_bytes(result.get('bytes', 0))} "
+            f"übertragen, Parsen {result.get('parse_time', 0.0) * 1000:.2f} ms, "
+            f"Dauer {result.get('wall_time', 0.0) * 1000:.0f} ms"
+            + (f" ({main['source']})" if main and main.get("source") else "")
+        )
+
         # Farben für Dot & Text je nach Status setzen
         try:
             if "ONLINE" in status_text:
@@ -297,7 +3156,458 @@ class LRToolbox(tk.Tk):
         except Exception:
             pass
 
-        self.after(30000, self.poll_server_status)
+    # ---------- Spielerliste ----------
+    def show_player_list(self, event=None):
+        """Spielerliste öffnen; solange sie offen ist, lädt der Poll players.json mit."""
+        if self.player_list_window is not None:
+            self.player_list_window.lift()
+            return
+        win = tk.Toplevel(self)
+        win.title(f"{APP_NAME} – Spielerliste")
+        win.configure(bg="#111111")
+        win.geometry("320x420")
+
+        self.player_list_var = tk.StringVar(value="Lade Spielerliste...")
+        tk.Label(
+            win, textvariable=self.player_list_var, fg="#FFFFFF", bg="#111111", font=FONT_H2
+        ).pack(anchor="w", padx=10, pady=(10, 5))
+
+        self.player_listbox = tk.Listbox(
+            win, bg="#111111", fg="#DDDDDD", font=FONT_TEXT, highlightthickness=0
+        )
+        self.player_listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+
+        def close():
+            self.player_list_window = None
+            win.destroy()
+
+        win.protocol("WM_DELETE_WINDOW", close)
+        self.player_list_window = win
+        # Sofort abfragen, nicht erst beim nächsten 30-s-Poll
+        self.start_status_poll()
+
+    def update_player_list(self, status: dict):
+        names = status.get("player_list")
+        if not status.get("online"):
+            self.player_list_var.set("Server offline.")
+            names = []
+        elif names is None:
+            return
+        else:
+            self.player_list_var.set(f"Spieler online: {len(names)}/{status.get('max_players')}")
+        self.player_listbox.delete(0, tk.END)
+        for name in names:
+            self.player_listbox.insert(tk.END, name)
+
+    def record_status_sample(self, status: dict):
+        """Sample in den Verlauf schreiben und den Sparkline-Balken nachziehen."""
+        now = time.time()
+        latency = status.get("latency")
+        latency_ms = latency * 1000 if latency is not None else None
+        players = status.get("players", 0) if status.get("online") else 0
+        self.status_history.append(now, status.get("online", False), players, latency_ms)
+
+        if hasattr(self, "sparkline"):
+            if status.get("max_players"):
+                self.sparkline.set_scale(status["max_players"])
+            self.sparkline.add(now, players)
+
+        # Alle 10 Samples (~5 min) sichern, damit ein Absturz wenig kostet
+        self._history_unsaved += 1
+        if self._history_unsaved >= 10:
+            self.status_history.save(STATUS_HISTORY_FILE)
+            self._history_unsaved = 0
+
+    def fill_sparkline_from_history(self):
+        since = time.time() - 24 * 3600
+        for ts, online, players, _ in self.status_history.samples(since=since):
+            self.sparkline.add(ts, players if online else 0)
+
+    # ---------- Start-Snapshot ----------
+    @profiled
+    def startup_refresh(self):
+        """Alle Bereiche mit frischen Daten nachladen (läuft nach dem ersten Zeichnen)."""
+        self.update_system_info()
+        self.load_wallpapers()
+        self.load_announcements()
+        self.check_ui_profile()
+        self.update_crash_index()
+        if self.user_settings.get("auto_clean_on_start", False):
+            self.auto_clean_check()
+
+    def build_ui_snapshot(self) -> dict:
+        status = self.last_server_status or {}
+        try:
+            system_info = self.system_text.get("1.0", tk.END).strip()
+        except tk.TclError:
+            system_info = ""
+        return {
+            "version": 1,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "server": {
+                "status": self.server_status_text or "",
+                "status_at": self.server_status_at,
+                "players": self.players_var.get(),
+                "others": self.other_servers_var.get(),
+                "online": "ONLINE" in (self.server_status_text or ""),
+                "servers": [
+                    {k: st.get(k) for k in ("name", "main", "online", "players", "max_players")}
+                    for st in status.get("servers", [])
+                ],
+            },
+            "announcements": self.announcements,
+            "announcement_index": self.current_announcement_index,
+            "system_info": system_info,
+            "thumbnails": [
+                {"path": str(path), "stat": list(tile["stat"]), "cache": tile["thumb_cache"].name}
+                for path, tile in sorted(self.wallpaper_tiles.items())
+                if tile.get("image") is not None and tile.get("thumb_cache") is not None
+            ],
+        }
+
+    def save_ui_snapshot(self):
+        try:
+            save_json(UI_SNAPSHOT_FILE, self.build_ui_snapshot())
+        except Exception as e:
+            print("[WARN] Konnte UI-Snapshot nicht speichern:", e)
+
+    def apply_ui_snapshot(self, snapshot):
+        """Zustand vom letzten Beenden anzeigen, bis frische Daten da sind."""
+        if not isinstance(snapshot, dict) or snapshot.get("version") != 1:
+            return
+        server = snapshot.get("server") or {}
+        if server.get("status"):
+            # Ältere Snapshots haben den Zusatz schon (ggf. mehrfach) im Text
+            self.server_status_text = re.sub(r"(\s*\(Stand [^)]*\))+$", "", str(server["status"]))
+            self.server_status_at = str(server.get("status_at") or snapshot.get("saved_at", ""))
+            at = self.server_status_at
+            stamp = at[11:16] if len(at) >= 16 else at
+            self.server_status_var.set(f"{self.server_status_text} (Stand {stamp})")
+            self.players_var.set(server.get("players", self.players_var.get()))
+            self.other_servers_var.set(server.get("others", ""))
+            # Gedämpfte Farben: Wert ist vom letzten Start, nicht live
+            self.status_dot.config(fg="#2E7D64" if server.get("online") else "#8A3A3A")
+
+        announcements = snapshot.get("announcements")
+        if isinstance(announcements, list) and announcements:
+            self.set_announcements(announcements, int(snapshot.get("announcement_index", 0) or 0))
+
+        if snapshot.get("system_info"):
+            self.show_system_info(snapshot["system_info"])
+
+        for entry in snapshot.get("thumbnails") or []:
+            try:
+                path = Path(entry["path"])
+                stat = tuple(entry["stat"])
+            except (KeyError, TypeError):
+                continue
+            cache_file = THUMB_CACHE_DIR / entry.get("cache", "")
+            if not cache_file.is_file():
+                continue
+            tile = self._create_wallpaper_tile(path)
+            tile["stat"] = stat
+            tile["thumb_cache"] = cache_file
+            self.wallpaper_tiles[path] = tile
+        if self.wallpaper_tiles:
+            # Nur Platzhalter setzen; geladen werden (wie beim Scrollen) nur die
+            # sichtbaren Kacheln, im Rahmen des Bild-Budgets
+            self._layout_wallpaper_tiles()
+            self.schedule_thumbnail_refresh()
+
+    # ---------- Single-Instance ----------
+    def handle_instance_commands(self):
+        for command in self.instance.poll_commands():
+            self.run_instance_command(command)
+
+    def run_instance_command(self, command: str):
+        """Befehl eines zweiten Launcher-Starts (oder der eigenen Kommandozeile) ausführen."""
+        log_action(f"Befehl von weiterem Launcher-Start: {command}")
+        if command == "quick_clean":
+            self.quick_clean_and_start()
+        elif command == "full_clean":
+            self.full_clean()
+        elif command == "connect":
+            self.start_larue_only()
+        self.bring_to_front()
+
+    def bring_to_front(self):
+        try:
+            self.deiconify()
+            self.lift()
+            self.attributes("-topmost", True)
+            self.after_idle(self.attributes, "-topmost", False)
+            self.focus_force()
+        except tk.TclError:
+            pass
+
+    # ---------- Beenden ----------
+    def on_close(self):
+        self.jobs.shutdown()
+        HTTP.close()
+        self.status_history.save(STATUS_HISTORY_FILE)
+        self.save_ui_snapshot()
+        if self.instance is not None:
+            self.instance.release()
+        self.destroy()
+
+    # ---------- Asset-Prüfung ----------
+    def verify_assets_in_background(self):
+        """Assets gegen assets/manifest.json prüfen, ohne den Start zu bremsen."""
+        manifest = load_json(ASSET_MANIFEST_FILE, None)
+        if not manifest:
+            self.asset_status_var.set("Asset-Prüfung: kein assets/manifest.json vorhanden.")
+            return
+
+        def work():
+            state = load_json(ASSET_STATE_FILE, {})
+            report = verify_assets(ASSETS_DIR, manifest, state)
+            save_json(ASSET_STATE_FILE, state)
+            return report
+
+        def done(report, error):
+            if error:
+                self.asset_status_var.set(f"Asset-Prüfung fehlgeschlagen: {error}")
+                return
+            problems = report["missing"] + [rel for rel, _ in report["corrupt"]]
+            if problems:
+                self.asset_status_var.set(
+                    "Asset-Prüfung: beschädigt/fehlend: " + ", ".join(problems)
+                    + " – bitte Launcher neu herunterladen."
+                )
+                self.asset_status_label.config(fg="#FF5252")
+                for rel in report["missing"]:
+                    log_action(f"Asset fehlt: {rel}")
+                for rel, reason in report["corrupt"]:
+                    log_action(f"Asset beschädigt: {rel} ({reason})")
+            else:
+                self.asset_status_var.set(
+                    f"Asset-Prüfung: {len(report['ok'])} Dateien in Ordnung "
+                    f"({report['rehashed']} neu geprüft)."
+                )
+
+        self.jobs.submit("verify_assets", work, done, priority=PRIO_LOW)
+
+    # ---------- Netzwerk-Test ----------
+    def run_network_test(self):
+        """Latenz-Messung zum Gameserver im Hintergrund, Bericht als Popup + logs/network_report.txt."""
+        if getattr(self, "_network_test_running", False):
+            return
+        try:
+            host, port = split_endpoint(self.server_endpoint())
+        except ValueError as e:
+            self.network_test_var.set(f"Netzwerk-Test nicht möglich: {e}")
+            return
+        probe = LatencyProbe(host, port, samples=10)
+        self.network_test_var.set("Netzwerk-Test läuft...")
+
+        def done(report, error):
+            self._network_test_running = False
+            if error:
+                self.network_test_var.set(f"Netzwerk-Test fehlgeschlagen: {error}")
+                return
+            text = format_latency_report(report)
+            median = report["connect"]["median"]
+            self.network_test_var.set(
+                f"Letzter Netzwerk-Test: Ping {median * 1000:.0f} ms, Verlust {report['loss_pct']:.0f} %"
+                if median is not None
+                else f"Letzter Netzwerk-Test: Server nicht erreichbar ({report['lost']}/{report['samples']} verloren)"
+            )
+            text += "\n\nHTTP-Client (seit Start):\n" + format_http_stats(HTTP.stats())
+            try:
+                LOGS_DIR.mkdir(parents=True, exist_ok=True)
+                (LOGS_DIR / "network_report.txt").write_text(text, encoding="utf-8")
+            except OSError:
+                pass
+            log_action(
+                f"Netzwerk-Test {report['endpoint']}: Verlust {report['loss_pct']:.0f} %\n{text}"
+            )
+            messagebox.showinfo(APP_NAME, text)
+
+        self._network_test_running = True
+        try:
+            self.jobs.submit("network_test", probe.run, done, priority=PRIO_HIGH)
+        except Exception:
+            self._network_test_running = False
+            raise
+
+    # ---------- Crashdumps ----------
+    def index_crash_dumps(self) -> list:
+        """Neue Dumps aus FiveM.app/crashes in den Index übernehmen (Worker-Thread)."""
+        dirs = self.fivem_app_dirs()
+        if dirs is None:
+            return []
+        return self.crash_index.scan(dirs[0] / "crashes")
+
+    def update_crash_index(self):
+        def work():
+            new = self.index_crash_dumps()
+            with self.crash_index.lock:
+                sigs = self.crash_index.data["signatures"]
+                total = sum(s["count"] for s in sigs.values())
+                count = len(sigs)
+            return new, self.crash_index.summary(), total, count
+
+        def done(result, error):
+            if error:
+                self.crash_status_var.set(f"Crash-Index fehlgeschlagen: {error}")
+                return
+            new, summary, total, count = result
+            self.crash_status_var.set(
+                f"Crashes: {total} erfasst, {count} Signaturen"
+                + (f", {len(new)} neu" if new else "")
+            )
+            if new:
+                log_action(f"Crash-Index: {len(new)} neue Dumps\n{summary}")
+
+        self.jobs.submit("crash_index", work, done, priority=PRIO_LOW)
+
+    def show_crash_summary(self):
+        def done(summary, error):
+            if error:
+                messagebox.showerror(APP_NAME, f"Crash-Übersicht fehlgeschlagen:\n{error}")
+                return
+            messagebox.showinfo(APP_NAME, summary)
+
+        self.jobs.submit(
+            "crash_summary",
+            lambda: (self.index_crash_dumps(), self.crash_index.summary())[1],
+            done,
+            priority=PRIO_HIGH,
+        )
+
+    # ---------- FiveM-Logs ----------
+    def poll_fivem_logs(self) -> list:
+        """Neue Zeilen aus FiveM.app/logs auswerten (Worker-Thread)."""
+        dirs = self.fivem_app_dirs()
+        if dirs is None:
+            return []
+        return self.fivem_logs.poll(dirs[0] / "logs")
+
+    def _fivem_logs_polled(self, events, error):
+        if error:
+            return
+        launch = self.launch_tracker.observe(events or [], self.fivem_logs.session_start)
+        launch = launch or self.launch_tracker.expire()
+        if launch:
+            log_action(format_launch(launch))
+            self.launch_stats_var.set(self.launch_tracker.summary())
+        if not events:
+            return
+        session = self.fivem_logs.latest_session()
+        self.fivem_log_var.set(format_log_session(session))
+        if session and any(kind == "spawned" and name == session["name"] for name, kind, _ in events):
+            log_action(format_log_session(session))
+
+    # ---------- Spielmodus ----------
+    def start_status_polling(self):
+        self.jobs.every("poll_timer", 30000, self.start_status_poll, ui=True, initial_delay_ms=0)
+
+    def _game_watch_result(self, running, error):
+        if error or running == self.game_running:
+            return
+        if running:
+            self.enter_game_mode()
+        else:
+            self.leave_game_mode()
+
+    def enter_game_mode(self):
+        """FiveM läuft: Musik pausieren, Timer anhalten, Bild- und Index-Speicher freigeben."""
+        self.game_running = True
+        if self.music_available and self.music_enabled:
+            try:
+                pygame.mixer.music.pause()
+                self._music_paused_for_game = True
+            except Exception as e:
+                print("[WARN] Musik konnte nicht pausiert werden:", e)
+        for key in ("announcement_rotation", "poll_timer", "wallpaper_watch"):
+            self.jobs.cancel_timer(key)
+        images_before = self.thumb_images.bytes
+        for path in self.thumb_images.clear():
+            self._release_thumbnail(path)
+        # Log-Indizes freigeben; eine offene Ansicht wird nach dem Spiel neu aufgebaut
+        self._log_view_resume = getattr(self, "_log_view_index", None) is not None
+        if getattr(self, "_log_search_key", None):
+            self.jobs.cancel(self._log_search_key)
+            self._log_search_key = None
+        self._log_view_index = None
+        self.log_view.set_rows([])
+        self.log_indexes.clear()
+        if self._log_view_resume:
+            self.log_view_status_var.set("FiveM läuft – Index freigegeben, wird danach neu aufgebaut.")
+        gc.collect()
+        self.poll_stats_var.set("FiveM läuft – Statusabfrage pausiert, Launcher im Sparmodus.")
+        log_action(f"Spielmodus an: FiveM erkannt, {format_bytes(images_before)} Vorschaubilder freigegeben")
+
+    def leave_game_mode(self):
+        """FiveM beendet: alles wieder aufnehmen."""
+        self.game_running = False
+        if self._music_paused_for_game:
+            self._music_paused_for_game = False
+            try:
+                pygame.mixer.music.unpause()
+            except Exception as e:
+                print("[WARN] Musik konnte nicht fortgesetzt werden:", e)
+        self.update_music_state()
+        self.start_status_polling()
+        self.start_announcement_rotation()
+        self.load_wallpapers()
+        self.schedule_thumbnail_refresh()
+        if getattr(self, "_log_view_resume", False):
+            self._log_view_resume = False
+            self.refresh_log_view()
+        log_action("Spielmodus aus: FiveM beendet")
+
+    # ---------- Speicher-Diagnose ----------
+    def memory_report(self) -> str:
+        """Speicherbedarf nach Bereichen (Bilder, Musik, Logs, Historie) + RSS und tracemalloc."""
+        rss = process_rss_bytes()
+        lines = [f"Prozess (RSS): {format_bytes(rss) if rss is not None else 'unbekannt'}"]
+        if self.rss_samples:
+            lines.append(
+                f"RSS-Verlauf: min {format_bytes(min(self.rss_samples))}, "
+                f"max {format_bytes(max(self.rss_samples))} ({len(self.rss_samples)} Messungen)"
+            )
+        lines.append("")
+
+        images = self.thumb_images
+        placeholder = ImageBudgetCache.image_bytes(self._thumb_placeholder) if self._thumb_placeholder else 0
+        lines.append(
+            f"Bilder: {format_bytes(images.bytes + placeholder)} von {format_bytes(images.budget)} Budget "
+            f"({len(images.entries)}/{len(self.wallpaper_tiles)} Vorschauen geladen, "
+            f"{images.evictions} verdrängt)"
+        )
+        music = "aus"
+        if self.music_available and pygame.mixer.get_init():
+            freq, size, channels = pygame.mixer.get_init()
+            # pygame streamt die MP3; im RAM liegt nur der Mixer-Puffer (nicht messbar, geschätzt)
+            music = (
+                f"Stream, Mixer {freq} Hz/{channels} Kanäle, "
+                f"Puffer geschätzt ~{format_bytes(4096 * channels * abs(size) // 8)}"
+            )
+        lines.append(f"Musik: {music}")
+        log_bytes = sum(index.memory_bytes() for index in self.log_indexes.values())
+        lines.append(f"Logs: {format_bytes(log_bytes)} Index ({len(self.log_indexes)} Dateien)")
+        lines.append(
+            f"Historie: {format_bytes(self.status_history.memory_bytes())} "
+            f"({len(self.status_history)} Samples)"
+        )
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines += ["", f"Python-Heap (tracemalloc): {format_bytes(current)}, Spitze {format_bytes(peak)}"]
+            lines += [f"  {name}: {format_bytes(size)}" for name, size in tracemalloc_by_file()]
+        else:
+            lines += ["", "Python-Heap: tracemalloc aus (Einstellung memory_tracing, wirkt ab dem nächsten Start)"]
+        return "\n".join(lines)
+
+    def sample_memory(self):
+        rss = process_rss_bytes()
+        if rss is not None:
+            self.rss_samples.append(rss)
+
+    def show_memory_diagnostics(self):
+        # tracemalloc läuft nur mit memory_tracing ab Start – erst dann sind die Zahlen aussagekräftig
+        messagebox.showinfo(APP_NAME, self.memory_report())
 
     # ---------- Musik ----------
     def init_music(self):
@@ -320,7 +3630,7 @@ class LRToolbox(tk.Tk):
             self.music_available = False
 
     def update_music_state(self):
-        if not self.music_available:
+        if not self.music_available or self.game_running:
             return
         try:
             pygame.mixer.music.set_volume(self.music_volume)
@@ -333,122 +3643,357 @@ class LRToolbox(tk.Tk):
             print("[WARN] Fehler beim Aktualisieren der Musik:", e)
 
     # ---------- Wallpaper ----------
+    @profiled
     def load_wallpapers(self):
-        for widget in self.wallpaper_list_frame.winfo_children():
-            widget.destroy()
-        self.wallpaper_images.clear()
-
-        files = []
-        for ext in ("*.jpg", "*.jpeg", "*.png", "*.bmp"):
-            files.extend(WALLPAPER_DIR.glob(ext))
-        files = sorted(files)
-
-        if not files:
-            lbl = tk.Label(
-                self.wallpaper_list_frame,
-                text="Keine Wallpaper gefunden.\nLege Bilder in assets/wallpapers/ ab.",
-                fg="#DDDDDD",
-                bg="#111111",
-                font=FONT_TEXT,
-                justify="left",
-            )
-            lbl.pack(anchor="w", padx=5, pady=5)
+        """Wallpaper-Grid aufbauen bzw. abgleichen und die Ordnerüberwachung starten."""
+        self.sync_wallpapers()
+        self.jobs.every("wallpaper_watch", WALLPAPER_WATCH_INTERVAL_MS, self.watch_wallpaper_dir, ui=True)
+
+    def watch_wallpaper_dir(self):
+        """
+        Pollt nur die mtime von assets/wallpapers. Erst wenn sich der Ordner
+        ändert (Datei neu/gelöscht/ersetzt), wird gescannt und abgeglichen.
+        """
+        try:
+            mtime = WALLPAPER_DIR.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._wallpaper_dir_mtime:
+            self.sync_wallpapers()
+
+    def sync_wallpapers(self):
+        """
+        Gleicht die Kacheln mit dem Ordnerinhalt ab: nur neue, gelöschte und
+        geänderte Dateien werden angefasst, die Scrollposition bleibt erhalten.
+        """
+        try:
+            self._wallpaper_dir_mtime = WALLPAPER_DIR.stat().st_mtime_ns
+        except OSError:
+            self._wallpaper_dir_mtime = None
+
+        current = scan_wallpaper_dir(WALLPAPER_DIR)
+        known = {path: tile["stat"] for path, tile in self.wallpaper_tiles.items()}
+        added, removed, changed = diff_wallpaper_files(known, current)
+        if not (added or removed or changed) and self.wallpaper_tiles:
             return
 
-        max_width, max_height = 180, 120
-        cols = 4
-        row = 0
-        col = 0
+        scroll = self.wallpaper_canvas.yview()[0]
+
+        for path in removed:
+            self.jobs.cancel(f"thumb:{path}")
+            tile = self.wallpaper_tiles.pop(path)
+            tile["frame"].destroy()
+            self.thumb_images.discard(path)
+            self._drop_thumb_cache(tile)
+
+        for path in changed:
+            # Ein noch wartender/laufender Thumbnail-Job hätte das alte Bild
+            self.jobs.cancel(f"thumb:{path}")
+            tile = self.wallpaper_tiles[path]
+            self._drop_thumb_cache(tile)
+            self._release_thumbnail(path)
+            tile["stat"] = current[path]
+            tile["thumb_cache"] = thumbnail_cache_path(path, current[path], WALLPAPER_THUMB_SIZE)
+
+        for path in added:
+            self.add_wallpaper_tile(path, current[path])
+
+        self._layout_wallpaper_tiles()
+        self.wallpaper_canvas.update_idletasks()
+        self.wallpaper_canvas.yview_moveto(scroll)
+        self.schedule_thumbnail_refresh()
+
+        if added or removed or changed:
+            # Auch bei nur gelöschten Dateien: veraltete Varianten aufräumen
+            self.prepare_wallpaper_variants_in_background()
+            log_action(
+                f"Wallpaper abgeglichen: +{len(added)} / -{len(removed)} / ~{len(changed)}"
+            )
 
-        for img_path in files:
-            try:
-                img = Image.open(img_path)
-                img.thumbnail((max_width, max_height))
-                tk_img = ImageTk.PhotoImage(img)
-            except Exception as e:
-                print(f"[WARN] Konnte Wallpaper {img_path} nicht laden: {e}")
-                continue
+    def add_wallpaper_tile(self, path: Path, stat):
+        tile = self._create_wallpaper_tile(path)
+        tile["stat"] = stat
+        tile["thumb_cache"] = thumbnail_cache_path(path, stat, WALLPAPER_THUMB_SIZE)
+        self.wallpaper_tiles[path] = tile
+        return tile
 
-            frame = tk.Frame(self.wallpaper_list_frame, bg="#111111", bd=1, relief=tk.RIDGE)
-            frame.grid(row=row, column=col, padx=5, pady=5, sticky="n")
+    def _drop_thumb_cache(self, tile):
+        cache_file = tile.get("thumb_cache")
+        if cache_file is not None:
+            try:
+                cache_file.unlink(missing_ok=True)
+            except OSError:
+                pass
 
-            label = tk.Label(frame, image=tk_img, bg="#111111")
-            label.image = tk_img
-            label.pack(padx=5, pady=5)
+    def _layout_wallpaper_tiles(self):
+        """Kacheln sortiert ins Grid setzen; nur verschobene Kacheln werden neu platziert."""
+        cols = 4
+        if not self.wallpaper_tiles:
+            if self.wallpaper_empty_label is None:
+                self.wallpaper_empty_label = tk.Label(
+                    self.wallpaper_list_frame,
+                    text="Keine Wallpaper gefunden.\nLege Bilder in assets/wallpapers/ ab.",
+                    fg="#DDDDDD",
+                    bg="#111111",
+                    font=FONT_TEXT,
+                    justify="left",
+                )
+                self.wallpaper_empty_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+            return
+        if self.wallpaper_empty_label is not None:
+            self.wallpaper_empty_label.destroy()
+            self.wallpaper_empty_label = None
+
+        for index, path in enumerate(sorted(self.wallpaper_tiles)):
+            tile = self.wallpaper_tiles[path]
+            pos = divmod(index, cols)
+            if tile.get("pos") != pos:
+                tile["frame"].grid(row=pos[0], column=pos[1], padx=5, pady=5, sticky="n")
+                tile["pos"] = pos
+
+    def request_wallpaper_thumbnail(self, img_path: Path):
+        """Thumbnail im Hintergrund dekodieren; das PhotoImage entsteht erst im Tk-Thread."""
+        def done(img, error):
+            tile = self.wallpaper_tiles.get(img_path)
+            if tile is None or tile.get("stat") != stat:
+                return      # Datei inzwischen ersetzt oder gelöscht
+            if error:
+                print(f"[WARN] Konnte Wallpaper {img_path} nicht laden: {error}")
+                tile["image_label"].configure(text="Keine Vorschau", fg="#777777", compound="center")
+                return
+            self._show_thumbnail(tile, ImageTk.PhotoImage(img))
+
+        tile = self.wallpaper_tiles.get(img_path)
+        cache_file = tile.get("thumb_cache") if tile else None
+        stat = tile.get("stat") if tile else None
+        self.jobs.submit(
+            f"thumb:{img_path}",
+            lambda: load_thumbnail(img_path, WALLPAPER_THUMB_SIZE, cache_file, stat),
+            done,
+            priority=PRIO_LOW,
+        )
 
-            name_label = tk.Label(
-                frame,
-                text=img_path.name,
-                fg="#FFFFFF",
-                bg="#111111",
-                font=FONT_TEXT,
-                wraplength=max_width,
+    def set_cached_thumbnail(self, tile) -> bool:
+        """Thumbnail aus dem PNG-Cache direkt über Tk laden (ohne PIL, ohne Job)."""
+        cache_file = tile.get("thumb_cache")
+        if cache_file is None or not cache_file.exists():
+            return False
+        try:
+            tk_img = tk.PhotoImage(file=str(cache_file))
+        except tk.TclError:
+            return False
+        self._show_thumbnail(tile, tk_img)
+        return True
+
+    def _show_thumbnail(self, tile, tk_img):
+        tile["image_label"].configure(image=tk_img)
+        tile["image"] = tk_img
+        self.thumb_images.put(tile["path"], tk_img)
+        for path in self.thumb_images.evict(keep=self._visible_wallpaper_paths()):
+            self._release_thumbnail(path)
+
+    def _release_thumbnail(self, path):
+        """Tile zeigt wieder den Platzhalter; das PhotoImage wird damit freigegeben."""
+        self.thumb_images.discard(path)
+        tile = self.wallpaper_tiles.get(path)
+        if tile is not None and tile.get("image") is not None:
+            tile["image_label"].configure(image=self._thumb_placeholder)
+            tile["image"] = None
+
+    def _visible_wallpaper_paths(self) -> set:
+        """Pfade der Kacheln, die gerade im sichtbaren Bereich des Canvas liegen."""
+        canvas = self.wallpaper_canvas
+        top = canvas.canvasy(0)
+        bottom = top + max(canvas.winfo_height(), WALLPAPER_THUMB_SIZE[1])
+        visible = set()
+        for path, tile in self.wallpaper_tiles.items():
+            frame = tile["frame"]
+            y = frame.winfo_y()
+            if y + frame.winfo_height() >= top and y <= bottom:
+                visible.add(path)
+        return visible
+
+    def schedule_thumbnail_refresh(self):
+        """Nach Scrollen/Größenänderung gebündelt sichtbare Thumbnails nachladen."""
+        if not self._thumb_refresh_pending:
+            self._thumb_refresh_pending = True
+            self.after(80, self.refresh_visible_thumbnails)
+
+    def refresh_visible_thumbnails(self):
+        self._thumb_refresh_pending = False
+        if self.game_running:
+            return
+        visible = self._visible_wallpaper_paths()
+        self.thumb_images.touch(visible)
+        for path in sorted(visible):
+            tile = self.wallpaper_tiles[path]
+            if tile.get("image") is None and not self.jobs.is_active(f"thumb:{path}"):
+                if not self.set_cached_thumbnail(tile):
+                    self.request_wallpaper_thumbnail(path)
+        for path in self.thumb_images.evict(keep=visible):
+            self._release_thumbnail(path)
+
+    def _create_wallpaper_tile(self, img_path: Path):
+        if self._thumb_placeholder is None:
+            self._thumb_placeholder = tk.PhotoImage(
+                width=WALLPAPER_THUMB_SIZE[0], height=WALLPAPER_THUMB_SIZE[1]
             )
-            name_label.pack(pady=(0, 5))
 
-            btn = tk.Button(
-                frame,
-                text="Als Hintergrund setzen",
-                bg="#222222",
-                fg="#FFFFFF",
-                activebackground="#333333",
-                activeforeground="#FFFFFF",
-                font=FONT_BUTTON,
-                command=lambda p=img_path: self.set_wallpaper(p),
+        frame = tk.Frame(self.wallpaper_list_frame, bg="#111111", bd=1, relief=tk.RIDGE)
+
+        label = tk.Label(frame, image=self._thumb_placeholder, bg="#111111")
+        label.pack(padx=5, pady=5)
+
+        name_label = tk.Label(
+            frame,
+            text=img_path.name,
+            fg="#FFFFFF",
+            bg="#111111",
+            font=FONT_TEXT,
+            wraplength=WALLPAPER_THUMB_SIZE[0],
+        )
+        name_label.pack(pady=(0, 5))
+
+        btn = tk.Button(
+            frame,
+            text="Als Hintergrund setzen",
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            font=FONT_BUTTON,
+            command=lambda p=img_path: self.set_wallpaper(p),
+        )
+        btn.pack(pady=(0, 5))
+
+        return {"path": img_path, "frame": frame, "image_label": label, "image": None, "pos": None}
+
+    def wallpaper_target_sizes(self):
+        """Bildschirmauflösung + zusätzlich konfigurierte Auflösungen."""
+        sizes = [physical_screen_size(self)]
+        for value in self.user_settings.get("wallpaper_resolutions") or []:
+            size = parse_resolution(value)
+            if size and size not in sizes:
+                sizes.append(size)
+        return sizes
+
+    def prepare_wallpaper_variants_in_background(self):
+        """
+        Fehlende Varianten aller aktuellen Wallpaper vorab erzeugen, damit
+        'Setzen' ein Cache-Treffer ist; vorhandene kosten nur ein stat().
+        """
+        sizes = self.wallpaper_target_sizes()
+        current = sorted(self.wallpaper_tiles)
+
+        def work():
+            result = prepare_wallpaper_variants(current, sizes, WALLPAPER_CACHE_DIR)
+            keep = []
+            for src in current:
+                for size in sizes:
+                    try:
+                        keep.append(wallpaper_variant_path(src, size, WALLPAPER_CACHE_DIR))
+                    except OSError:
+                        pass
+            result["pruned"] = prune_wallpaper_cache(WALLPAPER_CACHE_DIR, keep)
+            return result
+
+        def done(result, error):
+            if error:
+                print("[WARN] Wallpaper-Varianten konnten nicht erzeugt werden:", error)
+                return
+            for src, err in result["errors"]:
+                print(f"[WARN] Wallpaper-Variante für {src} fehlgeschlagen: {err}")
+            if result["created"] or result["pruned"]:
+                log_action(
+                    f"Wallpaper-Varianten: {result['created']} erzeugt, {result['cached']} im Cache, "
+                    f"{result['pruned']} veraltete entfernt"
+                )
+
+        # Neuester Ordnerstand gewinnt, ein laufender Job wird danach wiederholt
+        self.jobs.submit("wallpaper_variants", work, done, priority=PRIO_LOW, replace=True)
+
+    def import_wallpapers_dialog(self, folder: bool):
+        if folder:
+            path = filedialog.askdirectory(title="Ordner mit Wallpapern auswählen")
+            paths = [path] if path else []
+        else:
+            paths = filedialog.askopenfilenames(
+                title="Wallpaper auswählen",
+                filetypes=[("Bilder", " ".join(f"*{ext}" for ext in sorted(WALLPAPER_IMPORT_EXTENSIONS)))],
             )
-            btn.pack(pady=(0, 5))
+        if paths:
+            self.import_wallpapers_in_background(paths)
+
+    def import_wallpapers_in_background(self, paths):
+        """Import-Pipeline als Job; Kacheln und Varianten danach wie bei neuen Dateien abgleichen."""
+        if self.jobs.is_active("wallpaper_import"):
+            # Nicht mit dem laufenden Job zusammenlegen (der kennt nur seine Auswahl)
+            self._wallpaper_import_queue.extend(paths)
+            self.wallpaper_import_var.set("Import läuft… (weitere Auswahl folgt danach)")
+            return
+        config = {**DEFAULT_SETTINGS["wallpaper_import"], **(self.user_settings.get("wallpaper_import") or {})}
+        max_size = parse_resolution(config["max_resolution"]) or (3840, 2160)
+        self.wallpaper_import_var.set("Import läuft…")
 
-            self.wallpaper_images.append(tk_img)
+        def work():
+            sources = wallpaper_import_sources(paths)
+            hash_cache = load_json(WALLPAPER_HASH_FILE, {})
+            try:
+                return import_wallpapers(
+                    sources, WALLPAPER_DIR, hash_cache, max_size,
+                    int(config["quality"]), int(config["max_hash_distance"]),
+                )
+            finally:
+                save_json(WALLPAPER_HASH_FILE, hash_cache)
 
-            col += 1
-            if col >= cols:
-                col = 0
-                row += 1
+        def done(result, error):
+            if error:
+                self.wallpaper_import_var.set(f"Import fehlgeschlagen: {error}")
+                return
+            summary = format_wallpaper_import(result)
+            self.wallpaper_import_var.set(f"Import: {summary}")
+            log_action(f"Wallpaper-Import: {summary}")
+            for src, duplicate in result["duplicates"]:
+                log_action(f"Wallpaper-Import: {src} übersprungen (wie {duplicate})")
+            for src, err in result["errors"]:
+                print(f"[WARN] Wallpaper-Import {src} fehlgeschlagen: {err}")
+            self.sync_wallpapers()
+
+        def finished(result, error):
+            done(result, error)
+            queued, self._wallpaper_import_queue = self._wallpaper_import_queue, []
+            if queued:
+                self.import_wallpapers_in_background(queued)
+
+        self.jobs.submit("wallpaper_import", work, finished, priority=PRIO_HIGH)
 
     def set_wallpaper(self, img_path: Path):
         try:
-            import ctypes
-            SPI_SETDESKWALLPAPER = 20
-            r = ctypes.windll.user32.SystemParametersInfoW(
-                SPI_SETDESKWALLPAPER, 0, str(img_path), 3
-            )
-            if not r:
-                raise RuntimeError("SystemParametersInfoW returned 0")
+            size = self.wallpaper_target_sizes()[0]
+            variant = wallpaper_variant_path(img_path, size, WALLPAPER_CACHE_DIR)
+            if not variant.exists():
+                # Noch nicht vorbereitet → jetzt einmal erzeugen
+                render_wallpaper_variant(img_path, variant, size)
+            apply_os_wallpaper(variant)
             messagebox.showinfo(APP_NAME, f"Wallpaper gesetzt:\n{img_path.name}")
-            log_action(f"Wallpaper gesetzt: {img_path}")
+            log_action(f"Wallpaper gesetzt: {img_path} ({size[0]}x{size[1]})")
         except Exception as e:
             messagebox.showerror(APP_NAME, f"Fehler beim Setzen des Wallpapers:\n{e}")
 
     # ---------- Announcements ----------
     def load_announcements(self):
-        """Lädt Ankündigungen aus config/announcements.json, legt Default an wenn nötig."""
-        if not ANNOUNCEMENTS_FILE.exists():
-            default_data = {
-                "announcements": [
-                    {
-                        "title": "Willkommen auf LaRueRP",
-                        "body": "Verbinde dich direkt über den Launcher mit dem Server und tritt unserem Discord bei!"
-                    },
-                    {
-                        "title": "Beispiel-Ankündigung",
-                        "body": "Diese Nachrichten kommen aus config/announcements.json und können dort beliebig angepasst werden."
-                    },
-                ]
-            }
-            save_json(ANNOUNCEMENTS_FILE, default_data)
-            data = default_data
-        else:
-            raw = load_json(ANNOUNCEMENTS_FILE, {"announcements": []})
-            if isinstance(raw, list):
-                data = {"announcements": raw}
-            elif isinstance(raw, dict):
-                data = raw
-            else:
-                data = {"announcements": []}
+        """Lädt Ankündigungen aus config/announcements.json im Hintergrund."""
+        self.jobs.submit(
+            "announcements",
+            read_announcements,
+            lambda items, error: self.set_announcements((items or []) if not error else self.announcements),
+            priority=PRIO_NORMAL,
+        )
 
-        self.announcements = data.get("announcements", []) or []
-        self.current_announcement_index = 0
-        self.show_announcement(0)
+    def set_announcements(self, items, index: int = 0):
+        self.announcements = items
+        self.current_announcement_index = index
+        self.show_announcement(index)
 
     def show_announcement(self, index=None):
         if not self.announcements:
@@ -478,11 +4023,7 @@ class LRToolbox(tk.Tk):
 
     def start_announcement_rotation(self):
         """Alle 15 Sekunden automatisch zur nächsten Anzeige springen."""
-        def rotate():
-            self.next_announcement()
-            self.after(15000, rotate)
-
-        self.after(15000, rotate)
+        self.jobs.every("announcement_rotation", 15000, self.next_announcement, ui=True)
 
     # ---------- UI ----------
     def _build_ui(self):
@@ -530,6 +4071,21 @@ class LRToolbox(tk.Tk):
             font=FONT_TEXT,
         )
         self.players_label.pack(anchor="e")
+        self.players_label.configure(cursor="hand2")
+        self.players_label.bind("<Button-1>", self.show_player_list)
+
+        self.sparkline = Sparkline(status_frame)
+        self.sparkline.canvas.pack(anchor="e", pady=(2, 0))
+        self.fill_sparkline_from_history()
+
+        self.other_servers_label = tk.Label(
+            status_frame,
+            textvariable=self.other_servers_var,
+            fg="#777777",
+            bg="#000000",
+            font=FONT_TEXT,
+        )
+        self.other_servers_label.pack(anchor="e")
 
         notebook = ttk.Notebook(self)
         notebook.pack(fill=tk.BOTH, expand=True)
@@ -547,19 +4103,29 @@ class LRToolbox(tk.Tk):
         self.help_tab = tk.Frame(notebook, bg="#111111")
         self.settings_tab = tk.Frame(notebook, bg="#111111")
         self.info_tab = tk.Frame(notebook, bg="#111111")
+        self.logs_tab = tk.Frame(notebook, bg="#111111")
 
         notebook.add(self.launcher_tab, text="Launcher")
         notebook.add(self.visuals_tab, text="Visuals")
         notebook.add(self.help_tab, text="Hilfe")
+        notebook.add(self.logs_tab, text="Logs")
         notebook.add(self.settings_tab, text="Einstellungen")
         notebook.add(self.info_tab, text="Info & Update")
+        self.notebook = notebook
 
         self._build_launcher_tab()
         self._build_visuals_tab()
         self._build_help_tab()
+        self._build_logs_tab()
         self._build_settings_tab()
         self._build_info_tab()
 
+        # Log-Index erst aufbauen, wenn der Tab geöffnet wird
+        notebook.bind(
+            "<<NotebookTabChanged>>",
+            lambda _e: self.refresh_log_view() if notebook.select() == str(self.logs_tab) else None,
+        )
+
     # ---------- Launcher Tab ----------
     def _build_launcher_tab(self):
         left = tk.Frame(self.launcher_tab, bg="#111111")
@@ -593,6 +4159,39 @@ class LRToolbox(tk.Tk):
             command=self.full_clean,
         ).pack(fill=tk.X, pady=5)
 
+        tk.Button(
+            left,
+            text="Server-Cache gezielt aufräumen",
+            font=FONT_BUTTON,
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            command=self.server_cache_clean,
+        ).pack(fill=tk.X, pady=5)
+
+        tk.Button(
+            left,
+            text="Cache prüfen (nur defekte Dateien löschen)",
+            font=FONT_BUTTON,
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            command=self.verify_fivem_cache,
+        ).pack(fill=tk.X, pady=5)
+
+        tk.Button(
+            left,
+            text="Clean / Prüfung abbrechen",
+            font=FONT_BUTTON,
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            command=self.cancel_clean_jobs,
+        ).pack(fill=tk.X, pady=5)
+
         tk.Button(
             left,
             text="Nur LaRue starten",
@@ -604,6 +4203,14 @@ class LRToolbox(tk.Tk):
             command=self.start_larue_only,
         ).pack(fill=tk.X, pady=5)
 
+        tk.Label(
+            left,
+            textvariable=self.clean_status_var,
+            fg="#AAAAAA",
+            bg="#111111",
+            font=FONT_TEXT,
+        ).pack(anchor="w")
+
         options_frame = tk.LabelFrame(
             left, text="Optionen", fg="#FFFFFF", bg="#111111", font=FONT_H2
         )
@@ -625,6 +4232,59 @@ class LRToolbox(tk.Tk):
             command=self._save_settings,
         ).pack(anchor="w", pady=2)
 
+        self.var_auto_clean_on_start = tk.BooleanVar(
+            value=self.user_settings.get("auto_clean_on_start", False)
+        )
+        tk.Checkbutton(
+            options_frame,
+            text="Beim Start aufräumen, wenn der Cache zu groß/alt ist",
+            variable=self.var_auto_clean_on_start,
+            fg="#FFFFFF",
+            bg="#111111",
+            selectcolor="#111111",
+            activebackground="#111111",
+            activeforeground="#FFFFFF",
+            font=FONT_TEXT,
+            command=self._save_settings,
+        ).pack(anchor="w", pady=2)
+
+        self.var_clean_throttled = tk.BooleanVar(
+            value=self.user_settings.get("clean_throttled", False)
+        )
+        tk.Checkbutton(
+            options_frame,
+            text="Clean gedrosselt im Hintergrund (kein Ruckeln im Spiel)",
+            variable=self.var_clean_throttled,
+            fg="#FFFFFF",
+            bg="#111111",
+            selectcolor="#111111",
+            activebackground="#111111",
+            activeforeground="#FFFFFF",
+            font=FONT_TEXT,
+            command=self._save_settings,
+        ).pack(anchor="w", pady=2)
+
+        session_frame = tk.LabelFrame(
+            left, text="FiveM-Sitzung", fg="#FFFFFF", bg="#111111", font=FONT_H2
+        )
+        session_frame.pack(fill=tk.X)
+        tk.Label(
+            session_frame,
+            textvariable=self.fivem_log_var,
+            justify="left",
+            fg="#AAAAAA",
+            bg="#111111",
+            font=FONT_TEXT,
+        ).pack(anchor="w", padx=5, pady=(5, 0))
+        tk.Label(
+            session_frame,
+            textvariable=self.launch_stats_var,
+            justify="left",
+            fg="#AAAAAA",
+            bg="#111111",
+            font=FONT_TEXT,
+        ).pack(anchor="w", padx=5, pady=(0, 5))
+
         tk.Label(
             right,
             text="System / FiveM",
@@ -821,16 +4481,46 @@ class LRToolbox(tk.Tk):
 
         tk.Label(
             self.visuals_tab,
-            text="Wallpapers",
-            fg="#FFFFFF",
+            text="Wallpapers",
+            fg="#FFFFFF",
+            bg="#111111",
+            font=FONT_H1,
+        ).pack(anchor="w", padx=20, pady=(10, 0))
+
+        import_frame = tk.Frame(self.visuals_tab, bg="#111111")
+        import_frame.pack(fill=tk.X, padx=20, pady=(5, 0))
+        for text, command in (
+            ("Bilder importieren…", lambda: self.import_wallpapers_dialog(folder=False)),
+            ("Ordner importieren…", lambda: self.import_wallpapers_dialog(folder=True)),
+            ("Wallpaper-Ordner optimieren", lambda: self.import_wallpapers_in_background([WALLPAPER_DIR])),
+        ):
+            tk.Button(
+                import_frame,
+                text=text,
+                bg="#222222",
+                fg="#FFFFFF",
+                activebackground="#333333",
+                activeforeground="#FFFFFF",
+                font=FONT_BUTTON,
+                command=command,
+            ).pack(side="left", padx=(0, 10))
+
+        self.wallpaper_import_var = tk.StringVar(
+            value="Import: drehen, verkleinern, als JPEG speichern, Duplikate überspringen."
+        )
+        tk.Label(
+            self.visuals_tab,
+            textvariable=self.wallpaper_import_var,
+            fg="#AAAAAA",
             bg="#111111",
-            font=FONT_H1,
-        ).pack(anchor="w", padx=20, pady=(10, 0))
+            font=FONT_TEXT,
+        ).pack(anchor="w", padx=20, pady=(5, 0))
 
         container = tk.Frame(self.visuals_tab, bg="#111111")
         container.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
         canvas = tk.Canvas(container, bg="#111111", highlightthickness=0)
+        self.wallpaper_canvas = canvas
         scrollbar = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
         self.wallpaper_list_frame = tk.Frame(canvas, bg="#111111")
 
@@ -840,7 +4530,13 @@ class LRToolbox(tk.Tk):
         )
 
         canvas.create_window((0, 0), window=self.wallpaper_list_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.schedule_thumbnail_refresh()
+
+        canvas.configure(yscrollcommand=on_scroll)
+        canvas.bind("<Configure>", lambda _e: self.schedule_thumbnail_refresh())
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -857,10 +4553,11 @@ class LRToolbox(tk.Tk):
 
         text = (
             "Hilfestellungen:\n\n"
-            "• Game cache outdated → 'Vollständiger Clean' nutzen\n"
-            "• Could not connect to server → Serverstatus prüfen, Internet prüfen\n"
+            "• Game cache outdated → erst 'Cache prüfen', dann 'Server-Cache gezielt aufräumen', "
+            "hilft das nicht: 'Vollständiger Clean'\n"
+            "• Could not connect to server → Serverstatus prüfen, 'Netzwerk-Test' ausführen\n"
             "• Crashes → Voll-Clean, SSD-Füllstand, Treiber prüfen\n"
-            "• Minimap hängt → WQHD-Minimap-Option in den Einstellungen nutzen\n\n"
+            "• Minimap hängt → UI-Profil 'wqhd' in den Einstellungen wählen\n\n"
             "Vor Kontakt mit dem Support empfehlen wir:\n"
             "1. Windows Systemcheck ausführen\n"
             "2. Support-Paket (ZIP) erstellen und anhängen."
@@ -885,6 +4582,44 @@ class LRToolbox(tk.Tk):
             command=self.run_services_check,
         ).pack(anchor="w", padx=20, pady=(10, 0))
 
+        tk.Button(
+            self.help_tab,
+            text="Netzwerk-Test (Latenz zum Server)",
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            font=FONT_BUTTON,
+            command=self.run_network_test,
+        ).pack(anchor="w", padx=20, pady=(10, 0))
+
+        tk.Label(
+            self.help_tab,
+            textvariable=self.network_test_var,
+            fg="#AAAAAA",
+            bg="#111111",
+            font=FONT_TEXT,
+        ).pack(anchor="w", padx=20, pady=(2, 0))
+
+        tk.Button(
+            self.help_tab,
+            text="Crash-Übersicht (Häufigkeit & Trend)",
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            font=FONT_BUTTON,
+            command=self.show_crash_summary,
+        ).pack(anchor="w", padx=20, pady=(10, 0))
+
+        tk.Label(
+            self.help_tab,
+            textvariable=self.crash_status_var,
+            fg="#AAAAAA",
+            bg="#111111",
+            font=FONT_TEXT,
+        ).pack(anchor="w", padx=20, pady=(2, 0))
+
         tk.Button(
             self.help_tab,
             text="Support-Paket erstellen (ZIP)",
@@ -896,6 +4631,139 @@ class LRToolbox(tk.Tk):
             command=self.export_support_bundle,
         ).pack(anchor="w", padx=20, pady=(10, 0))
 
+    # ---------- Logs Tab ----------
+    def _build_logs_tab(self):
+        bar = tk.Frame(self.logs_tab, bg="#111111")
+        bar.pack(fill=tk.X, padx=20, pady=(10, 5))
+
+        self.var_log_source = tk.StringVar(value="launcher.log")
+        self.log_source_combo = ttk.Combobox(
+            bar, textvariable=self.var_log_source, state="readonly", width=34
+        )
+        self.log_source_combo.pack(side=tk.LEFT)
+        self.log_source_combo.bind("<<ComboboxSelected>>", lambda _e: self.refresh_log_view())
+
+        self.var_log_query = tk.StringVar(value="")
+        entry = tk.Entry(bar, textvariable=self.var_log_query, bg="#222222", fg="#FFFFFF",
+                         insertbackground="#FFFFFF", font=FONT_TEXT, width=30)
+        entry.pack(side=tk.LEFT, padx=5)
+        entry.bind("<Return>", lambda _e: self.run_log_search())
+
+        self.var_log_level = tk.StringVar(value="Alle")
+        level_combo = ttk.Combobox(
+            bar, textvariable=self.var_log_level, state="readonly", width=10,
+            values=["Alle", "Warnungen", "Fehler"],
+        )
+        level_combo.pack(side=tk.LEFT, padx=5)
+        level_combo.bind("<<ComboboxSelected>>", lambda _e: self.run_log_search())
+
+        self.var_log_since = tk.StringVar(value="Gesamt")
+        since_combo = ttk.Combobox(
+            bar, textvariable=self.var_log_since, state="readonly", width=10,
+            values=list(LOG_SINCE_CHOICES),
+        )
+        since_combo.pack(side=tk.LEFT, padx=5)
+        since_combo.bind("<<ComboboxSelected>>", lambda _e: self.run_log_search())
+
+        tk.Button(
+            bar,
+            text="Suchen / Aktualisieren",
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            font=FONT_BUTTON,
+            command=self.refresh_log_view,
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.log_view_status_var = tk.StringVar(value="")
+        tk.Label(
+            self.logs_tab,
+            textvariable=self.log_view_status_var,
+            fg="#AAAAAA",
+            bg="#111111",
+            font=FONT_TEXT,
+        ).pack(anchor="w", padx=20)
+
+        self.log_view = VirtualLogView(self.logs_tab, self._fetch_log_lines)
+        self.log_view.frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(5, 20))
+
+    def log_sources(self) -> dict:
+        """Anzeigename -> (Pfad, FiveM-Log?)"""
+        sources = {"launcher.log": (LOGS_DIR / "launcher.log", False)}
+        dirs = self.fivem_app_dirs()
+        if dirs is not None and (dirs[0] / "logs").exists():
+            for path in sorted((dirs[0] / "logs").glob("*.log"), reverse=True):
+                sources[f"FiveM: {path.name}"] = (path, True)
+        return sources
+
+    def current_log_index(self):
+        sources = self.log_sources()
+        self.log_source_combo.configure(values=list(sources))
+        name = self.var_log_source.get()
+        if name not in sources:
+            name = "launcher.log"
+            self.var_log_source.set(name)
+        path, fivem = sources[name]
+        index = self.log_indexes.get(name)
+        if index is None or index.path != path:
+            index = self.log_indexes[name] = LogIndex(path, fivem=fivem)
+        return index
+
+    def refresh_log_view(self):
+        """Index der gewählten Datei nachziehen, danach die Suche erneut ausführen."""
+        index = self.current_log_index()
+        self.log_view_status_var.set("Index wird aktualisiert...")
+
+        def done(added, error):
+            if self.game_running:
+                return
+            if error:
+                self.log_view_status_var.set(f"Log konnte nicht gelesen werden: {error}")
+                return
+            self.run_log_search()
+
+        self.jobs.submit(f"log_index:{index.path}", index.update, done, priority=PRIO_NORMAL)
+
+    def run_log_search(self):
+        index = self.current_log_index()
+        query = self.var_log_query.get()
+        min_level = {"Warnungen": 2, "Fehler": 3}.get(self.var_log_level.get(), 0)
+        span = LOG_SINCE_CHOICES.get(self.var_log_since.get())
+        since = time.time() - span if span else None
+        # Schlüssel je Datei + Suche: gleiche Suche wird zusammengelegt, eine neue
+        # ersetzt die alte (deren Ergebnis käme sonst zu spät und überschriebe die Ansicht)
+        key = f"log_search:{index.path}:{min_level}:{span}:{query}"
+        previous = getattr(self, "_log_search_key", None)
+        if previous is not None and previous != key:
+            self.jobs.cancel(previous)
+        self._log_search_key = key
+
+        def work():
+            started = time.perf_counter()
+            rows = index.search(query, min_level, since)
+            return rows, time.perf_counter() - started
+
+        def done(result, error):
+            if self._log_search_key != key:
+                return
+            if error:
+                self.log_view_status_var.set(f"Suche fehlgeschlagen: {error}")
+                return
+            rows, elapsed = result
+            self._log_view_index = index
+            self.log_view.set_rows(rows)
+            self.log_view_status_var.set(
+                f"{len(rows)} von {len(index)} Zeilen ({format_bytes(index.size)}) · "
+                f"Suche {elapsed * 1000:.1f} ms"
+            )
+
+        self.jobs.submit(key, work, done, priority=PRIO_HIGH)
+
+    def _fetch_log_lines(self, line_numbers):
+        index = getattr(self, "_log_view_index", None)
+        return index.read_lines(line_numbers) if index is not None else []
+
     # ---------- Settings Tab ----------
     def _build_settings_tab(self):
         tk.Label(
@@ -909,21 +4777,37 @@ class LRToolbox(tk.Tk):
         frame = tk.Frame(self.settings_tab, bg="#111111")
         frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        self.var_wqhd = tk.BooleanVar(
-            value=self.user_settings.get("wqhd_minimap_enabled", False)
-        )
-        tk.Checkbutton(
+        tk.Label(
             frame,
-            text="WQHD-Minimap aktivieren (frontend.xml ersetzen)",
-            variable=self.var_wqhd,
+            text="UI-Profil (frontend.xml, z. B. WQHD-Minimap)",
             fg="#FFFFFF",
             bg="#111111",
-            selectcolor="#111111",
-            activebackground="#111111",
-            activeforeground="#FFFFFF",
+            font=FONT_H2,
+        ).pack(anchor="w", pady=(5, 2))
+
+        profiles = list(list_ui_profiles(UI_PROFILES_DIR, FRONTEND_ASSET))
+
+        self.var_ui_profile = tk.StringVar(value=self.active_ui_profile())
+        profile_box = ttk.Combobox(
+            frame,
+            textvariable=self.var_ui_profile,
+            values=profiles,
+            state="readonly",
+            width=24,
+        )
+        profile_box.pack(anchor="w", pady=2)
+        profile_box.bind("<<ComboboxSelected>>", self.apply_ui_profile)
+
+        self.ui_profile_status_var = tk.StringVar(
+            value="Eigene Profile: assets/ui_profiles/<name>/frontend.xml"
+        )
+        tk.Label(
+            frame,
+            textvariable=self.ui_profile_status_var,
+            fg="#AAAAAA",
+            bg="#111111",
             font=FONT_TEXT,
-            command=self.toggle_wqhd,
-        ).pack(anchor="w", pady=5)
+        ).pack(anchor="w", pady=(2, 5))
 
         tk.Button(
             frame,
@@ -946,13 +4830,17 @@ class LRToolbox(tk.Tk):
             font=FONT_H1,
         ).pack(anchor="w", padx=20, pady=(10, 5))
 
-        tk.Label(
+        self.version_label = tk.Label(
             self.info_tab,
             text=f"Aktuelle Version: {APP_VERSION}",
             fg="#DDDDDD",
             bg="#111111",
             font=FONT_TEXT,
-        ).pack(anchor="w", padx=20, pady=(0, 5))
+        )
+        self.version_label.pack(anchor="w", padx=20, pady=(0, 5))
+        # Versteckter Schalter für den Support: Strg + Doppelklick auf die Version
+        self.version_label.bind("<Control-Double-Button-1>", lambda _e: self.toggle_profiling())
+        self._show_profiling_state()
 
         tk.Label(
             self.info_tab,
@@ -1002,64 +4890,147 @@ class LRToolbox(tk.Tk):
             command=self.check_for_updates,
         ).pack(anchor="w", padx=20, pady=(0, 5))
 
+        self.asset_status_label = tk.Label(
+            self.info_tab,
+            textvariable=self.asset_status_var,
+            fg="#777777",
+            bg="#111111",
+            font=FONT_TEXT,
+            wraplength=600,
+            justify="left",
+        )
+        self.asset_status_label.pack(anchor="w", padx=20, pady=(15, 0))
+
+        tk.Label(
+            self.info_tab,
+            textvariable=self.poll_stats_var,
+            fg="#777777",
+            bg="#111111",
+            font=FONT_TEXT,
+            wraplength=600,
+            justify="left",
+        ).pack(anchor="w", padx=20, pady=(15, 5))
+
+        tk.Button(
+            self.info_tab,
+            text="Speicher-Diagnose",
+            bg="#222222",
+            fg="#FFFFFF",
+            activebackground="#333333",
+            activeforeground="#FFFFFF",
+            font=FONT_BUTTON,
+            command=self.show_memory_diagnostics,
+        ).pack(anchor="w", padx=20, pady=(5, 10))
+
+    def toggle_profiling(self):
+        self.profiler.enabled = not self.profiler.enabled
+        log_action(f"Profiling {'aktiviert' if self.profiler.enabled else 'deaktiviert'}")
+        self._show_profiling_state()
+
+    def _show_profiling_state(self):
+        text = f"Aktuelle Version: {APP_VERSION}"
+        if self.profiler.enabled:
+            text += "  ·  Profiling aktiv (logs/profile_*)"
+        self.version_label.config(text=text)
+
     # ---------- Aktionen ----------
     def quick_clean_and_start(self):
         if not self.ensure_fivem_root():
             return
-        removed = self.clean_cache(full=False)
-        log_action(f"Schnell-Clean durchgeführt, entfernte Einträge: {removed}")
-        messagebox.showinfo(
-            APP_NAME, f"Schnell-Clean abgeschlossen.\nEntfernte Einträge: {removed}"
-        )
-        if self.user_settings.get("auto_start_after_clean", False):
-            self.start_larue_only()
+        self.run_clean(full=False)
 
     def full_clean(self):
         if not self.ensure_fivem_root():
             return
-        removed = self.clean_cache(full=True)
-        log_action(f"Vollständiger Clean durchgeführt, entfernte Einträge: {removed}")
-        messagebox.showinfo(
-            APP_NAME, f"Vollständiger Clean abgeschlossen.\nEntfernte Einträge: {removed}"
+        self.run_clean(full=True)
+
+    def run_clean(self, full: bool, interactive: bool = True):
+        """
+        Clean als Job; Meldung und Auto-Start danach im Tk-Thread.
+        interactive=False (Auto-Clean): nur Statuszeile und Log, kein Popup/Start.
+        """
+        label = "Vollständiger Clean" if full else "Schnell-Clean"
+        if not interactive:
+            label = f"Automatischer {label}"
+        # Auto-Clean läuft immer gedrosselt, manuelle Cleans nur auf Wunsch
+        throttle = None
+        if not interactive or self.user_settings.get("clean_throttled", False):
+            budget = {**DEFAULT_SETTINGS["clean_budget"], **(self.user_settings.get("clean_budget") or {})}
+            throttle = DeleteThrottle(budget["ops_per_sec"], budget["mb_per_sec"] * 1024 * 1024)
+            label = f"{label} (gedrosselt)"
+        self.clean_status_var.set(f"{label} läuft...")
+
+        def done(removed, error):
+            self.clean_status_var.set("")
+            if error:
+                if interactive:
+                    messagebox.showerror(APP_NAME, f"{label} fehlgeschlagen:\n{error}")
+                else:
+                    log_action(f"{label} fehlgeschlagen: {error}")
+                return
+            log_action(
+                f"{label} durchgeführt, entfernte Einträge: {removed}"
+                + (f", gewartet {throttle.slept:.1f} s" if throttle is not None else "")
+            )
+            self.launch_tracker.note_clean("full" if full else "quick")
+            save_json(CLEAN_STATE_FILE, {"last_clean_at": time.time(), "kind": "full" if full else "quick"})
+            if not interactive:
+                self.clean_status_var.set(f"{label}: {removed} Einträge entfernt.")
+                return
+            messagebox.showinfo(
+                APP_NAME, f"{label} abgeschlossen.\nEntfernte Einträge: {removed}"
+            )
+            if self.user_settings.get("auto_start_after_clean", False):
+                self.start_larue_only()
+
+        self.jobs.submit(
+            "clean_full" if full else "clean_quick",
+            lambda: self.clean_cache(full=full, throttle=throttle),
+            done,
+            priority=PRIO_HIGH if throttle is None else PRIO_LOW,
         )
-        if self.user_settings.get("auto_start_after_clean", False):
-            self.start_larue_only()
 
-    def clean_cache(self, full: bool) -> int:
+    def clean_cache(self, full: bool, throttle=None) -> int:
         """
         'Sicherer' Clean:
         - entfernt Crashes, Logs, reinen Game-/Server-Cache
         - lässt db/priv/browser/nui-storage in Ruhe (Logins & Einstellungen bleiben).
+        Mit throttle (DeleteThrottle) wird gedrosselt und mit niedriger I/O-Priorität gelöscht.
         """
+        if throttle is not None:
+            with background_io_priority():
+                return self._clean_cache(throttle)
+        return self._clean_cache(None)
+
+    def _clean_cache(self, throttle) -> int:
         removed = 0
-        root = self.fivem_root
-        if root is None:
+        candidates = self.clean_candidates()
+        if not candidates:
             return 0
 
-        app_root = root / "FiveM.app"
-        if app_root.exists():
-            data = app_root / "data"
-        else:
-            app_root = root
-            data = root / "data"
-
-        candidates = [
-            app_root / "crashes",
-            app_root / "logs",
-            data / "cache" / "files",
-            data / "cache" / "game",
-            data / "cache" / "servers",
-            data / "cache" / "subprocess",
-            data / "cache" / "unconfirmed",
-        ]
+        # Crashdumps vor dem Löschen indexieren, damit die Statistik erhalten bleibt
+        try:
+            self.index_crash_dumps()
+        except (OSError, ValueError) as e:
+            print("[WARN] Crash-Index vor dem Clean fehlgeschlagen:", e)
 
         for path in candidates:
+            raise_if_cancelled()
             if path.exists():
                 for entry in path.rglob("*"):
                     try:
+                        raise_if_cancelled()
                         if entry.is_file() or entry.is_symlink():
-                            entry.unlink(missing_ok=True)
+                            if throttle is not None:
+                                throttle.wait(entry.lstat().st_size)
+                                started = time.perf_counter()
+                                entry.unlink(missing_ok=True)
+                                throttle.record(time.perf_counter() - started)
+                            else:
+                                entry.unlink(missing_ok=True)
                             removed += 1
+                    except JobCancelled:
+                        raise
                     except Exception:
                         pass
                 for entry in sorted(path.glob("**/*"), reverse=True):
@@ -1071,15 +5042,190 @@ class LRToolbox(tk.Tk):
                             pass
         return removed
 
+    def clean_candidates(self) -> list:
+        """Ordner, die ein Clean leert (leer, wenn FiveM unbekannt ist)."""
+        dirs = self.fivem_app_dirs()
+        if dirs is None:
+            return []
+        app_root, data = dirs
+        return [
+            app_root / "crashes",
+            app_root / "logs",
+            data / "cache" / "files",
+            data / "cache" / "game",
+            data / "cache" / "servers",
+            data / "cache" / "subprocess",
+            data / "cache" / "unconfirmed",
+        ]
+
+    def cache_verify_dirs(self) -> list:
+        """Cache-Ordner mit Ressourcen-Dateien, die 'Cache prüfen' durchgeht."""
+        dirs = self.fivem_app_dirs()
+        if dirs is None:
+            return []
+        data = dirs[1]
+        return [
+            data / "cache" / "files",
+            data / "cache" / "game",
+            data / "cache" / "servers",
+            data / "server-cache",
+            data / "server-cache-priv",
+        ]
+
+    def verify_fivem_cache(self):
+        """Cache prüfen und nur defekte Dateien löschen (Alternative zum Voll-Clean)."""
+        if not self.ensure_fivem_root():
+            return
+        cache_dirs = self.cache_verify_dirs()
+        self.clean_status_var.set("Cache wird geprüft...")
+
+        def work():
+            manifest = load_json(CACHE_MANIFEST_FILE, {})
+            report = verify_cache_dirs(cache_dirs, manifest)
+            roots = {d.name: d for d in cache_dirs}
+            removed = []
+            for rel, reason in report["broken"]:
+                root, _, rest = rel.partition("/")
+                try:
+                    (roots[root] / rest).unlink(missing_ok=True)
+                    removed.append((rel, reason))
+                except OSError as e:
+                    report.setdefault("failed", []).append((rel, str(e)))
+            report["removed"] = removed
+            save_json(CACHE_MANIFEST_FILE, report["manifest"])
+            return report
+
+        def done(report, error):
+            self.clean_status_var.set("")
+            if error:
+                messagebox.showerror(APP_NAME, f"Cache-Prüfung fehlgeschlagen:\n{error}")
+                return
+            lines = [
+                f"{report['checked']} Dateien ({format_bytes(report['bytes'])}) geprüft.",
+                f"Defekt und gelöscht: {len(report['removed'])}",
+            ]
+            lines += [f"  {rel}: {reason}" for rel, reason in report["removed"][:20]]
+            if len(report["removed"]) > 20:
+                lines.append(f"  ... und {len(report['removed']) - 20} weitere")
+            for rel, err in report.get("failed", []):
+                lines.append(f"Nicht löschbar: {rel} ({err})")
+            if not report["removed"]:
+                lines.append("Der Cache ist in Ordnung – ein Voll-Clean ist nicht nötig.")
+            text = "\n".join(lines)
+            log_action(f"Cache-Prüfung:\n{text}")
+            messagebox.showinfo(APP_NAME, text)
+
+        self.jobs.submit("cache_verify", work, done, priority=PRIO_HIGH)
+
+    def cancel_clean_jobs(self):
+        """Laufenden Clean bzw. Cache-Prüfung abbrechen (greift zwischen zwei Dateien)."""
+        cancelled = [key for key in CLEAN_JOB_KEYS if self.jobs.cancel(key)]
+        if cancelled:
+            log_action(f"Abgebrochen: {', '.join(cancelled)}")
+            self.clean_status_var.set("Abgebrochen – bereits gelöschte Dateien bleiben gelöscht.")
+        else:
+            self.clean_status_var.set("Kein Clean und keine Prüfung aktiv.")
+
+    # ---------- Auto-Clean beim Start ----------
+    def auto_clean_thresholds(self) -> dict:
+        return {**DEFAULT_SETTINGS["auto_clean_thresholds"], **(self.user_settings.get("auto_clean_thresholds") or {})}
+
+    def auto_clean_check(self):
+        """Beim Start im Hintergrund messen und nur bei überschrittener Schwelle aufräumen."""
+        if self.fivem_root is None:
+            return
+        candidates = self.clean_candidates()
+        if not candidates:
+            return
+        thresholds = self.auto_clean_thresholds()
+        last_clean_at = load_json(CLEAN_STATE_FILE, {}).get("last_clean_at")
+
+        def work():
+            measure = measure_clean_candidates(candidates)
+            used_pct = get_disk_usage(candidates[0].parent)[3]
+            free_pct = 100.0 - used_pct if used_pct is not None else None
+            decision = decide_auto_clean(measure, thresholds, last_clean_at, free_pct)
+            return measure, free_pct, decision
+
+        def done(result, error):
+            if error:
+                log_action(f"Auto-Clean-Prüfung fehlgeschlagen: {error}")
+                return
+            measure, free_pct, (should_clean, reasons) = result
+            sizes = ", ".join(f"{name} {format_bytes(size)}" for name, size in measure["dirs"].items())
+            free_txt = f"{free_pct:.1f} %" if free_pct is not None else "unbekannt"
+            log_action(
+                f"Auto-Clean: {'ja' if should_clean else 'nein'}"
+                f" ({'; '.join(reasons) or 'keine Schwelle überschritten'})\n"
+                f"Gemessen: {format_bytes(measure['bytes'])} in {measure['files']} Dateien, "
+                f"{measure['crash_dumps']} Crashdumps, frei {free_txt}\n{sizes}"
+            )
+            if should_clean:
+                self.run_clean(full=False, interactive=False)
+
+        self.jobs.submit("auto_clean_check", work, done, priority=PRIO_LOW)
+
+    def fivem_app_dirs(self):
+        """(FiveM.app-Ordner, data-Ordner) oder None, wenn FiveM unbekannt ist."""
+        root = self.fivem_root
+        if root is None:
+            return None
+        app_root = root / "FiveM.app"
+        if app_root.exists():
+            return app_root, app_root / "data"
+        return root, root / "data"
+
+    def server_endpoint(self) -> str:
+        """Endpoint des Hauptservers aus der Serverliste – einzige Quelle dafür."""
+        return next(srv["endpoint"] for srv in self.server_list() if srv["main"])
+
+    def server_cache_clean(self):
+        """Gezielter Clean: nur fremde Server und veraltete Einträge aus data/cache/servers."""
+        if not self.ensure_fivem_root():
+            return
+        dirs = self.fivem_app_dirs()
+        if dirs is None:
+            return
+        _, data = dirs
+        max_age = self.user_settings.get("server_cache_max_age_days", 14)
+        endpoint = self.server_endpoint()
+        self.clean_status_var.set("Server-Cache wird aufgeräumt...")
+
+        def done(result, error):
+            self.clean_status_var.set("")
+            if error:
+                messagebox.showerror(APP_NAME, f"Server-Cache-Clean fehlgeschlagen:\n{error}")
+                return
+            log_action(
+                "Server-Cache gezielt bereinigt: "
+                f"{result['removed']} Einträge entfernt, {format_bytes(result['bytes_reclaimed'])} frei, "
+                f"{result['kept']} LaRue-Einträge behalten ({format_bytes(result['bytes_kept'])})"
+            )
+            messagebox.showinfo(
+                APP_NAME,
+                "Server-Cache bereinigt.\n\n"
+                f"Freigegeben: {format_bytes(result['bytes_reclaimed'])} ({result['removed']} Einträge)\n"
+                f"Behalten (LaRue): {format_bytes(result['bytes_kept'])} ({result['kept']} Einträge)\n\n"
+                "Hilft das nicht, nutze 'Vollständiger Clean'.",
+            )
+
+        self.jobs.submit(
+            "clean_servers",
+            lambda: evict_server_cache(data / "cache" / "servers", endpoint, max_age),
+            done,
+            priority=PRIO_HIGH,
+        )
+
     def start_larue_only(self):
         """
         Startet LaRue über das offizielle FiveM-Protokoll.
         """
-        connect_ip = "45.152.160.250:30120"
+        connect_ip = self.server_endpoint()
         url = f"fivem://connect/{connect_ip}"
 
         try:
             os.startfile(url)
+            self.launch_tracker.start()
             log_action(f"FiveM via URL gestartet: {url}")
         except OSError as e:
             messagebox.showerror(
@@ -1089,64 +5235,92 @@ class LRToolbox(tk.Tk):
                 f"Fehler: {e}"
             )
 
-    def toggle_wqhd(self):
-        enabled = self.var_wqhd.get()
-        self.user_settings["wqhd_minimap_enabled"] = enabled
-        save_json(USER_SETTINGS_FILE, self.user_settings)
-
-        if not self.ensure_fivem_root():
-            return
-
+    def fivem_ui_dir(self):
         ui_dir = self.fivem_root / "FiveM.app" / "citizen" / "common" / "data" / "ui"
         if not ui_dir.exists():
             ui_dir = self.fivem_root / "citizen" / "common" / "data" / "ui"
+        return ui_dir
 
-        target = ui_dir / "frontend.xml"
-        backup = ui_dir / "frontend.larue_backup.xml"
+    def active_ui_profile(self) -> str:
+        profile = self.user_settings.get("ui_profile")
+        if not profile:
+            # Alte Einstellung aus dem WQHD-Toggle übernehmen
+            profile = "wqhd" if self.user_settings.get("wqhd_minimap_enabled") else "original"
+        return profile
 
-        if enabled:
-            if not FRONTEND_ASSET.exists():
-                messagebox.showerror(
-                    APP_NAME,
-                    "assets/frontend.xml wurde nicht gefunden.\n"
-                    f"Erwartet unter:\n{FRONTEND_ASSET}",
-                )
+    def apply_ui_profile(self, event=None):
+        """
+        Gewähltes UI-Profil anwenden (nur geänderte Dateien werden geschrieben).
+        Läuft als Job unter demselben Schlüssel wie der Start-Check, damit sich
+        beide beim Lesen/Schreiben von state.json nicht überholen.
+        """
+        profile = self.var_ui_profile.get()
+        if not self.ensure_fivem_root():
+            self.var_ui_profile.set(self.active_ui_profile())
+            return
+        ui_dir = self.fivem_ui_dir()
+
+        def work():
+            # Manager erst im Job anlegen: liest den Stand nach dem vorherigen Job
+            manager = UiProfileManager(UI_STORE_DIR, ui_dir, UI_PROFILES_DIR, FRONTEND_ASSET)
+            return manager.apply(profile)
+
+        def done(result, error):
+            if error:
+                messagebox.showerror(APP_NAME, f"Fehler beim Anwenden des UI-Profils '{profile}':\n{error}")
+                self.var_ui_profile.set(self.active_ui_profile())
+                self.ui_profile_status_var.set("")
                 return
-            try:
-                ui_dir.mkdir(parents=True, exist_ok=True)
-                if target.exists() and not backup.exists():
-                    shutil.copy2(target, backup)
-                shutil.copy2(FRONTEND_ASSET, target)
-                log_action(f"WQHD-Minimap aktiviert, frontend.xml ersetzt in {ui_dir}")
-                messagebox.showinfo(
-                    APP_NAME,
-                    "WQHD-Minimap aktiviert.\nfrontend.xml wurde ersetzt.",
+            if result["profile"] != profile:
+                return      # inzwischen ein anderes Profil gewählt
+
+            self.user_settings["ui_profile"] = profile
+            self.user_settings["wqhd_minimap_enabled"] = profile == "wqhd"
+            save_json(USER_SETTINGS_FILE, self.user_settings)
+
+            if result["written"]:
+                log_action(f"UI-Profil '{profile}' angewendet in {ui_dir}: {', '.join(result['written'])}")
+                self.ui_profile_status_var.set(
+                    f"Profil '{profile}' aktiv – geschrieben: {', '.join(result['written'])}"
                 )
-            except Exception as e:
-                messagebox.showerror(
-                    APP_NAME, f"Fehler beim Ersetzen von frontend.xml: {e}"
+            else:
+                self.ui_profile_status_var.set(f"Profil '{profile}' aktiv – Dateien waren bereits aktuell.")
+
+        self.ui_profile_status_var.set(f"Profil '{profile}' wird angewendet...")
+        # replace: ein noch wartender Auftrag bekommt das neue Profil, ein laufender läuft danach erneut
+        self.jobs.submit("ui_profile", work, done, priority=PRIO_HIGH, replace=True)
+
+    def check_ui_profile(self):
+        """
+        Start-Check im Hintergrund: hat ein FiveM-Update die UI-Dateien
+        überschrieben, wird das aktive Profil automatisch erneut angewendet.
+        """
+        if not (self.fivem_root and self.fivem_root.exists()):
+            return
+        ui_dir = self.fivem_ui_dir()
+        profile = self.active_ui_profile()
+
+        def work():
+            manager = UiProfileManager(UI_STORE_DIR, ui_dir, UI_PROFILES_DIR, FRONTEND_ASSET)
+            manager.state["active"] = profile
+            return manager.ensure_active()
+
+        def done(result, error):
+            if error:
+                print("[WARN] UI-Profil-Check fehlgeschlagen:", error)
+                return
+            if result["external"] and result["written"]:
+                log_action(
+                    f"FiveM-Update hat {', '.join(result['external'])} überschrieben – "
+                    f"UI-Profil '{result['profile']}' erneut angewendet."
                 )
-        else:
-            try:
-                if backup.exists():
-                    shutil.copy2(backup, target)
-                    log_action(
-                        "WQHD-Minimap deaktiviert, Backup-frontend.xml wiederhergestellt."
-                    )
-                    messagebox.showinfo(
-                        APP_NAME,
-                        "WQHD-Minimap deaktiviert.\nBackup-frontend.xml wurde wiederhergestellt.",
-                    )
-                else:
-                    messagebox.showwarning(
-                        APP_NAME,
-                        "Kein Backup von frontend.xml gefunden.\nEs wurde nichts geändert.",
-                    )
-            except Exception as e:
-                messagebox.showerror(
-                    APP_NAME, f"Fehler beim Wiederherstellen von frontend.xml: {e}"
+                self.ui_profile_status_var.set(
+                    f"Profil '{result['profile']}' nach FiveM-Update erneut angewendet."
                 )
 
+        # Gleicher Schlüssel wie apply_ui_profile: wartet ein Anwenden, übernimmt das den Check
+        self.jobs.submit("ui_profile", work, done, priority=PRIO_NORMAL)
+
     # ---------- Helper / Links / Ordner / Update ----------
     def open_url(self, url: str):
         try:
@@ -1211,44 +5385,67 @@ class LRToolbox(tk.Tk):
             )
 
     def export_support_bundle(self):
+        """Support-Paket als Job bauen; Systeminfo wird vorher im Tk-Thread gelesen."""
         try:
-            LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            bundle_path = LOGS_DIR / f"lr_toolbox_support_{timestamp}.zip"
-
-            with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as zf:
-                log_file = LOGS_DIR / "launcher.log"
-                if log_file.exists():
-                    zf.write(log_file, arcname="launcher.log")
-
-                if USER_SETTINGS_FILE.exists():
-                    zf.write(USER_SETTINGS_FILE, arcname="config/user_settings.json")
-
-                if ANNOUNCEMENTS_FILE.exists():
-                    zf.write(ANNOUNCEMENTS_FILE, arcname="config/announcements.json")
-
-                try:
-                    sys_txt = self.system_text.get("1.0", tk.END).strip()
-                    if sys_txt:
-                        tmp_sys = LOGS_DIR / "systeminfo_from_launcher.txt"
-                        tmp_sys.write_text(sys_txt, encoding="utf-8")
-                        zf.write(tmp_sys, arcname="systeminfo_from_launcher.txt")
-                        tmp_sys.unlink(missing_ok=True)
-                except Exception:
-                    pass
+            sys_txt = self.system_text.get("1.0", tk.END).strip()
+        except Exception:
+            sys_txt = ""
 
+        def done(bundle_path, error):
+            if error:
+                messagebox.showerror(
+                    APP_NAME,
+                    f"Fehler beim Erstellen des Support-Pakets:\n{error}"
+                )
+                return
             log_action(f"Support-Bundle erstellt: {bundle_path}")
             messagebox.showinfo(
                 APP_NAME,
                 f"Support-Paket wurde erstellt:\n{bundle_path}\n\n"
                 "Diese ZIP-Datei kannst du dem Support anhängen."
             )
-        except Exception as e:
-            messagebox.showerror(
-                APP_NAME,
-                f"Fehler beim Erstellen des Support-Pakets:\n{e}"
-            )
+
+        self.jobs.submit(
+            "support_bundle", lambda: self.build_support_bundle(sys_txt), done, priority=PRIO_HIGH
+        )
+
+    def build_support_bundle(self, sys_txt: str) -> Path:
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        bundle_path = LOGS_DIR / f"lr_toolbox_support_{timestamp}.zip"
+
+        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            log_file = LOGS_DIR / "launcher.log"
+            if log_file.exists():
+                zf.write(log_file, arcname="launcher.log")
+
+            if USER_SETTINGS_FILE.exists():
+                zf.write(USER_SETTINGS_FILE, arcname="config/user_settings.json")
+
+            if ANNOUNCEMENTS_FILE.exists():
+                zf.write(ANNOUNCEMENTS_FILE, arcname="config/announcements.json")
+
+            network_report = LOGS_DIR / "network_report.txt"
+            if network_report.exists():
+                zf.write(network_report, arcname="network_report.txt")
+
+            # Nur je ein Beispiel-Dump der zuletzt aufgetretenen Signaturen
+            zf.writestr("crash_summary.txt", self.crash_index.summary())
+            zf.writestr("http_stats.txt", format_http_stats(HTTP.stats()))
+            fivem_log_report = [format_log_session(self.fivem_logs.latest_session()), ""]
+            fivem_log_report += self.fivem_logs.recent_errors()
+            zf.writestr("fivem_log_summary.txt", "\n".join(fivem_log_report))
+            for sample in self.crash_index.representative_samples():
+                zf.write(sample, arcname=f"crash_samples/{sample.name}")
+            # Messungen aus --profile bzw. dem Info-Tab-Schalter
+            for profile_file in self.profiler.files():
+                zf.write(profile_file, arcname=f"profiles/{profile_file.name}")
+
+            if sys_txt:
+                zf.writestr("systeminfo_from_launcher.txt", sys_txt)
+
+        return bundle_path
 
     def parse_version(self, v: str):
         try:
@@ -1263,8 +5460,8 @@ class LRToolbox(tk.Tk):
             return None, "REMOTE_VERSION_URL ist noch nicht konfiguriert."
 
         try:
-            with urllib.request.urlopen(REMOTE_VERSION_URL, timeout=5) as resp:
-                data = json.loads(resp.read().decode("utf-8", errors="ignore"))
+            body = HTTP.get(REMOTE_VERSION_URL, endpoint="update", max_bytes=256 * 1024)
+            data = json.loads(body.decode("utf-8", errors="ignore"))
             return data, None
         except Exception as e:
             return None, str(e)
@@ -1272,7 +5469,14 @@ class LRToolbox(tk.Tk):
     def check_for_updates(self):
         """Manueller Update-Check (über den Button im Info-Tab)."""
         self.update_status_var.set("Prüfe auf Updates...")
-        data, error = self.fetch_remote_version_info()
+        self.jobs.submit(
+            "update_check",
+            self.fetch_remote_version_info,
+            lambda result, error: self._show_update_result(*(result or (None, str(error)))),
+            priority=PRIO_HIGH,
+        )
+
+    def _show_update_result(self, data, error):
         if error:
             self.update_status_var.set(f"Update-Check fehlgeschlagen: {error}")
             return
@@ -1325,7 +5529,14 @@ class LRToolbox(tk.Tk):
         - eine neue Version verfügbar ist UND
         - diese Version noch nicht als 'notified' gespeichert ist.
         """
-        data, error = self.fetch_remote_version_info()
+        self.jobs.submit(
+            "auto_update_check",
+            self.fetch_remote_version_info,
+            lambda result, error: self._auto_update_result(*(result or (None, str(error)))),
+            priority=PRIO_NORMAL,
+        )
+
+    def _auto_update_result(self, data, error):
         if error or not data:
             # Kein Popup beim Auto-Check, nur leise im Status
             self.update_status_var.set(f"Auto-Update-Check fehlgeschlagen: {error}")
@@ -1393,9 +5604,25 @@ class LRToolbox(tk.Tk):
     # ---------- Settings speichern ----------
     def _save_settings(self):
         self.user_settings["auto_start_after_clean"] = self.var_auto_start_after_clean.get()
+        self.user_settings["auto_clean_on_start"] = self.var_auto_clean_on_start.get()
+        self.user_settings["clean_throttled"] = self.var_clean_throttled.get()
         save_json(USER_SETTINGS_FILE, self.user_settings)
 
 
 if __name__ == "__main__":
-    app = LRToolbox()
+    pool_jobs.use_as_spawn_main()
+    if "--write-asset-manifest" in sys.argv:
+        # Für Releases: Manifest neu erzeugen, nachdem Assets geändert wurden
+        save_json(ASSET_MANIFEST_FILE, build_asset_manifest(ASSETS_DIR))
+        print(f"[INFO] {ASSET_MANIFEST_FILE} geschrieben.")
+        sys.exit(0)
+
+    profiler = ActionProfiler(LOGS_DIR, enabled="--profile" in sys.argv)
+    if profiler.enabled:
+        app = profiler.run("startup", LRToolbox, instance=INSTANCE_LOCK, profiler=profiler)
+    else:
+        app = LRToolbox(instance=INSTANCE_LOCK, profiler=profiler)
+    start_command = instance_lock.command_from_args(sys.argv[1:])
+    if start_command != "focus":
+        app.after_idle(app.run_instance_command, start_command)
     app.mainloop()
@@ -0,0 +1,229 @@
+"""
+Arbeitsfunktionen für den Prozess-Pool der LR Toolbox (Cache-Prüfung,
+Wallpaper-Varianten, Wallpaper-Import).
+
+Bewusst ohne Tk und pygame: unter spawn (Windows) importiert jeder
+Worker-Prozess nur dieses Modul. use_as_spawn_main() sorgt dafür, dass die
+Worker auch das Hauptmodul (launcher.py) nicht erneut laden.
+"""
+import hashlib
+import importlib.util
+import mmap
+import multiprocessing
+import os
+import re
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+
+# ---------- Prozess-Pool ----------
+def use_as_spawn_main():
+    """
+    spawn startet jeden Worker, indem es das Hauptmodul neu ausführt – bei
+    'python launcher.py' also samt Tk, pygame und UI-Code. Ist __main__ ohne
+    __spec__ gestartet, zeigt es danach auf dieses Modul: die Worker führen
+    nur pool_jobs aus. Jobs dürfen daher nicht im Hauptmodul definiert sein.
+    """
+    main = sys.modules.get("__main__")
+    if main is not None and getattr(main, "__spec__", None) is None:
+        main.__spec__ = importlib.util.find_spec(__name__)
+
+
+def process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Pool immer mit spawn: kein fork eines Prozesses mit Tk und Worker-Threads."""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+# ---------- Hashing ----------
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    SHA-256 einer Datei. Die Datei wird per mmap eingeblendet und in Blöcken
+    gehasht – kein Kopieren in Python-Puffer, konstanter Speicherbedarf.
+    """
+    return file_digest(path, "sha256", chunk_size)
+
+
+def file_digest(path: Path, algorithm: str, chunk_size: int = 1024 * 1024) -> str:
+    """Wie file_sha256, aber mit frei wählbarem hashlib-Algorithmus."""
+    h = hashlib.new(algorithm)
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return h.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for offset in range(0, size, chunk_size):
+                    h.update(view[offset:offset + chunk_size])
+            finally:
+                view.release()
+    return h.hexdigest()
+
+
+# ---------- FiveM-Cache ----------
+# Ressourcen-Dateien im Cache heißen nach ihrem Hash (SHA-1, bei neueren Builds SHA-256)
+HASH_NAME_ALGORITHMS = {40: "sha1", 64: "sha256"}
+HEX_NAME = re.compile(r"^[0-9a-fA-F]+$")
+RPF7_HEADER = struct.Struct("<4sIII")   # Magic, Einträge, Namenslänge, Verschlüsselung
+
+
+def expected_hash_from_name(path: Path):
+    """(Algorithmus, Hash), wenn der Dateiname selbst ein Hash ist, sonst None."""
+    stem = path.name.split(".", 1)[0]
+    algorithm = HASH_NAME_ALGORITHMS.get(len(stem))
+    if algorithm and HEX_NAME.match(stem):
+        return algorithm, stem.lower()
+    return None
+
+
+def rpf_truncated(path: Path, size: int) -> bool:
+    """RPF7-Archiv kürzer als sein eigener Header + Eintragstabelle?"""
+    with path.open("rb") as f:
+        head = f.read(RPF7_HEADER.size)
+    if len(head) < RPF7_HEADER.size or head[:4] != b"RPF7":
+        return False
+    _magic, entries, names_len, _enc = RPF7_HEADER.unpack(head)
+    return size < RPF7_HEADER.size + entries * 16 + names_len
+
+
+def verify_cache_file_job(args):
+    """Prüft eine Datei (läuft im Prozess-Pool). Ergebnis: (rel, size, mtime, sha256, Fehler)."""
+    path_str, rel, known = args
+    path = Path(path_str)
+    try:
+        st = path.stat()
+        if st.st_size == 0:
+            return rel, 0, st.st_mtime_ns, None, "leer (0 Byte)"
+        if path.suffix.lower() == ".rpf" and rpf_truncated(path, st.st_size):
+            return rel, st.st_size, st.st_mtime_ns, None, "abgeschnitten (RPF-Header)"
+        by_name = expected_hash_from_name(path)
+        if by_name:
+            algorithm, expected = by_name
+            digest = file_digest(path, algorithm)
+            error = None if digest == expected else f"{algorithm.upper()} passt nicht zum Dateinamen"
+            return rel, st.st_size, st.st_mtime_ns, None, error
+        digest = file_sha256(path)
+        error = None
+        # Unverändert laut Größe/mtime, aber anderer Inhalt → defekt
+        if known and known["mtime"] == st.st_mtime_ns:
+            if st.st_size < known["size"]:
+                error = "abgeschnitten"
+            elif known["size"] == st.st_size and known["sha256"] != digest:
+                error = "Hash weicht vom gespeicherten Manifest ab"
+        return rel, st.st_size, st.st_mtime_ns, digest, error
+    except (OSError, ValueError) as e:
+        return rel, None, None, None, f"nicht lesbar: {e}"
+
+
+# ---------- Wallpaper-Varianten ----------
+def render_wallpaper_variant(src: Path, dst: Path, size) -> Path:
+    """
+    Skaliert src auf genau size (Fill: Seitenverhältnis halten, mittig
+    zuschneiden). JPEGs werden per draft() bereits beim Dekodieren verkleinert,
+    andere Formate vorab mit reduce() grob heruntergerechnet.
+    Läuft ohne Tk/Windows-API und damit auch in Worker-Prozessen.
+    """
+    width, height = size
+    with Image.open(src) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (width, height))
+        img = ImageOps.exif_transpose(img)
+        factor = min(img.width // width, img.height // height)
+        if factor >= 2:
+            img = img.reduce(factor)
+        img = ImageOps.fit(img.convert("RGB"), (width, height), Image.LANCZOS)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(dst.name + ".lrtmp")
+        img.save(tmp, "JPEG", quality=92, subsampling=0, optimize=True)
+    os.replace(tmp, dst)
+    return dst
+
+
+def render_variant_job(args):
+    src, dst, size = args
+    try:
+        render_wallpaper_variant(Path(src), Path(dst), size)
+        return src, dst, None
+    except Exception as e:
+        return src, dst, str(e)
+
+
+# ---------- Wallpaper-Import ----------
+EXIF_ORIENTATION = 0x0112    # 5–8: um 90° gedreht, Breite/Höhe vertauscht
+
+
+def dhash(img, hash_size: int = 8) -> int:
+    """Differenz-Hash (64 Bit): hell/dunkel-Verlauf benachbarter Pixel eines 9×8-Graubilds."""
+    small = img.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+    px = small.tobytes()
+    bits = 0
+    for row in range(hash_size):
+        base = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (px[base + col] < px[base + col + 1])
+    return bits
+
+
+def image_dhash(path: Path) -> int:
+    """dHash einer Bilddatei; JPEGs werden per draft() stark verkleinert dekodiert."""
+    with Image.open(path) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", (64, 64))
+        return dhash(ImageOps.exif_transpose(img))
+
+
+def process_wallpaper_import(src: Path, dst: Path, max_size, quality: int, keep_optimal: bool = False) -> dict:
+    """
+    Bild drehen (EXIF), auf max_size verkleinern und als optimiertes,
+    progressives JPEG nach dst schreiben (ohne EXIF, Farbprofil bleibt,
+    solange der Farbraum nicht umgewandelt wird).
+    keep_optimal: ist src schon ein progressives JPEG innerhalb von max_size,
+    wird nichts geschrieben ("skipped") – erneutes Kodieren kostet nur Qualität.
+    Läuft ohne Tk und damit auch in Worker-Prozessen.
+    """
+    with Image.open(src) as img:
+        original = img.size
+        if keep_optimal and img.format == "JPEG" and img.info.get("progressive"):
+            width, height = original
+            if img.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8):
+                width, height = height, width
+            if width <= max_size[0] and height <= max_size[1]:
+                img.draft("RGB", (64, 64))
+                return {"hash": dhash(ImageOps.exif_transpose(img)), "size": original,
+                        "original": original, "bytes": None, "skipped": True}
+        icc = img.info.get("icc_profile")
+        if img.format == "JPEG":
+            # Drehung kommt erst danach → in beiden Richtungen genug Pixel behalten
+            img.draft("RGB", (max(max_size), max(max_size)))
+        img = ImageOps.exif_transpose(img)
+        if img.mode != "RGB":
+            # Profil beschreibt den alten Farbraum (z. B. CMYK) und passt nicht mehr
+            img = img.convert("RGB")
+            icc = None
+        img.thumbnail(max_size, Image.LANCZOS)
+        extra = {"icc_profile": icc} if icc else {}
+        img.save(dst, "JPEG", quality=quality, optimize=True, progressive=True, **extra)
+        return {"hash": dhash(img), "size": img.size, "original": original, "bytes": dst.stat().st_size}
+
+
+def import_wallpaper_job(args):
+    src, dst, max_size, quality, keep_optimal = args
+    try:
+        return process_wallpaper_import(Path(src), Path(dst), max_size, quality, keep_optimal), None
+    except Exception as e:
+        try:
+            Path(dst).unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None, str(e)
+
+
+def hash_wallpaper_job(path):
+    try:
+        return image_dhash(Path(path))
+    except Exception:
+        return None